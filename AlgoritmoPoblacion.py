@@ -0,0 +1,195 @@
+# Algoritmo genético con población.
+# A diferencia de AlgoritmoGenetico (1+1), mantiene una matriz (N, L) de genes
+# y aplica selección, cruce y mutación a toda la población con operaciones de
+# NumPy, usando un único generador aleatorio con semilla.
+
+from datetime import datetime
+from typing import Optional
+import numpy as np
+from Hormiga import HormigaGenetica
+from Poblacion import ResultadoPoblacion
+from Registro import HistorialGeneraciones, RegistroGeneracion
+from Sumideros import SumideroEstadisticas, crear_sumidero
+
+SELECCIONES = ('torneo', 'rango')
+CRUCES = ('un_punto', 'uniforme')
+
+
+class AlgoritmoPoblacion:
+    """
+    Algoritmo genético generacional sobre una población de hormigas.
+
+    En cada generación la población se evalúa en bloque (por ejemplo con
+    SimuladorPoblacion) y `evolucionar` arma la siguiente: conserva a las
+    `elite` mejores, elige padres por torneo o por rango, los cruza y muta a
+    los hijos.
+
+    Atributos:
+    ----------
+    genes : np.ndarray
+        Matriz (N, L) con los genes de la población actual.
+    mejor_hormiga : HormigaGenetica
+        Mejor hormiga encontrada hasta el momento (genes y aptitud).
+    generacion : int
+        Contador de generaciones.
+    registros : HistorialGeneraciones
+        Historial con el mejor individuo de cada generación.
+
+    Métodos:
+    --------
+    inicializar():
+        Crea una población al azar y prepara el sumidero de estadísticas.
+    evolucionar(resultado: ResultadoPoblacion):
+        Registra la generación evaluada y reemplaza la población por la siguiente.
+    seleccionar(aptitud: np.ndarray, cantidad: int) -> np.ndarray:
+        Índices de los padres elegidos.
+    cruzar(padres_a: np.ndarray, padres_b: np.ndarray) -> np.ndarray:
+        Genes de los hijos de cada pareja.
+    mutar(genes: np.ndarray) -> np.ndarray:
+        Copia de `genes` con mutaciones.
+    """
+
+    def __init__(self, tamaño_poblacion: int = 100, largo_genes: int = 200,
+                 seleccion: str = 'torneo', cruce: str = 'un_punto',
+                 tasa_mutacion: float = 0.02, tasa_cruce: float = 0.9,
+                 tamaño_torneo: int = 3, elite: int = 1, semilla: Optional[int] = None,
+                 archivo_stats: str = 'estadisticas_hormiga.npy',
+                 sumidero: Optional[SumideroEstadisticas] = None):
+        """
+        Parámetros:
+        -----------
+        tamaño_poblacion : int
+            Hormigas por generación (N).
+        largo_genes : int
+            Genes de cada hormiga (L).
+        seleccion : str
+            'torneo' o 'rango'.
+        cruce : str
+            'un_punto' o 'uniforme'.
+        tasa_mutacion : float
+            Probabilidad de que cada gen de un hijo se reemplace por uno al azar.
+        tasa_cruce : float
+            Probabilidad de que una pareja se cruce; si no, el hijo copia al primer padre.
+        tamaño_torneo : int
+            Participantes de cada torneo.
+        elite : int
+            Mejores hormigas que pasan sin cambios a la generación siguiente.
+        semilla : Optional[int]
+            Semilla del generador, para ejecuciones reproducibles.
+        archivo_stats : str
+            Ruta del archivo donde se guardan las estadísticas.
+        sumidero : SumideroEstadisticas
+            Destino de las estadísticas; por defecto se elige según la extensión
+            de `archivo_stats`.
+        """
+        if seleccion not in SELECCIONES:
+            raise ValueError(f"Selección desconocida '{seleccion}': usa {', '.join(SELECCIONES)}")
+        if cruce not in CRUCES:
+            raise ValueError(f"Cruce desconocido '{cruce}': usa {', '.join(CRUCES)}")
+        if not 0 <= elite < tamaño_poblacion:
+            raise ValueError("La élite debe ser menor que la población")
+
+        self.tamaño_poblacion = tamaño_poblacion
+        self.largo_genes = largo_genes
+        self.seleccion = seleccion
+        self.cruce = cruce
+        self.tasa_mutacion = tasa_mutacion
+        self.tasa_cruce = tasa_cruce
+        self.tamaño_torneo = tamaño_torneo
+        self.elite = elite
+        self.semilla = semilla
+        self.rng = np.random.default_rng(semilla)
+        self.genes = None
+        self.mejor_hormiga = None
+        self.generacion = 0
+        self.registros = HistorialGeneraciones()
+        self.tiempo_inicio = datetime.now()
+        self.archivo_stats = archivo_stats
+        self.sumidero = sumidero or crear_sumidero(archivo_stats)
+
+    def inicializar(self):
+        self.rng = np.random.default_rng(self.semilla)
+        self.genes = self.rng.integers(0, 4, size=(self.tamaño_poblacion, self.largo_genes),
+                                       dtype=np.uint8)
+        self.mejor_hormiga = None
+        self.generacion = 0
+        self.tiempo_inicio = datetime.now()
+        self.registros = HistorialGeneraciones()
+        self.sumidero.iniciar()
+
+    def evolucionar(self, resultado: ResultadoPoblacion):
+        """
+        Registra el mejor individuo de la población evaluada, actualiza la mejor
+        hormiga y reemplaza `genes` por la generación siguiente.
+
+        Parámetros:
+        -----------
+        resultado : ResultadoPoblacion
+            Evaluación de cada fila de `genes`, en el mismo orden.
+        """
+        aptitud = np.asarray(resultado.aptitud)
+        mejor = int(np.argmax(aptitud))
+        registro = RegistroGeneracion(
+            self.generacion,
+            int(resultado.pasos[mejor]),
+            int(resultado.puntos[mejor]),
+            int(resultado.alcohol[mejor]),
+            bool(resultado.llego_meta[mejor]),
+            (datetime.now() - self.tiempo_inicio).total_seconds()
+        )
+        self.registros.append(registro)
+
+        if self.mejor_hormiga is None or aptitud[mejor] > self.mejor_hormiga.aptitud:
+            self.mejor_hormiga = HormigaGenetica(0, 0)
+            self.mejor_hormiga.genes = self.genes[mejor].copy()
+            resultado.aplicar(mejor, self.mejor_hormiga)
+
+        # La élite pasa intacta; el resto son hijos de padres seleccionados
+        n_hijos = self.tamaño_poblacion - self.elite
+        elite = np.argsort(aptitud)[::-1][:self.elite]
+        padres = self.seleccionar(aptitud, 2 * n_hijos)
+        hijos = self.mutar(self.cruzar(self.genes[padres[:n_hijos]], self.genes[padres[n_hijos:]]))
+        self.genes = np.concatenate([self.genes[elite], hijos])
+
+        self.generacion += 1
+        self.sumidero.escribir(registro)
+
+    def seleccionar(self, aptitud: np.ndarray, cantidad: int) -> np.ndarray:
+        """
+        Elige `cantidad` padres (con repetición) y retorna sus índices.
+        """
+        n = len(aptitud)
+        if self.seleccion == 'torneo':
+            # Cada fila es un torneo; gana el participante de mayor aptitud
+            participantes = self.rng.integers(0, n, size=(cantidad, self.tamaño_torneo))
+            ganadores = np.argmax(aptitud[participantes], axis=1)
+            return participantes[np.arange(cantidad), ganadores]
+
+        # Selección por rango: la probabilidad es proporcional a la posición, no a la aptitud
+        rango = np.empty(n)
+        rango[np.argsort(aptitud, kind='stable')] = np.arange(1, n + 1)
+        return self.rng.choice(n, size=cantidad, p=rango / rango.sum())
+
+    def cruzar(self, padres_a: np.ndarray, padres_b: np.ndarray) -> np.ndarray:
+        """
+        Cruza cada fila de `padres_a` con la misma fila de `padres_b`.
+        """
+        n, largo = padres_a.shape
+        if self.cruce == 'un_punto':
+            # Antes del punto de corte los genes vienen de `a`, después de `b`
+            corte = self.rng.integers(1, largo, size=n)
+            de_a = np.arange(largo) < corte[:, None]
+        else:
+            de_a = self.rng.random((n, largo)) < 0.5
+        de_a[self.rng.random(n) >= self.tasa_cruce] = True  # Parejas que no se cruzan
+        return np.where(de_a, padres_a, padres_b)
+
+    def mutar(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Reemplaza cada gen por uno al azar con probabilidad `tasa_mutacion`,
+        como AlgoritmoGenetico.mutar pero sobre toda la matriz a la vez.
+        """
+        nuevos_genes = genes.copy()
+        mascara = self.rng.random(genes.shape) < self.tasa_mutacion
+        nuevos_genes[mascara] = self.rng.integers(0, 4, size=int(mascara.sum()), dtype=genes.dtype)
+        return nuevos_genes
@@ -0,0 +1,114 @@
+# Medición del tiempo de arranque de la interfaz gráfica.
+# Cada medición se hace en un intérprete nuevo, así que incluye el arranque de
+# Python y la importación de todos los módulos, como cuando el usuario abre la
+# simulación.
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+from Sprites import DIRECTORIO_CACHE
+
+# Código que ejecuta cada proceso medido; imprime sus tiempos internos en JSON
+_CODIGO_MEDICION = r"""
+import json, sys, time
+inicio = time.perf_counter()
+import Simulacion
+resultado = {'importar': time.perf_counter() - inicio, 'interfaz': None}
+try:
+    import tkinter as tk
+    inicio_interfaz = time.perf_counter()
+    root = tk.Tk()
+    app = Simulacion.SimulacionHormiga(root)
+    root.update()  # Hasta que la ventana se dibuja por primera vez
+    resultado['interfaz'] = time.perf_counter() - inicio_interfaz
+    root.destroy()
+except tk.TclError:
+    pass  # Sin pantalla disponible: solo se mide la importación
+resultado['matplotlib_cargado'] = 'matplotlib' in sys.modules
+print(json.dumps(resultado))
+"""
+
+
+def medir_arranque(repeticiones: int = 5, sin_cache: bool = False) -> Dict:
+    """
+    Lanza la simulación `repeticiones` veces en procesos nuevos y mide cuánto
+    tarda cada etapa.
+
+    Parámetros:
+    -----------
+    repeticiones : int
+        Cantidad de procesos medidos.
+    sin_cache : bool
+        Si es True, borra el atlas de sprites antes de cada proceso para medir
+        el peor caso (primer arranque).
+
+    Retorna:
+    --------
+    Dict
+        Mínimo y mediana en segundos de 'proceso' (todo el proceso), 'importar'
+        e 'interfaz' (None si no hay pantalla), y si matplotlib quedó cargado.
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    muestras: Dict[str, List[float]] = {'proceso': [], 'importar': [], 'interfaz': []}
+    matplotlib_cargado = False
+    for _ in range(repeticiones):
+        if sin_cache:
+            shutil.rmtree(os.path.join(directorio, DIRECTORIO_CACHE), ignore_errors=True)
+        inicio = time.perf_counter()
+        salida = subprocess.run([sys.executable, '-c', _CODIGO_MEDICION], cwd=directorio,
+                                capture_output=True, text=True, check=True).stdout
+        muestras['proceso'].append(time.perf_counter() - inicio)
+        resultado = json.loads(salida.strip().splitlines()[-1])
+        muestras['importar'].append(resultado['importar'])
+        if resultado['interfaz'] is not None:
+            muestras['interfaz'].append(resultado['interfaz'])
+        matplotlib_cargado |= resultado['matplotlib_cargado']
+
+    resumen = {'repeticiones': repeticiones, 'sin_cache': sin_cache,
+               'matplotlib_cargado': matplotlib_cargado}
+    for etapa, valores in muestras.items():
+        resumen[etapa] = ({'minimo': min(valores), 'mediana': statistics.median(valores)}
+                          if valores else None)
+    return resumen
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Punto de entrada de línea de comandos. Termina con código 1 si la mediana
+    del arranque supera `--limite`, para detectar regresiones.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mide el tiempo de arranque en frío de la simulación.")
+    parser.add_argument('--repeticiones', type=int, default=5, help="Procesos medidos")
+    parser.add_argument('--sin-cache', action='store_true',
+                        help="Borra el atlas de sprites antes de cada medición")
+    parser.add_argument('--json', default=None, help="Guarda el resultado en este archivo")
+    parser.add_argument('--limite', type=float, default=None,
+                        help="Segundos máximos aceptados para la mediana del proceso")
+    args = parser.parse_args(argv)
+
+    resumen = medir_arranque(args.repeticiones, args.sin_cache)
+    for etapa in ('proceso', 'importar', 'interfaz'):
+        if resumen[etapa] is None:
+            print(f"{etapa}: sin pantalla, no medido")
+        else:
+            print(f"{etapa}: mediana {resumen[etapa]['mediana']:.3f} s | "
+                  f"mínimo {resumen[etapa]['minimo']:.3f} s")
+    print(f"matplotlib cargado al iniciar: {'sí' if resumen['matplotlib_cargado'] else 'no'}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resumen, f, indent=2)
+    if args.limite is not None and resumen['proceso']['mediana'] > args.limite:
+        print(f"Regresión: el arranque supera el límite de {args.limite:.3f} s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
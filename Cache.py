@@ -0,0 +1,108 @@
+# Caché de resultados de evaluación por prefijo de genes ejecutado.
+# El recorrido de una hormiga solo depende de los genes que llegó a leer y del
+# laberinto, así que dos genomas con el mismo prefijo ejecutado en la misma
+# versión del laberinto terminan exactamente en el mismo estado.
+
+from collections import Counter, OrderedDict
+from typing import Tuple
+import numpy as np
+from Hormiga import HormigaGenetica
+
+# Multiplicadores de los dos hashes polinómicos (módulo 2**64) de cada prefijo
+_BASES = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+
+
+def hashes_prefijos(genes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula a la vez el hash de todos los prefijos de `genes`.
+
+    Retorna dos arreglos de largo L + 1 cuyo elemento i es el hash de genes[:i].
+    """
+    largo = len(genes)
+    valores = genes.astype(np.uint64) + np.uint64(1)
+    resultado = []
+    with np.errstate(over='ignore'):
+        for base in _BASES:
+            potencias = np.cumprod(np.full(largo, base, dtype=np.uint64))
+            prefijos = np.zeros(largo + 1, dtype=np.uint64)
+            np.cumsum(valores * potencias, out=prefijos[1:])
+            resultado.append(prefijos)
+    return resultado[0], resultado[1]
+
+
+class CacheAptitud:
+    """
+    Caché LRU de resultados de hormigas, con clave en el prefijo de genes
+    ejecutado y la versión del laberinto.
+
+    Atributos:
+    ----------
+    capacidad : int
+        Máximo de resultados guardados; al superarlo se descarta el menos usado.
+    aciertos, fallos : int
+        Búsquedas resueltas por la caché y búsquedas que requirieron simular.
+
+    Métodos:
+    --------
+    buscar(hormiga: HormigaGenetica, version: int) -> bool:
+        Si el resultado está en caché, lo copia en la hormiga.
+    guardar(hormiga: HormigaGenetica, version: int):
+        Guarda el resultado de una hormiga ya simulada.
+    """
+
+    def __init__(self, capacidad: int = 100000):
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._largos = Counter()  # Largos de prefijo presentes en la caché
+        self._ultima = None  # (genes, hashes) de la última búsqueda, para no recalcularlos
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def buscar(self, hormiga: HormigaGenetica, version: int) -> bool:
+        """
+        Busca el resultado de la hormiga. Si lo encuentra, restaura su estado
+        final (sin calcular la aptitud) y retorna True.
+        """
+        h1, h2 = hashes_prefijos(hormiga.genes)
+        self._ultima = (hormiga.genes, h1, h2)
+        for largo in self._largos:
+            if largo > len(hormiga.genes):
+                continue
+            clave = (version, largo, int(h1[largo]), int(h2[largo]))
+            final = self._entradas.get(clave)
+            if final is not None:
+                self._entradas.move_to_end(clave)
+                hormiga.x, hormiga.y, hormiga.pasos, hormiga.puntos, hormiga.alcohol, \
+                    hormiga.viva, hormiga.llego_meta = final
+                hormiga.gen_actual = hormiga.pasos % len(hormiga.genes)
+                self.aciertos += 1
+                return True
+        self.fallos += 1
+        return False
+
+    def guardar(self, hormiga: HormigaGenetica, version: int):
+        """
+        Guarda el estado final de una hormiga que ya terminó su simulación.
+        """
+        if self._ultima is not None and self._ultima[0] is hormiga.genes:
+            _, h1, h2 = self._ultima
+        else:
+            h1, h2 = hashes_prefijos(hormiga.genes)
+        self._ultima = None
+        largo = hormiga.genes_leidos()
+        clave = (version, largo, int(h1[largo]), int(h2[largo]))
+        if clave in self._entradas:
+            self._entradas.move_to_end(clave)
+            return
+
+        self._entradas[clave] = (hormiga.x, hormiga.y, hormiga.pasos, hormiga.puntos,
+                                 hormiga.alcohol, hormiga.viva, hormiga.llego_meta)
+        self._largos[largo] += 1
+        if len(self._entradas) > self.capacidad:
+            (_, largo_viejo, _, _), _ = self._entradas.popitem(last=False)
+            self._largos[largo_viejo] -= 1
+            if self._largos[largo_viejo] == 0:
+                del self._largos[largo_viejo]
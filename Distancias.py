@@ -0,0 +1,129 @@
+# Campo de distancias a la meta para la aptitud.
+# La distancia Manhattan ignora las paredes y el veneno, así que premia a
+# hormigas que quedan pegadas a una pared del otro lado de la meta. Este campo
+# guarda, para cada celda, los pasos del camino más corto hasta la meta,
+# calculados con una búsqueda en anchura desde la meta, y se actualiza solo
+# cuando cambia la versión del laberinto.
+
+from typing import Optional
+import numpy as np
+from Laberinto import ROCA, VENENO, META, Laberinto
+
+INALCANZABLE = np.iinfo(np.int32).max  # Valor interno de las celdas sin camino a la meta
+
+
+def _categoria(codigos: np.ndarray) -> np.ndarray:
+    """
+    0 para las paredes (nunca se pisan), 1 para el veneno (se pisa, pero el
+    camino no sigue) y 2 para el resto de las celdas.
+    """
+    return np.where(codigos == ROCA, 0, np.where(codigos == VENENO, 1, 2))
+
+
+class CampoDistancias:
+    """
+    Distancia en pasos desde cada celda hasta la meta más cercana.
+
+    Los caminos no atraviesan paredes ni veneno (una celda con veneno tiene
+    distancia, pero no se puede seguir a través de ella). Las celdas sin
+    camino a la meta valen la mayor distancia alcanzable más uno.
+
+    Cuando el laberinto cambia, se comparan sus celdas con las de la versión
+    anterior: si ninguna celda se volvió menos transitable y la meta no se
+    movió, las distancias solo pueden bajar y se propagan desde las celdas
+    modificadas; si no, el campo se recalcula completo.
+
+    Atributos:
+    ----------
+    reconstrucciones, actualizaciones : int
+        Veces que el campo se recalculó completo y de forma incremental.
+
+    Métodos:
+    --------
+    matriz() -> np.ndarray:
+        Matriz (filas, columnas) de distancias de la versión actual del laberinto.
+    distancia(x: int, y: int) -> int:
+        Distancia de la celda (x, y) a la meta.
+    """
+
+    def __init__(self, laberinto: Laberinto):
+        self.laberinto = laberinto
+        self.version: Optional[int] = None
+        self.reconstrucciones = 0
+        self.actualizaciones = 0
+        self._tipos: Optional[np.ndarray] = None  # Celdas de la versión calculada
+        self._distancias: Optional[np.ndarray] = None  # Vector plano con INALCANZABLE
+        self._matriz: Optional[np.ndarray] = None
+
+    def matriz(self) -> np.ndarray:
+        if self.version != self.laberinto.version or self._tipos is None:
+            self._actualizar()
+        return self._matriz
+
+    def distancia(self, x: int, y: int) -> int:
+        return self.matriz().item(x, y)
+
+    def _actualizar(self):
+        tipos = self.laberinto.tipos
+        if self._tipos is None or self._tipos.shape != tipos.shape:
+            self._reconstruir()
+        else:
+            cambiadas = np.flatnonzero(tipos != self._tipos)
+            antes, ahora = self._tipos[cambiadas], tipos[cambiadas]
+            if ((antes == META).any() or (ahora == META).any() or
+                    (_categoria(ahora) < _categoria(antes)).any()):
+                self._reconstruir()
+            elif len(cambiadas):
+                self._propagar_mejoras(cambiadas)
+
+        self._tipos = tipos.copy()
+        self.version = self.laberinto.version
+        distancias = self._distancias
+        alcanzables = distancias != INALCANZABLE
+        maximo = int(distancias[alcanzables].max()) if alcanzables.any() else -1
+        self._matriz = np.where(alcanzables, distancias, maximo + 1).reshape(self.laberinto.celdas.shape)
+
+    def _reconstruir(self):
+        """
+        Búsqueda en anchura desde todas las metas.
+        """
+        self.reconstrucciones += 1
+        self._distancias = np.full(len(self.laberinto.tipos), INALCANZABLE, dtype=np.int32)
+        metas = np.flatnonzero(self.laberinto.tipos == META)
+        self._distancias[metas] = 0
+        self._relajar(metas)
+
+    def _propagar_mejoras(self, cambiadas: np.ndarray):
+        """
+        Las celdas que se volvieron transitables toman la distancia de su
+        mejor vecina más uno, y desde ellas se propagan las mejoras.
+        """
+        self.actualizaciones += 1
+        distancias = self._distancias
+        tipos = self.laberinto.tipos
+        cambiadas = cambiadas[tipos[cambiadas] != ROCA]
+        vecinas = self.laberinto.siguiente[cambiadas]
+        desde_vecinas = distancias[vecinas].astype(np.int64)
+        desde_vecinas[tipos[vecinas] == VENENO] = INALCANZABLE  # El camino no sigue a través del veneno
+        candidatas = np.minimum(desde_vecinas.min(axis=1) + 1, INALCANZABLE)
+        distancias[cambiadas] = np.minimum(distancias[cambiadas], candidatas)
+        self._relajar(cambiadas[(distancias[cambiadas] != INALCANZABLE) & (tipos[cambiadas] != VENENO)])
+
+    def _relajar(self, frontera: np.ndarray):
+        """
+        Expande la frontera nivel por nivel con operaciones vectorizadas: cada
+        vecina que mejora su distancia pasa a la frontera siguiente. Con una
+        sola distancia inicial es exactamente una búsqueda en anchura.
+        """
+        distancias = self._distancias
+        siguiente = self.laberinto.siguiente
+        tipos = self.laberinto.tipos
+        while len(frontera):
+            # Un movimiento bloqueado lleva a la misma celda, que nunca mejora
+            vecinas = siguiente[frontera].ravel()
+            candidatas = np.repeat(distancias[frontera] + 1, siguiente.shape[1])
+            mejora = candidatas < distancias[vecinas]
+            vecinas, candidatas = vecinas[mejora], candidatas[mejora]
+            np.minimum.at(distancias, vecinas, candidatas)
+            frontera = np.unique(vecinas)
+            frontera = frontera[tipos[frontera] != VENENO]
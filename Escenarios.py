@@ -0,0 +1,268 @@
+# Laberintos guardados en disco y generados por procedimiento.
+# Un escenario es un laberinto con sus metadatos (generador, semilla,
+# densidad...), para repetir exactamente las mismas cargas de trabajo entre
+# ejecuciones. Hay dos formatos: texto (una fila por línea, editable a mano) y
+# binario compacto (.lab: dos celdas por byte comprimidas con zlib).
+
+import argparse
+import json
+import os
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from Laberinto import AZUCAR, CODIGOS, META, ROCA, SIMBOLOS, VACIO, VENENO, VINO, Laberinto
+
+EXTENSION_BINARIA = '.lab'
+MAGICO = b'LABH'
+FORMATO = 1  # Versión del formato binario
+CABECERA = struct.Struct('<4sBIII')  # mágico, formato, filas, columnas, largo de los metadatos
+GENERADORES = ('aleatorio', 'pasillos')
+
+
+def guardar_escenario(ruta: str, laberinto: Laberinto, **metadatos):
+    """
+    Guarda el laberinto en `ruta`, en formato binario si la extensión es
+    '.lab' y en texto si no.
+
+    Parámetros:
+    -----------
+    ruta : str
+        Archivo de destino; se reemplaza si existe.
+    laberinto : Laberinto
+        Laberinto a guardar.
+    **metadatos :
+        Valores simples (números o textos) que describen el escenario, por
+        ejemplo la semilla y la densidad con que se generó.
+    """
+    if ruta.lower().endswith(EXTENSION_BINARIA):
+        datos = _codificar_binario(laberinto, metadatos)
+        modo, codificacion = 'wb', None
+    else:
+        lineas = [f"# {clave}: {json.dumps(valor)}" for clave, valor in metadatos.items()]
+        lineas += [''.join(fila) for fila in laberinto.a_lista()]
+        datos = '\n'.join(lineas) + '\n'
+        modo, codificacion = 'w', 'utf-8'
+
+    # Escritura atómica: un lote que lee el archivo nunca lo ve a medio escribir
+    temporal = ruta + '.tmp'
+    with open(temporal, modo, encoding=codificacion) as f:
+        f.write(datos)
+    os.replace(temporal, ruta)
+
+
+def leer_escenario(ruta: str) -> Tuple[Laberinto, Dict]:
+    """
+    Lee un escenario guardado con `guardar_escenario` o escrito a mano.
+
+    En el formato de texto cada línea es una fila del laberinto y cada
+    carácter una celda ('A', 'V', 'X', 'R', 'M' o '.'). Las líneas vacías se
+    ignoran y las que empiezan con '#' son comentarios; los comentarios de la
+    forma '# clave: valor' se leen como metadatos.
+
+    Retorna:
+    --------
+    Tuple[Laberinto, Dict]:
+        El laberinto y sus metadatos.
+    """
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+    if datos.startswith(MAGICO):
+        return _decodificar_binario(datos, ruta)
+
+    metadatos = {}
+    laberinto = []
+    for linea in datos.decode('utf-8').splitlines():
+        linea = linea.strip()
+        if linea.startswith('#'):
+            clave, separador, valor = linea[1:].partition(':')
+            if separador:
+                try:
+                    metadatos[clave.strip()] = json.loads(valor)
+                except ValueError:
+                    pass  # Un comentario cualquiera, no un metadato
+        elif linea:
+            laberinto.append(list(linea))
+
+    if not laberinto or any(len(fila) != len(laberinto[0]) for fila in laberinto):
+        raise ValueError(f"El laberinto de '{ruta}' debe ser rectangular y no vacío")
+    desconocidos = {tipo for fila in laberinto for tipo in fila} - set(CODIGOS)
+    if desconocidos:
+        raise ValueError(f"El laberinto de '{ruta}' tiene celdas desconocidas: {''.join(sorted(desconocidos))}")
+    return Laberinto.desde_lista(laberinto), metadatos
+
+
+def _codificar_binario(laberinto: Laberinto, metadatos: Dict) -> bytes:
+    """
+    Cabecera fija, metadatos en JSON y las celdas empaquetadas de a dos por
+    byte (los códigos caben en 4 bits) y comprimidas.
+    """
+    codigos = laberinto.tipos
+    if len(codigos) % 2:
+        codigos = np.append(codigos, np.uint8(VACIO))
+    empaquetadas = (codigos[0::2] << 4) | codigos[1::2]
+    texto = json.dumps(metadatos).encode('utf-8')
+    cabecera = CABECERA.pack(MAGICO, FORMATO, laberinto.filas, laberinto.columnas, len(texto))
+    return cabecera + texto + zlib.compress(empaquetadas.tobytes(), 9)
+
+
+def _decodificar_binario(datos: bytes, ruta: str) -> Tuple[Laberinto, Dict]:
+    _, formato, filas, columnas, largo = CABECERA.unpack_from(datos)
+    if formato != FORMATO:
+        raise ValueError(f"El escenario '{ruta}' tiene un formato desconocido ({formato})")
+    inicio = CABECERA.size
+    metadatos = json.loads(datos[inicio:inicio + largo].decode('utf-8'))
+    empaquetadas = np.frombuffer(zlib.decompress(datos[inicio + largo:]), dtype=np.uint8)
+
+    codigos = np.empty(2 * len(empaquetadas), dtype=np.uint8)
+    codigos[0::2] = empaquetadas >> 4
+    codigos[1::2] = empaquetadas & 0x0F
+    if len(codigos) < filas * columnas or (codigos[:filas * columnas] >= len(SIMBOLOS)).any():
+        raise ValueError(f"El escenario '{ruta}' está dañado")
+    laberinto = Laberinto(filas, columnas)
+    laberinto.tipos[:] = codigos[:filas * columnas]
+    laberinto.compilar()
+    return laberinto, metadatos
+
+
+def generar_laberinto(filas: int, columnas: Optional[int] = None, densidad: float = 0.2,
+                      semilla: Optional[int] = None, generador: str = 'aleatorio',
+                      proporciones: Tuple[float, float, float] = (0.05, 0.03, 0.02)) -> Laberinto:
+    """
+    Genera un laberinto reproducible: la misma semilla y los mismos
+    parámetros dan siempre el mismo laberinto.
+
+    Parámetros:
+    -----------
+    filas, columnas : int
+        Dimensiones (cuadrado si no se indica columnas).
+    densidad : float
+        Fracción de rocas.
+    semilla : Optional[int]
+        Semilla del generador aleatorio.
+    generador : str
+        'aleatorio': rocas, consumibles y veneno sueltos al azar
+        (Laberinto.aleatorio), con la meta en la esquina opuesta.
+        'pasillos': un laberinto perfecto de pasillos de una celda excavado
+        con búsqueda en profundidad, al que se le quitan paredes al azar hasta
+        bajar a `densidad` (si es menor que la del laberinto perfecto, cerca
+        de 0.5), lo que abre ciclos. La meta queda en la celda más lejana a
+        la salida y los consumibles se reparten por las celdas libres.
+    proporciones : Tuple[float, float, float]
+        Fracciones de azúcar, vino y veneno.
+
+    Retorna:
+    --------
+    Laberinto:
+        El laberinto generado, con la salida (0, 0) libre.
+    """
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador desconocido '{generador}': usa {', '.join(GENERADORES)}")
+    if generador == 'aleatorio':
+        return Laberinto.aleatorio(filas, columnas, densidad, semilla, proporciones)
+
+    columnas = filas if columnas is None else columnas
+    rng = np.random.default_rng(semilla)
+    celdas = np.full((filas, columnas), ROCA, dtype=np.uint8)
+
+    # Los nodos del laberinto perfecto son las celdas de coordenadas pares;
+    # abrir el paso entre dos nodos libera también la celda que los separa
+    nodos_x, nodos_y = (filas + 1) // 2, (columnas + 1) // 2
+    visitado = np.zeros((nodos_x, nodos_y), dtype=bool)
+    visitado[0, 0] = True
+    celdas[0, 0] = VACIO
+    pila = [(0, 0)]
+    while pila:
+        x, y = pila[-1]
+        vecinos = [(x + dx, y + dy) for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                   if 0 <= x + dx < nodos_x and 0 <= y + dy < nodos_y and not visitado[x + dx, y + dy]]
+        if not vecinos:
+            pila.pop()
+            continue
+        nx, ny = vecinos[rng.integers(len(vecinos))]
+        visitado[nx, ny] = True
+        celdas[x + nx, y + ny] = VACIO  # Celda entre (2x, 2y) y (2nx, 2ny)
+        celdas[2 * nx, 2 * ny] = VACIO
+        pila.append((nx, ny))
+
+    # Quita paredes al azar hasta llegar a la densidad pedida
+    rocas = np.flatnonzero(celdas == ROCA)
+    sobrantes = len(rocas) - int(round(densidad * filas * columnas))
+    if sobrantes > 0:
+        celdas.reshape(-1)[rng.choice(rocas, size=sobrantes, replace=False)] = VACIO
+
+    laberinto = Laberinto(filas, columnas)
+    laberinto.celdas[:] = celdas
+    laberinto.compilar()
+
+    # La meta es la celda con el camino más largo desde la salida, buscada en
+    # anchura nivel por nivel sobre la tabla de transiciones
+    pasos = np.full(filas * columnas, -1)
+    pasos[0] = 0
+    frontera = np.array([0])
+    nivel = 0
+    while len(frontera):
+        nivel += 1
+        vecinas = np.unique(laberinto.siguiente[frontera])
+        frontera = vecinas[pasos[vecinas] < 0]
+        pasos[frontera] = nivel
+    meta = int(np.argmax(pasos)) or filas * columnas - 1  # Con una sola celda libre, la esquina opuesta
+
+    # Consumibles y veneno sobre las celdas libres, salvo la salida y la meta
+    libres = np.flatnonzero(celdas == VACIO)
+    libres = libres[(libres != 0) & (libres != meta)]
+    limites = np.cumsum(proporciones)
+    codigos = np.array([AZUCAR, VINO, VENENO, VACIO], dtype=np.uint8)
+    celdas.reshape(-1)[libres] = codigos[np.searchsorted(limites, rng.random(len(libres)), side='right')]
+    celdas.reshape(-1)[meta] = META
+
+    laberinto.celdas[:] = celdas
+    laberinto.compilar()
+    return laberinto
+
+
+def generar_suite(directorio: str, cantidad: int, filas: int, columnas: Optional[int] = None,
+                  densidad: float = 0.2, semilla: int = 0, generador: str = 'aleatorio',
+                  extension: str = EXTENSION_BINARIA) -> List[str]:
+    """
+    Genera `cantidad` escenarios con semillas consecutivas desde `semilla` y
+    los guarda en `directorio`. Retorna las rutas de los archivos.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    columnas = filas if columnas is None else columnas
+    rutas = []
+    for i in range(cantidad):
+        semilla_i = semilla + i
+        laberinto = generar_laberinto(filas, columnas, densidad, semilla_i, generador)
+        ruta = os.path.join(directorio, f"{generador}_{filas}x{columnas}_d{densidad:g}_s{semilla_i}{extension}")
+        guardar_escenario(ruta, laberinto, generador=generador, filas=filas, columnas=columnas,
+                          densidad=densidad, semilla=semilla_i)
+        rutas.append(ruta)
+    return rutas
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Punto de entrada de línea de comandos para generar escenarios.
+    """
+    parser = argparse.ArgumentParser(
+        description="Genera laberintos reproducibles y los guarda como escenarios.")
+    parser.add_argument('directorio', help="Carpeta donde se guardan los escenarios")
+    parser.add_argument('--cantidad', type=int, default=10, help="Escenarios a generar")
+    parser.add_argument('--filas', type=int, default=30, help="Filas de cada laberinto")
+    parser.add_argument('--columnas', type=int, default=None, help="Columnas (por defecto, igual a --filas)")
+    parser.add_argument('--densidad', type=float, default=0.2, help="Fracción de rocas")
+    parser.add_argument('--semilla', type=int, default=0, help="Semilla del primer escenario")
+    parser.add_argument('--generador', choices=GENERADORES, default='aleatorio',
+                        help="Rocas sueltas al azar o pasillos de un laberinto perfecto")
+    parser.add_argument('--texto', action='store_true',
+                        help="Guarda en formato de texto (.txt) en lugar de binario (.lab)")
+    args = parser.parse_args(argv)
+
+    rutas = generar_suite(args.directorio, args.cantidad, args.filas, args.columnas, args.densidad,
+                          args.semilla, args.generador, '.txt' if args.texto else EXTENSION_BINARIA)
+    print("\n".join(rutas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Detección de hormigas atascadas en un ciclo.
+# Como `gen_actual` vuelve a 0 cada len(genes) pasos, una hormiga que empieza
+# dos vueltas de sus genes en la misma celda y con las mismas celdas
+# consumidas repite exactamente el mismo recorrido: esas vueltas se pueden
+# saltar sin cambiar el resultado.
+
+from typing import Dict, FrozenSet, Tuple
+from Hormiga import HormigaGenetica
+from Laberinto import VistaLaberinto
+
+
+class DetectorEstancamiento:
+    """
+    Termina antes la evaluación de hormigas cuyo recorrido se volvió periódico.
+
+    Al comienzo de cada vuelta de los genes se guarda el estado (celda,
+    celdas consumidas). Junto con el gen que toca (0), ese estado determina
+    todo el resto del recorrido: si se repite, dentro del ciclo la hormiga no
+    consume nada, no muere ni llega a la meta, así que se saltan todos los
+    ciclos completos que caben antes de `pasos_maximos` y solo se simula el
+    resto. La aptitud es exactamente la de la simulación completa.
+
+    Solo ocurre cuando `pasos_maximos` es mayor que el largo de los genes:
+    dentro de la primera vuelta ningún gen se repite, así que ningún estado
+    completo puede repetirse. Con los valores por defecto (200 pasos, 200
+    genes) nunca se activa.
+
+    Atributos:
+    ----------
+    pasos_evitados : int
+        Pasos que no se simularon gracias al detector.
+
+    Métodos:
+    --------
+    aplica(hormiga: HormigaGenetica) -> bool:
+        Indica si vale la pena revisar a esta hormiga.
+    reiniciar(hormiga: HormigaGenetica, columnas: int):
+        Prepara el detector para una nueva evaluación desde la posición inicial.
+    revisar(hormiga: HormigaGenetica, vista: VistaLaberinto) -> bool:
+        Revisa el estado después de un paso; retorna True si la evaluación terminó.
+    """
+
+    def __init__(self):
+        self.pasos_evitados = 0
+        self._columnas = 1
+        self._vueltas: Dict[Tuple[int, FrozenSet[int]], int] = {}
+
+    def aplica(self, hormiga: HormigaGenetica) -> bool:
+        # Solo puede haber ciclos si los genes dan más de una vuelta
+        return hormiga.pasos_maximos > len(hormiga.genes)
+
+    def reiniciar(self, hormiga: HormigaGenetica, columnas: int):
+        """
+        Prepara el detector para evaluar a `hormiga` desde su posición
+        inicial. Si después la hormiga se reanuda desde un punto de su primera
+        vuelta (EvaluadorIncremental), la detección sigue siendo exacta.
+        """
+        self._columnas = columnas
+        inicial = hormiga.x_inicial * columnas + hormiga.y_inicial
+        self._vueltas = {(inicial, frozenset()): 0}
+
+    def revisar(self, hormiga: HormigaGenetica, vista: VistaLaberinto) -> bool:
+        """
+        Llamar después de cada paso contado de `hormiga`. Si retorna True, la
+        hormiga ya quedó en su estado final (con `pasos_maximos` pasos).
+        """
+        if hormiga.gen_actual == 0:
+            celda = hormiga.x * self._columnas + hormiga.y
+            estado = (celda, frozenset(vista.consumidos))
+            inicio = self._vueltas.get(estado)
+            if inicio is None:
+                self._vueltas[estado] = hormiga.pasos
+            else:
+                periodo = hormiga.pasos - inicio
+                saltados = (hormiga.pasos_maximos - hormiga.pasos) // periodo * periodo
+                hormiga.pasos += saltados
+                self.pasos_evitados += saltados
+
+        return hormiga.pasos >= hormiga.pasos_maximos
@@ -0,0 +1,117 @@
+# Genomas empaquetados a 2 bits por gen.
+# Cada gen vale de 0 a 3, así que cuatro genes caben en un byte: el gen i
+# ocupa los bits 2 * (i % 4) y 2 * (i % 4) + 1 del byte i // 4. Sirve para
+# guardar y transmitir genomas (respaldos, migraciones, archivos de hormigas)
+# ocupando la cuarta parte que en uint8. La simulación, el cruce y la mutación
+# siguen trabajando sobre los genes desempaquetados: la simulación accede a un
+# gen por paso, y mutar con máscaras XOR sobre bytes empaquetados resultó más
+# lento que los operadores actuales, porque obliga a empaquetar y desempaquetar.
+
+import numpy as np
+
+GENES_POR_BYTE = 4
+
+_DESPLAZAMIENTOS = np.array([0, 2, 4, 6], dtype=np.uint8)  # Bit inicial de cada gen del byte
+# Fila b: los cuatro genes guardados en el byte b, en orden
+_TABLA = (np.arange(256, dtype=np.uint8)[:, None] >> _DESPLAZAMIENTOS) & 3
+
+
+def bytes_necesarios(largo: int) -> int:
+    return -(-largo // GENES_POR_BYTE)
+
+
+def empaquetar(genes: np.ndarray) -> np.ndarray:
+    """
+    Empaqueta los genes del último eje de `genes` (un genoma o una matriz de
+    genomas). Si el largo no es múltiplo de 4, el último byte se completa
+    con ceros.
+
+    Retorna:
+    --------
+    np.ndarray:
+        Arreglo uint8 con la misma forma salvo el último eje, de largo
+        ceil(L / 4).
+    """
+    genes = np.asarray(genes, dtype=np.uint8)
+    largo = genes.shape[-1]
+    relleno = bytes_necesarios(largo) * GENES_POR_BYTE - largo
+    if relleno:
+        genes = np.concatenate([genes, np.zeros(genes.shape[:-1] + (relleno,), dtype=np.uint8)], axis=-1)
+    grupos = genes.reshape(genes.shape[:-1] + (-1, GENES_POR_BYTE))
+    return np.bitwise_or.reduce(grupos << _DESPLAZAMIENTOS, axis=-1).astype(np.uint8)
+
+
+def desempaquetar(datos: np.ndarray, largo: int) -> np.ndarray:
+    """
+    Inversa de `empaquetar`: una consulta a la tabla de 256 filas por byte.
+
+    Retorna:
+    --------
+    np.ndarray:
+        Genes uint8 con `largo` elementos en el último eje.
+    """
+    datos = np.asarray(datos, dtype=np.uint8)
+    return _TABLA[datos].reshape(datos.shape[:-1] + (-1,))[..., :largo]
+
+
+class GenomaEmpaquetado:
+    """
+    Genoma inmutable de 2 bits por gen, comparable y usable como clave de
+    diccionario o conjunto.
+
+    Atributos:
+    ----------
+    datos : np.ndarray
+        Bytes empaquetados (uint8, de solo lectura).
+    largo : int
+        Cantidad de genes.
+
+    Métodos:
+    --------
+    desde_genes(genes: np.ndarray) -> GenomaEmpaquetado:
+        Empaqueta un arreglo de genes.
+    genes() -> np.ndarray:
+        Genes desempaquetados (uint8), listos para simular.
+    """
+
+    __slots__ = ('datos', 'largo', '_hash')
+
+    def __init__(self, datos: np.ndarray, largo: int):
+        if len(datos) != bytes_necesarios(largo):
+            raise ValueError(f"Un genoma de {largo} genes ocupa {bytes_necesarios(largo)} bytes, no {len(datos)}")
+        self.datos = np.array(datos, dtype=np.uint8)
+        # Los genes sobrantes del último byte valen 0, para que la igualdad y el hash sean exactos
+        if largo % GENES_POR_BYTE:
+            self.datos[-1] &= (1 << 2 * (largo % GENES_POR_BYTE)) - 1
+        self.datos.flags.writeable = False
+        self.largo = largo
+        self._hash = None
+
+    @classmethod
+    def desde_genes(cls, genes: np.ndarray) -> 'GenomaEmpaquetado':
+        return cls(empaquetar(genes), len(genes))
+
+    def genes(self) -> np.ndarray:
+        return desempaquetar(self.datos, self.largo)
+
+    def __getitem__(self, indice: int) -> int:
+        if not -self.largo <= indice < self.largo:
+            raise IndexError("Índice de gen fuera del genoma")
+        indice %= self.largo
+        return (self.datos.item(indice // GENES_POR_BYTE) >> 2 * (indice % GENES_POR_BYTE)) & 3
+
+    def __len__(self) -> int:
+        return self.largo
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, GenomaEmpaquetado):
+            return NotImplemented
+        return self.largo == otro.largo and self.datos.tobytes() == otro.datos.tobytes()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.largo, self.datos.tobytes()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"GenomaEmpaquetado({self.largo} genes, {self.datos.tobytes().hex()[:16]}...)"
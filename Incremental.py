@@ -0,0 +1,137 @@
+# Evaluación incremental de hormigas mutadas.
+# Un hijo sigue exactamente el mismo camino que su padre hasta el primer gen
+# mutado que llega a ejecutar, así que se reanuda desde el último punto de
+# control del padre anterior a esa diferencia en lugar de empezar desde cero.
+
+from typing import List, Optional, Tuple
+import numpy as np
+from Estancamiento import DetectorEstancamiento
+from Hormiga import HormigaGenetica
+from Laberinto import Laberinto
+
+# Punto de control: (pasos, celda, puntos, alcohol, celdas consumidas)
+PuntoControl = Tuple[int, int, int, int, Tuple[int, ...]]
+
+
+class EvaluadorIncremental:
+    """
+    Evalúa hormigas reutilizando la trayectoria de un padre de referencia.
+
+    Durante cada evaluación se guarda un punto de control cada `intervalo`
+    pasos. Cuando se adopta una hormiga como padre, sus puntos de control
+    sirven para reanudar a los hijos que solo difieren en genes posteriores.
+
+    Atributos:
+    ----------
+    pasos_simulados : int
+        Pasos realmente simulados.
+    pasos_ahorrados : int
+        Pasos que se evitaron reanudando desde un punto de control o saltando
+        ciclos repetidos (DetectorEstancamiento).
+
+    Métodos:
+    --------
+    evaluar(hormiga: HormigaGenetica) -> float:
+        Simula a la hormiga (o la reanuda) y calcula su aptitud.
+    adoptar():
+        Toma la última hormiga evaluada como padre de referencia.
+    """
+
+    def __init__(self, laberinto: Laberinto, pos_meta: Tuple[int, int], intervalo: int = 10,
+                 distancias: Optional[np.ndarray] = None):
+        """
+        Parámetros:
+        -----------
+        laberinto : Laberinto
+            Laberinto en el que se evalúan las hormigas.
+        pos_meta : Tuple[int, int]
+            Posición de la meta.
+        intervalo : int
+            Pasos entre puntos de control consecutivos.
+        distancias : Optional[np.ndarray]
+            Matriz de pasos hasta la meta para la aptitud (CampoDistancias).
+        """
+        self.vista = laberinto.vista()
+        self.columnas = laberinto.columnas
+        self.pos_meta = pos_meta
+        self.distancias = distancias
+        self.intervalo = intervalo
+        self.pasos_simulados = 0
+        self.pasos_ahorrados = 0
+        self.detector = DetectorEstancamiento()
+
+        # Padre de referencia y última hormiga evaluada: (genes, puntos de control,
+        # genes leídos, estado final)
+        self._padre = None
+        self._ultima = None
+
+    def evaluar(self, hormiga: HormigaGenetica) -> float:
+        """
+        Simula a la hormiga hasta que muere, llega a la meta o agota sus pasos,
+        reanudando desde el padre cuando es posible, y calcula su aptitud.
+        """
+        genes = hormiga.genes
+        puntos_control: List[PuntoControl] = []
+        hormiga.reiniciar()
+        self.vista.reiniciar()
+        detector = self.detector if self.detector.aplica(hormiga) else None
+        if detector is not None:
+            detector.reiniciar(hormiga, self.columnas)
+
+        if self._padre is not None and len(self._padre[0]) == len(genes):
+            genes_padre, puntos_padre, leidos_padre, final_padre = self._padre
+            diferencias = np.flatnonzero(genes != genes_padre)
+            primera = int(diferencias[0]) if len(diferencias) else len(genes)
+
+            if primera >= leidos_padre:
+                # El hijo nunca ejecuta un gen distinto: su resultado es el del padre
+                self._restaurar_final(hormiga, final_padre)
+                self.pasos_ahorrados += hormiga.pasos
+                self._ultima = (genes, puntos_padre, leidos_padre, final_padre)
+                return hormiga.calcular_aptitud(self.pos_meta, self.distancias)
+
+            # El gen `primera` se ejecuta por primera vez en el paso `primera`
+            puntos_control = puntos_padre[:primera // self.intervalo + 1]
+            self._restaurar_punto(hormiga, puntos_control[-1])
+            self.pasos_ahorrados += hormiga.pasos
+
+        inicio = hormiga.pasos
+        evitados = self.detector.pasos_evitados
+        while hormiga.viva and hormiga.pasos < hormiga.pasos_maximos:
+            if hormiga.pasos % self.intervalo == 0 and hormiga.pasos // self.intervalo == len(puntos_control):
+                puntos_control.append((hormiga.pasos, hormiga.x * self.columnas + hormiga.y,
+                                       hormiga.puntos, hormiga.alcohol,
+                                       tuple(self.vista.consumidos)))
+            if not hormiga.mover(self.vista) or hormiga.llego_meta:
+                break
+            if detector is not None and detector.revisar(hormiga, self.vista):
+                break
+        evitados = self.detector.pasos_evitados - evitados
+        self.pasos_simulados += hormiga.pasos - inicio - evitados
+        self.pasos_ahorrados += evitados
+
+        final = (hormiga.x, hormiga.y, hormiga.pasos, hormiga.puntos, hormiga.alcohol,
+                 hormiga.viva, hormiga.llego_meta)
+        self._ultima = (genes.copy(), puntos_control, hormiga.genes_leidos(), final)
+        return hormiga.calcular_aptitud(self.pos_meta, self.distancias)
+
+    def adoptar(self):
+        """
+        Toma la última hormiga evaluada como padre de referencia de los próximos hijos.
+        """
+        self._padre = self._ultima
+
+    def _restaurar_punto(self, hormiga: HormigaGenetica, punto: PuntoControl):
+        pasos, celda, puntos, alcohol, consumidos = punto
+        hormiga.x, hormiga.y = divmod(celda, self.columnas)
+        hormiga.pasos = pasos
+        hormiga.gen_actual = pasos % len(hormiga.genes)
+        hormiga.puntos = puntos
+        hormiga.alcohol = alcohol
+        self.vista.consumidos.update(consumidos)
+
+    @staticmethod
+    def _restaurar_final(hormiga: HormigaGenetica, final: Tuple):
+        hormiga.x, hormiga.y, hormiga.pasos, hormiga.puntos, hormiga.alcohol, \
+            hormiga.viva, hormiga.llego_meta = final
+        hormiga.gen_actual = hormiga.pasos % len(hormiga.genes)
@@ -0,0 +1,115 @@
+# Instrumentación opcional de las fases de la simulación.
+# Cuando se activa, envuelve los métodos medidos con un cronómetro y un
+# contador; cuando está desactivada los métodos originales quedan intactos,
+# así que no agrega ningún costo.
+
+import functools
+import json
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from AlgoritmoGenetico import AlgoritmoGenetico
+from AlgoritmoPoblacion import AlgoritmoPoblacion
+from Cache import CacheAptitud
+from Hormiga import HormigaGenetica
+from Incremental import EvaluadorIncremental
+from Paralelo import EvaluadorParalelo
+from Poblacion import SimuladorPoblacion
+
+# Métodos medidos por defecto: (clase, nombre del método) o (clase, nombre,
+# fase) cuando la fase no se llama como el método. Las dos clases de
+# algoritmo genético comparten la fase `evolucionar` (una generación).
+OBJETIVOS = [
+    (HormigaGenetica, 'mover'),
+    (HormigaGenetica, 'calcular_aptitud'),
+    (AlgoritmoGenetico, 'evolucionar'),
+    (AlgoritmoGenetico, 'guardar_estadisticas'),
+    (AlgoritmoPoblacion, 'evolucionar'),
+    (SimuladorPoblacion, 'simular', 'simular_poblacion'),
+    (EvaluadorIncremental, 'evaluar', 'evaluar_incremental'),
+    (EvaluadorParalelo, 'evaluar_todo', 'evaluar_paralelo'),
+    (CacheAptitud, 'buscar', 'buscar_cache'),
+    (CacheAptitud, 'guardar', 'guardar_cache'),
+]
+
+
+class Instrumentacion:
+    """
+    Cronómetros y contadores por fase.
+
+    Los tiempos son inclusivos: `evolucionar` incluye el tiempo de
+    `guardar_estadisticas`, que llama internamente, y `evaluar_paralelo`
+    incluye el de `simular_poblacion` cuando el lote se simula en este
+    proceso. Lo que corre en otros procesos (trabajadores, islas) no se
+    cuenta; `evaluar_paralelo` mide lo que el proceso principal espera.
+
+    Métodos:
+    --------
+    activar(objetivos: List[Tuple]):
+        Envuelve los métodos indicados y pone los contadores en cero.
+    desactivar():
+        Restaura los métodos originales.
+    resumen() -> Dict[str, Dict[str, float]]:
+        Llamadas, segundos, llamadas por segundo y milisegundos por llamada de cada fase.
+    exportar(ruta: str):
+        Guarda el resumen en un archivo JSON.
+    """
+
+    def __init__(self):
+        self.originales: Dict[Tuple[type, str], Callable] = {}
+        self.fases: List[str] = []
+        self.llamadas: Dict[str, int] = {}
+        self.segundos: Dict[str, float] = {}
+        self.inicio: Optional[float] = None
+
+    @property
+    def activa(self) -> bool:
+        return bool(self.originales)
+
+    def activar(self, objetivos: Optional[List[Tuple]] = None):
+        self.desactivar()
+        for clase, nombre, *fase in objetivos or OBJETIVOS:
+            fase = fase[0] if fase else nombre
+            original = getattr(clase, nombre)
+            self.originales[(clase, nombre)] = original
+            if fase not in self.fases:
+                self.fases.append(fase)
+            setattr(clase, nombre, self._envolver(fase, original))
+        self.reiniciar()
+
+    def desactivar(self):
+        for (clase, nombre), original in self.originales.items():
+            setattr(clase, nombre, original)
+        self.originales = {}
+        self.fases = []
+
+    def reiniciar(self):
+        self.llamadas = {fase: 0 for fase in self.fases}
+        self.segundos = {fase: 0.0 for fase in self.fases}
+        self.inicio = time.perf_counter()
+
+    def _envolver(self, nombre: str, original: Callable) -> Callable:
+        reloj = time.perf_counter
+
+        @functools.wraps(original)
+        def medido(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.segundos[nombre] += reloj() - inicio
+                self.llamadas[nombre] += 1
+
+        return medido
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        transcurrido = max(time.perf_counter() - self.inicio, 1e-9) if self.inicio else 1e-9
+        return {nombre: {'llamadas': llamadas,
+                         'segundos': self.segundos[nombre],
+                         'por_segundo': llamadas / transcurrido,
+                         'ms_por_llamada': 1000 * self.segundos[nombre] / llamadas if llamadas else 0.0}
+                for nombre, llamadas in self.llamadas.items()}
+
+    def exportar(self, ruta: str):
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump({'segundos_medidos': time.perf_counter() - self.inicio if self.inicio else 0.0,
+                       'fases': self.resumen()}, f, indent=2)
@@ -0,0 +1,220 @@
+# Modelo de islas: varias poblaciones evolucionan en procesos separados sobre
+# el mismo laberinto y cada cierta cantidad de generaciones intercambian sus
+# mejores genomas en anillo (la isla i envía a la i + 1) por tuberías.
+
+import multiprocessing as mp
+import os
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+import numpy as np
+from AlgoritmoPoblacion import AlgoritmoPoblacion
+from Genoma import GenomaEmpaquetado, desempaquetar, empaquetar
+from Laberinto import Laberinto
+from Poblacion import SimuladorPoblacion
+from Registro import HistorialGeneraciones, RegistroGeneracion
+from Sumideros import SumideroEstadisticas, crear_sumidero
+
+# Fila del informe de una isla por generación:
+# (generacion, pasos, puntos, alcohol, llego_meta, tiempo_total, aptitud) del mejor individuo
+FilaIsla = Tuple[int, int, int, int, bool, float, float]
+
+
+def _ejecutar_isla(conexion, salida, entrada, laberinto: Laberinto, pos_meta: Tuple[int, int],
+                   parametros: dict, semilla: Optional[int], migrantes: int,
+                   distancias: Optional[np.ndarray]):
+    """
+    Proceso de una isla. Espera del coordinador la cantidad de generaciones a
+    ejecutar (0 para terminar); después de cada tanda envía sus mejores genomas
+    a la isla siguiente, recibe los de la anterior y le informa al coordinador.
+    """
+    ag = AlgoritmoPoblacion(semilla=semilla, archivo_stats=os.devnull, **parametros)
+    ag.inicializar()
+    simulador = SimuladorPoblacion(laberinto, distancias=distancias)
+
+    while True:
+        cantidad = conexion.recv()
+        if cantidad == 0:
+            break
+
+        filas: List[FilaIsla] = []
+        for _ in range(cantidad):
+            resultado = simulador.simular(ag.genes, pos_meta)
+            mejor = int(np.argmax(resultado.aptitud))
+            filas.append((ag.generacion, int(resultado.pasos[mejor]), int(resultado.puntos[mejor]),
+                          int(resultado.alcohol[mejor]), bool(resultado.llego_meta[mejor]),
+                          (datetime.now() - ag.tiempo_inicio).total_seconds(),
+                          float(resultado.aptitud[mejor])))
+            evaluados = ag.genes
+            ag.evolucionar(resultado)
+
+        # Los inmigrantes reemplazan a los últimos hijos; la élite queda intacta.
+        # Los genomas viajan empaquetados, a la cuarta parte de bytes
+        if migrantes > 0 and salida is not None:
+            salida.send(empaquetar(evaluados[np.argsort(resultado.aptitud)[::-1][:migrantes]]))
+            ag.genes[-migrantes:] = desempaquetar(entrada.recv(), ag.largo_genes)
+
+        conexion.send((filas, GenomaEmpaquetado.desde_genes(ag.mejor_hormiga.genes), ag.mejor_hormiga.aptitud,
+                       cantidad * ag.tamaño_poblacion))
+    conexion.close()
+
+
+class ModeloIslas:
+    """
+    Coordina K islas (procesos) con AlgoritmoPoblacion y junta sus resultados.
+
+    Las islas avanzan en tandas de `migracion_cada` generaciones. Al final de
+    cada tanda migran `migrantes` genomas y el coordinador agrega al historial
+    global, por cada generación, el registro de la mejor isla.
+
+    Atributos:
+    ----------
+    registros : HistorialGeneraciones
+        Historial global: el mejor individuo de todas las islas en cada generación.
+    registros_islas : List[HistorialGeneraciones]
+        Historial propio de cada isla.
+    mejor_genes, mejor_aptitud :
+        Mejor hormiga encontrada por cualquier isla.
+    generacion, evaluaciones : int
+        Generaciones completadas (las mismas en todas las islas) y hormigas evaluadas.
+    generacion_meta : Optional[int]
+        Primera generación en la que alguna isla llegó a la meta.
+
+    Métodos:
+    --------
+    ejecutar(generaciones, evaluaciones, segundos, detener_en_meta):
+        Evoluciona hasta agotar el presupuesto indicado.
+    """
+
+    def __init__(self, laberinto: Laberinto, islas: int = 4, migracion_cada: int = 10,
+                 migrantes: int = 2, semilla: Optional[int] = None,
+                 archivo_stats: str = 'estadisticas_hormiga.npy',
+                 sumidero: Optional[SumideroEstadisticas] = None,
+                 distancias: Optional[np.ndarray] = None, **parametros):
+        """
+        Parámetros:
+        -----------
+        laberinto : Laberinto
+            Laberinto sobre el que evolucionan todas las islas. Debe contener una meta.
+        islas : int
+            Cantidad de islas (procesos).
+        migracion_cada : int
+            Generaciones entre migraciones.
+        migrantes : int
+            Genomas que cada isla envía a la siguiente en cada migración.
+        semilla : Optional[int]
+            Semilla de la que se derivan semillas independientes para cada isla.
+        archivo_stats : str
+            Archivo donde se guarda el historial global.
+        distancias : Optional[np.ndarray]
+            Matriz de pasos hasta la meta para la aptitud (CampoDistancias);
+            si no se indica, se usa la distancia Manhattan.
+        **parametros :
+            Argumentos de AlgoritmoPoblacion para cada isla (tamaño_poblacion,
+            seleccion, cruce, tasa_mutacion...).
+        """
+        self.laberinto = laberinto
+        self.pos_meta = laberinto.buscar('M')
+        if self.pos_meta is None:
+            raise ValueError("Debes colocar una meta (M) en el laberinto")
+        self.islas = islas
+        self.migracion_cada = migracion_cada
+        self.migrantes = migrantes
+        self.semilla = semilla
+        self.parametros = parametros
+        self.distancias = distancias
+        self.sumidero = sumidero or crear_sumidero(archivo_stats)
+        self.registros = HistorialGeneraciones()
+        self.registros_islas = [HistorialGeneraciones() for _ in range(islas)]
+        self.mejor_genes = None
+        self.mejor_aptitud = None
+        self.generacion = 0
+        self.evaluaciones = 0
+        self.generacion_meta = None
+
+    def _semillas(self) -> List[Optional[int]]:
+        if self.semilla is None:
+            return [None] * self.islas
+        return [int(hija.generate_state(1)[0])
+                for hija in np.random.SeedSequence(self.semilla).spawn(self.islas)]
+
+    def ejecutar(self, generaciones: Optional[int] = None, evaluaciones: Optional[int] = None,
+                 segundos: Optional[float] = None, detener_en_meta: bool = False):
+        """
+        Lanza las islas y las hace avanzar tanda por tanda hasta agotar el
+        primer presupuesto que se cumpla. Los presupuestos se revisan entre
+        tandas y `generaciones` nunca se excede.
+        """
+        if generaciones is None and evaluaciones is None and segundos is None:
+            raise ValueError("Indica al menos un presupuesto: generaciones, evaluaciones o segundos")
+
+        self.registros = HistorialGeneraciones()
+        self.registros_islas = [HistorialGeneraciones() for _ in range(self.islas)]
+        self.mejor_genes = None
+        self.mejor_aptitud = None
+        self.generacion = 0
+        self.evaluaciones = 0
+        self.generacion_meta = None
+        self.sumidero.iniciar()
+        inicio = time.perf_counter()
+        # Anillo de tuberías: la isla i escribe en anillo[i] y la isla i + 1 lee de ahí
+        anillo = [mp.Pipe(duplex=False) for _ in range(self.islas)] if self.islas > 1 else []
+        conexiones = []
+        procesos = []
+        for i, semilla in enumerate(self._semillas()):
+            propia, remota = mp.Pipe()
+            entrada = anillo[i - 1][0] if anillo else None
+            salida = anillo[i][1] if anillo else None
+            proceso = mp.Process(target=_ejecutar_isla, daemon=True,
+                                 args=(remota, salida, entrada, self.laberinto, self.pos_meta,
+                                       self.parametros, semilla, self.migrantes if anillo else 0,
+                                       self.distancias))
+            proceso.start()
+            conexiones.append(propia)
+            procesos.append(proceso)
+
+        try:
+            while True:
+                cantidad = self.migracion_cada
+                if generaciones is not None:
+                    cantidad = min(cantidad, generaciones - self.generacion)
+                if (cantidad <= 0 or
+                        (evaluaciones is not None and self.evaluaciones >= evaluaciones) or
+                        (segundos is not None and time.perf_counter() - inicio >= segundos) or
+                        (detener_en_meta and self.generacion_meta is not None)):
+                    break
+
+                for conexion in conexiones:
+                    conexion.send(cantidad)
+                self._agregar([conexion.recv() for conexion in conexiones])
+        finally:
+            for conexion in conexiones:
+                conexion.send(0)
+            for proceso in procesos:
+                proceso.join()
+            self.sumidero.cerrar()
+        return self
+
+    def _agregar(self, informes: List[tuple]):
+        """
+        Incorpora los informes de una tanda: historial de cada isla, historial
+        global con la mejor isla por generación y mejor hormiga global.
+        """
+        for historial, (filas, _, _, _) in zip(self.registros_islas, informes):
+            for fila in filas:
+                historial.append(RegistroGeneracion(*fila[:6]))
+
+        for filas_generacion in zip(*(filas for filas, _, _, _ in informes)):
+            mejor = max(filas_generacion, key=lambda fila: fila[6])
+            registro = RegistroGeneracion(*mejor[:6])
+            self.registros.append(registro)
+            self.sumidero.escribir(registro)
+            if self.generacion_meta is None and any(fila[4] for fila in filas_generacion):
+                self.generacion_meta = filas_generacion[0][0]
+
+        for filas, genoma, aptitud, evaluadas in informes:
+            self.evaluaciones += evaluadas
+            if self.mejor_aptitud is None or aptitud > self.mejor_aptitud:
+                self.mejor_genes = genoma.genes()
+                self.mejor_aptitud = aptitud
+        self.generacion += len(informes[0][0])
@@ -0,0 +1,176 @@
+# Representación compacta del laberinto.
+# Las celdas se guardan como códigos uint8 en un arreglo de NumPy, y cada
+# hormiga consume el azúcar y el vino sobre una vista propia, sin modificar
+# el laberinto compartido.
+
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Códigos numéricos de cada tipo de celda
+VACIO, AZUCAR, VINO, VENENO, META, ROCA = range(6)
+SIMBOLOS = '.AVXMR'
+CODIGOS = {simbolo: codigo for codigo, simbolo in enumerate(SIMBOLOS)}
+
+# Movimientos posibles (derecha, abajo, izquierda, arriba), en el orden de los genes
+DX = np.array([0, 1, 0, -1])
+DY = np.array([1, 0, -1, 0])
+
+
+class Laberinto:
+    """
+    Laberinto respaldado por una matriz uint8 de códigos de celda.
+
+    Atributos:
+    ----------
+    celdas : np.ndarray
+        Matriz (filas, columnas) con el código de cada celda.
+    tipos : np.ndarray
+        Vista plana de `celdas`, indexada por celda (x * columnas + y).
+    siguiente : np.ndarray
+        Tabla de transiciones (celdas, 4): celda a la que lleva cada gen desde
+        cada celda, con paredes y bordes ya resueltos (si el movimiento está
+        bloqueado, la celda destino es la misma celda).
+    version : int
+        Contador que aumenta con cada edición, útil para invalidar cachés.
+
+    Métodos:
+    --------
+    desde_lista(laberinto: List[List[str]]) -> Laberinto:
+        Crea un laberinto a partir de una matriz de caracteres.
+    aleatorio(filas: int, columnas: int, densidad: float, semilla: int) -> Laberinto:
+        Genera un laberinto al azar con la densidad de rocas indicada.
+    a_lista() -> List[List[str]]:
+        Devuelve el laberinto como matriz de caracteres.
+    tipo(x: int, y: int) -> str:
+        Devuelve el carácter de la celda (x, y).
+    colocar(x: int, y: int, tipo: str):
+        Cambia el contenido de una celda y actualiza la tabla de transiciones.
+    buscar(tipo: str) -> Optional[Tuple[int, int]]:
+        Devuelve la primera celda que contiene `tipo`.
+    vista() -> VistaLaberinto:
+        Crea una vista con consumibles propios para una hormiga.
+    """
+
+    def __init__(self, filas: int, columnas: Optional[int] = None):
+        """
+        Crea un laberinto vacío de filas x columnas (cuadrado si no se indica columnas).
+        """
+        columnas = filas if columnas is None else columnas
+        self.celdas = np.zeros((filas, columnas), dtype=np.uint8)
+        self.tipos = self.celdas.reshape(-1)
+        self.siguiente = np.empty((filas * columnas, 4), dtype=np.int32)
+        self.version = 0
+        self.compilar()
+
+    @classmethod
+    def desde_lista(cls, laberinto: List[List[str]]) -> 'Laberinto':
+        nuevo = cls(len(laberinto), len(laberinto[0]))
+        nuevo.celdas[:] = [[CODIGOS[tipo] for tipo in fila] for fila in laberinto]
+        nuevo.compilar()
+        return nuevo
+
+    @classmethod
+    def aleatorio(cls, filas: int, columnas: Optional[int] = None, densidad: float = 0.2,
+                  semilla: Optional[int] = None,
+                  proporciones: Tuple[float, float, float] = (0.05, 0.03, 0.02)) -> 'Laberinto':
+        """
+        Genera un laberinto al azar. `densidad` es la fracción de rocas y
+        `proporciones` las fracciones de azúcar, vino y veneno. La salida (0, 0)
+        queda libre y la meta se coloca en la esquina opuesta.
+        """
+        columnas = filas if columnas is None else columnas
+        rng = np.random.default_rng(semilla)
+        limites = np.cumsum((densidad,) + tuple(proporciones))
+        codigos = np.array([ROCA, AZUCAR, VINO, VENENO, VACIO], dtype=np.uint8)
+        nuevo = cls(filas, columnas)
+        nuevo.celdas[:] = codigos[np.searchsorted(limites, rng.random((filas, columnas)), side='right')]
+        nuevo.celdas[0, 0] = VACIO
+        nuevo.celdas[-1, -1] = META
+        nuevo.compilar()
+        return nuevo
+
+    @property
+    def filas(self) -> int:
+        return self.celdas.shape[0]
+
+    @property
+    def columnas(self) -> int:
+        return self.celdas.shape[1]
+
+    def a_lista(self) -> List[List[str]]:
+        return [[SIMBOLOS[codigo] for codigo in fila] for fila in self.celdas.tolist()]
+
+    def tipo(self, x: int, y: int) -> str:
+        return SIMBOLOS[self.celdas.item(x, y)]
+
+    def compilar(self):
+        """
+        Construye la tabla de transiciones completa a partir de `celdas`.
+        """
+        filas, columnas = self.celdas.shape
+        x, y = np.divmod(np.arange(filas * columnas), columnas)
+        for gen in range(4):
+            nuevo_x = x + DX[gen]
+            nuevo_y = y + DY[gen]
+            destino = nuevo_x * columnas + nuevo_y
+            libre = (nuevo_x >= 0) & (nuevo_x < filas) & (nuevo_y >= 0) & (nuevo_y < columnas)
+            libre[libre] = self.tipos[destino[libre]] != ROCA
+            self.siguiente[:, gen] = np.where(libre, destino, np.arange(filas * columnas))
+
+    def colocar(self, x: int, y: int, tipo: str):
+        """
+        Cambia el contenido de la celda (x, y). Si la celda pasa a ser o deja
+        de ser una pared, solo se recalculan las transiciones de sus vecinas.
+        """
+        era_roca = self.celdas[x, y] == ROCA
+        self.celdas[x, y] = CODIGOS[tipo]
+        self.version += 1
+
+        if era_roca != (tipo == 'R'):
+            celda = x * self.columnas + y
+            for gen in range(4):
+                # La vecina que llega a (x, y) con este gen está en la dirección opuesta
+                vecino_x, vecino_y = x - DX[gen], y - DY[gen]
+                if 0 <= vecino_x < self.filas and 0 <= vecino_y < self.columnas:
+                    vecina = vecino_x * self.columnas + vecino_y
+                    self.siguiente[vecina, gen] = vecina if tipo == 'R' else celda
+
+    def buscar(self, tipo: str) -> Optional[Tuple[int, int]]:
+        posiciones = np.argwhere(self.celdas == CODIGOS[tipo])
+        if len(posiciones) == 0:
+            return None
+        return (int(posiciones[0][0]), int(posiciones[0][1]))
+
+    def vista(self) -> 'VistaLaberinto':
+        return VistaLaberinto(self)
+
+
+class VistaLaberinto:
+    """
+    Vista del laberinto para una sola hormiga.
+
+    Guarda solo el conjunto de celdas que la hormiga ya consumió; el resto se
+    lee del laberinto compartido. Reiniciarla cuesta O(celdas consumidas).
+    """
+
+    def __init__(self, laberinto: Laberinto):
+        self.laberinto = laberinto
+        self.consumidos = set()  # Índices planos (x * columnas + y) de celdas consumidas
+
+    def codigo(self, celda: int) -> int:
+        """
+        Código de la celda (índice plano) tal como la ve esta hormiga.
+        """
+        codigo = self.laberinto.tipos.item(celda)
+        if (codigo == AZUCAR or codigo == VINO) and celda in self.consumidos:
+            return VACIO
+        return codigo
+
+    def tipo(self, x: int, y: int) -> str:
+        return SIMBOLOS[self.codigo(x * self.laberinto.columnas + y)]
+
+    def consumir(self, celda: int):
+        self.consumidos.add(celda)
+
+    def reiniciar(self):
+        self.consumidos.clear()
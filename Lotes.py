@@ -0,0 +1,232 @@
+# Ejecución por lotes de configuraciones del algoritmo genético.
+# Evalúa cada configuración sobre una colección de escenarios (archivos de
+# laberinto) y varias semillas, repartiendo las ejecuciones entre procesos, y
+# resume por escenario y configuración las generaciones hasta la meta y el
+# tiempo de reloj.
+
+import argparse
+import csv
+import inspect
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from Motor import cargar_laberinto, ejecutar_evolucion
+
+# Parámetros de ejecutar_evolucion que fija el lote y no una configuración
+RESERVADOS = ('laberinto', 'semilla', 'generaciones', 'evaluaciones', 'segundos',
+              'detener_en_meta', 'archivo_stats', 'respaldo', 'respaldo_cada', 'reanudar')
+PARAMETROS = tuple(nombre for nombre in inspect.signature(ejecutar_evolucion).parameters
+                   if nombre not in RESERVADOS)
+
+
+def _convertir(valor: str):
+    """
+    Interpreta el texto de un parámetro como booleano, None, entero,
+    flotante o, si no es ninguno de ellos, como texto.
+    """
+    minusculas = valor.lower()
+    if minusculas in ('true', 'false'):
+        return minusculas == 'true'
+    if minusculas == 'none':
+        return None
+    for tipo in (int, float):
+        try:
+            return tipo(valor)
+        except ValueError:
+            pass
+    return valor
+
+
+def leer_configuracion(texto: str) -> Tuple[str, Dict]:
+    """
+    Interpreta una configuración de la forma 'nombre:clave=valor,clave=valor'
+    (por ejemplo 'pob50:poblacion=50,cruce=uniforme'). Sin nombre, el nombre
+    es el propio texto; 'base:' o 'base' es la configuración por defecto.
+
+    Retorna:
+    --------
+    Tuple[str, Dict]:
+        Nombre y parámetros para ejecutar_evolucion.
+    """
+    nombre, separador, resto = texto.partition(':')
+    if not separador:
+        nombre, resto = (texto, texto) if '=' in texto else (texto, '')
+    parametros = {}
+    for asignacion in filter(None, resto.split(',')):
+        clave, igual, valor = asignacion.partition('=')
+        clave = clave.strip().replace('-', '_')
+        if not igual or clave not in PARAMETROS:
+            raise ValueError(f"Parámetro inválido '{asignacion}' en '{texto}': usa clave=valor "
+                             f"con {', '.join(PARAMETROS)}")
+        parametros[clave] = _convertir(valor.strip())
+    return nombre, parametros
+
+
+def _ejecutar_tarea(ruta: str, configuracion: str, parametros: Dict, semilla: int,
+                    generaciones: Optional[int], evaluaciones: Optional[int],
+                    segundos: Optional[float]) -> Dict:
+    """
+    Ejecuta una configuración sobre un escenario en el proceso trabajador y
+    retorna la fila de resultados. El tiempo de reloj incluye la carga del
+    laberinto y la preparación del motor.
+    """
+    inicio = time.perf_counter()
+    resultado = ejecutar_evolucion(cargar_laberinto(ruta), semilla, generaciones, evaluaciones,
+                                   segundos, detener_en_meta=True, archivo_stats=os.devnull,
+                                   **parametros)
+    return {
+        'escenario': ruta,
+        'configuracion': configuracion,
+        'semilla': semilla,
+        'generacion_meta': resultado.generacion_meta,
+        'generaciones': resultado.generaciones,
+        'evaluaciones': resultado.evaluaciones,
+        'mejor_aptitud': float(resultado.mejor_aptitud),
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def ejecutar_lote(escenarios: Sequence[str], configuraciones: Dict[str, Dict],
+                  semillas: Sequence[int] = (0,), generaciones: Optional[int] = None,
+                  evaluaciones: Optional[int] = None, segundos: Optional[float] = None,
+                  procesos: Optional[int] = None) -> List[Dict]:
+    """
+    Ejecuta cada configuración sobre cada escenario con cada semilla. Las
+    ejecuciones terminan al llegar a la meta o al agotar el presupuesto.
+
+    Parámetros:
+    -----------
+    escenarios : Sequence[str]
+        Archivos de laberinto (texto o .lab).
+    configuraciones : Dict[str, Dict]
+        nombre -> parámetros de ejecutar_evolucion (ver leer_configuracion).
+    semillas : Sequence[int]
+        Semillas con que se repite cada combinación.
+    generaciones, evaluaciones, segundos :
+        Presupuesto de cada ejecución; se detiene al agotar cualquiera de ellos.
+    procesos : Optional[int]
+        Ejecuciones simultáneas; por defecto, una por núcleo.
+
+    Retorna:
+    --------
+    List[Dict]:
+        Una fila por ejecución, en el orden escenario, configuración, semilla.
+    """
+    if generaciones is None and evaluaciones is None and segundos is None:
+        raise ValueError("Indica un presupuesto: generaciones, evaluaciones o segundos")
+    tareas = [(ruta, nombre, parametros, semilla, generaciones, evaluaciones, segundos)
+              for ruta in escenarios
+              for nombre, parametros in configuraciones.items()
+              for semilla in semillas]
+    with ProcessPoolExecutor(max_workers=procesos or os.cpu_count() or 1) as pool:
+        futuros = [pool.submit(_ejecutar_tarea, *tarea) for tarea in tareas]
+        return [futuro.result() for futuro in futuros]
+
+
+def resumir(filas: List[Dict]) -> List[Dict]:
+    """
+    Agrupa las ejecuciones por escenario y configuración.
+
+    Retorna:
+    --------
+    List[Dict]:
+        Por grupo: ejecuciones, cuántas llegaron a la meta, la mediana de la
+        generación en que llegaron (None si ninguna llegó) y la media de
+        segundos de reloj y de mejor aptitud.
+    """
+    grupos: Dict[Tuple[str, str], List[Dict]] = {}
+    for fila in filas:
+        grupos.setdefault((fila['escenario'], fila['configuracion']), []).append(fila)
+
+    resumen = []
+    for (escenario, configuracion), ejecuciones in grupos.items():
+        metas = [fila['generacion_meta'] for fila in ejecuciones if fila['generacion_meta'] is not None]
+        resumen.append({
+            'escenario': escenario,
+            'configuracion': configuracion,
+            'ejecuciones': len(ejecuciones),
+            'llegaron': len(metas),
+            'mediana_generacion_meta': statistics.median(metas) if metas else None,
+            'media_segundos': statistics.mean(fila['segundos'] for fila in ejecuciones),
+            'media_mejor_aptitud': statistics.mean(fila['mejor_aptitud'] for fila in ejecuciones),
+        })
+    return resumen
+
+
+def tabla_resumen(resumen: List[Dict]) -> str:
+    """
+    Devuelve el resumen como una tabla de texto con columnas alineadas.
+    """
+    encabezado = ('Escenario', 'Configuración', 'Meta', 'Generación (mediana)', 'Segundos (media)',
+                  'Aptitud (media)')
+    filas = [encabezado]
+    for grupo in resumen:
+        generacion = grupo['mediana_generacion_meta']
+        filas.append((os.path.basename(grupo['escenario']), grupo['configuracion'],
+                      f"{grupo['llegaron']}/{grupo['ejecuciones']}",
+                      '-' if generacion is None else f"{generacion:g}",
+                      f"{grupo['media_segundos']:.2f}", f"{grupo['media_mejor_aptitud']:.2f}"))
+    anchos = [max(len(fila[i]) for fila in filas) for i in range(len(encabezado))]
+    lineas = ['  '.join(celda.ljust(ancho) for celda, ancho in zip(fila, anchos)).rstrip()
+              for fila in filas]
+    lineas.insert(1, '  '.join('-' * ancho for ancho in anchos))
+    return '\n'.join(lineas)
+
+
+def guardar_resultados(ruta: str, filas: List[Dict], resumen: List[Dict]):
+    """
+    Guarda las ejecuciones en `ruta`: en CSV una fila por ejecución, y en
+    JSON (extensión .json) las ejecuciones y el resumen.
+    """
+    if ruta.lower().endswith('.json'):
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump({'ejecuciones': filas, 'resumen': resumen}, f, indent=2)
+        return
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=list(filas[0]) if filas else [])
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Punto de entrada de línea de comandos del lote.
+    """
+    parser = argparse.ArgumentParser(
+        description="Evalúa configuraciones del algoritmo genético sobre varios escenarios.")
+    parser.add_argument('escenarios', nargs='+', help="Archivos de laberinto (texto o .lab)")
+    parser.add_argument('--config', action='append', default=None, metavar='NOMBRE:CLAVE=VALOR,...',
+                        help="Configuración a evaluar (repetible), por ejemplo "
+                             "'pob50:poblacion=50,cruce=uniforme'; por defecto, la configuración base")
+    parser.add_argument('--semillas', type=int, nargs='+', default=[0], help="Semillas de cada combinación")
+    parser.add_argument('--generaciones', type=int, default=None, help="Máximo de generaciones por ejecución")
+    parser.add_argument('--evaluaciones', type=int, default=None, help="Máximo de hormigas simuladas por ejecución")
+    parser.add_argument('--segundos', type=float, default=None, help="Máximo de segundos por ejecución")
+    parser.add_argument('--procesos', type=int, default=None, help="Ejecuciones simultáneas")
+    parser.add_argument('--salida', default=None, metavar='ARCHIVO',
+                        help="Guarda cada ejecución en CSV, o también el resumen si termina en .json")
+    args = parser.parse_args(argv)
+
+    if args.generaciones is None and args.evaluaciones is None and args.segundos is None:
+        parser.error("indica --generaciones, --evaluaciones o --segundos")
+    configuraciones = {}
+    for texto in args.config or ['base']:
+        try:
+            nombre, parametros = leer_configuracion(texto)
+        except ValueError as error:
+            parser.error(str(error))
+        configuraciones[nombre] = parametros
+
+    filas = ejecutar_lote(args.escenarios, configuraciones, args.semillas, args.generaciones,
+                          args.evaluaciones, args.segundos, args.procesos)
+    resumen = resumir(filas)
+    print(tabla_resumen(resumen))
+    if args.salida:
+        guardar_resultados(args.salida, filas, resumen)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,597 @@
+# Motor de evolución sin interfaz gráfica.
+# Permite ejecutar el algoritmo genético tan rápido como lo permita la CPU,
+# sin depender de tkinter ni del ciclo de eventos de la ventana.
+
+import argparse
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from AlgoritmoGenetico import AlgoritmoGenetico
+from AlgoritmoPoblacion import AlgoritmoPoblacion
+from Cache import CacheAptitud
+from Distancias import CampoDistancias
+from Escenarios import leer_escenario
+from Estancamiento import DetectorEstancamiento
+from Hormiga import HormigaGenetica
+from Incremental import EvaluadorIncremental
+from Instrumentacion import Instrumentacion
+from Islas import ModeloIslas
+from Laberinto import Laberinto, VistaLaberinto
+from Paralelo import MINIMO_BLOQUE, EvaluadorParalelo
+from Poblacion import SimuladorPoblacion
+from Respaldo import cargar_respaldo, guardar_respaldo
+from SalonFama import SalonFama
+
+
+def cargar_laberinto(ruta: str) -> Laberinto:
+    """
+    Carga un laberinto desde un archivo de escenario.
+
+    El archivo puede ser de texto, con una fila del laberinto por línea y un
+    carácter por celda ('A', 'V', 'X', 'R', 'M' o '.'), donde las líneas vacías
+    y las que empiezan con '#' se ignoran, o binario (.lab, ver Escenarios.py).
+
+    Parámetros:
+    -----------
+    ruta : str
+        Ruta del archivo con el laberinto.
+
+    Retorna:
+    --------
+    Laberinto:
+        Laberinto compacto con el contenido del archivo.
+    """
+    return leer_escenario(ruta)[0]
+
+
+def evaluar_hormiga(hormiga: HormigaGenetica, vista: VistaLaberinto,
+                    pos_meta: Tuple[int, int],
+                    detector: Optional[DetectorEstancamiento] = None,
+                    distancias: Optional[np.ndarray] = None) -> float:
+    """
+    Simula a la hormiga desde su posición inicial hasta que muere, llega a la
+    meta o agota sus pasos, y calcula su aptitud.
+
+    El laberinto compartido no se modifica: la hormiga consume el azúcar y el
+    vino sobre su vista, que se reinicia antes de empezar. Con `detector`,
+    se saltan los ciclos repetidos del recorrido, con la misma aptitud. Con
+    `distancias` (CampoDistancias), la aptitud usa los pasos hasta la meta en
+    lugar de la distancia Manhattan.
+
+    Retorna:
+    --------
+    float:
+        Aptitud final de la hormiga.
+    """
+    hormiga.reiniciar()
+    vista.reiniciar()  # Cada hormiga ve sus propios consumibles
+    if detector is not None and detector.aplica(hormiga):
+        detector.reiniciar(hormiga, vista.laberinto.columnas)
+        while hormiga.mover(vista):
+            if hormiga.llego_meta or detector.revisar(hormiga, vista):
+                break
+        return hormiga.calcular_aptitud(pos_meta, distancias)
+
+    while hormiga.mover(vista):
+        if hormiga.llego_meta:
+            break
+    return hormiga.calcular_aptitud(pos_meta, distancias)
+
+
+class ResultadoEvolucion:
+    """
+    Resumen de una ejecución del motor de evolución.
+
+    Atributos:
+    ----------
+    generaciones : int
+        Número de generaciones completadas.
+    evaluaciones : int
+        Número de hormigas simuladas.
+    segundos : float
+        Tiempo de reloj empleado en la ejecución.
+    mejor_aptitud : float
+        Aptitud de la mejor hormiga encontrada.
+    mejor_genes : np.ndarray
+        Genes de la mejor hormiga encontrada.
+    generacion_meta : Optional[int]
+        Primera generación en la que una hormiga llegó a la meta, o None.
+    contadores : Dict[str, int]
+        Contadores adicionales de la ejecución (por ejemplo, pasos simulados).
+    salon : Optional[SalonFama]
+        Salón de la fama de la ejecución, si se pidió.
+    """
+
+    def __init__(self, generaciones: int, evaluaciones: int, segundos: float,
+                 mejor_aptitud: float, mejor_genes: np.ndarray,
+                 generacion_meta: Optional[int], contadores: Optional[Dict[str, int]] = None,
+                 salon: Optional[SalonFama] = None):
+        self.generaciones = generaciones
+        self.evaluaciones = evaluaciones
+        self.segundos = segundos
+        self.mejor_aptitud = mejor_aptitud
+        self.mejor_genes = mejor_genes
+        self.generacion_meta = generacion_meta
+        self.contadores = contadores or {}
+        self.salon = salon
+
+    def to_string(self) -> str:
+        """
+        Devuelve una representación en texto del resumen de la ejecución.
+        """
+        velocidad = self.generaciones / self.segundos if self.segundos > 0 else 0.0
+        meta = self.generacion_meta if self.generacion_meta is not None else 'No'
+        texto = (f"Generaciones: {self.generaciones}\n"
+                 f"Evaluaciones: {self.evaluaciones}\n"
+                 f"Tiempo total: {self.segundos:.2f} segundos\n"
+                 f"Generaciones por segundo: {velocidad:.1f}\n"
+                 f"Mejor aptitud: {self.mejor_aptitud:.2f}\n"
+                 f"Llegó a la meta en la generación: {meta}\n")
+        for nombre, valor in self.contadores.items():
+            texto += f"{nombre.replace('_', ' ').capitalize()}: {valor}\n"
+        return texto
+
+
+class MotorEvolucion:
+    """
+    Ejecuta el algoritmo genético sobre un laberinto sin interfaz gráfica.
+
+    Métodos:
+    --------
+    ejecutar(generaciones, evaluaciones, segundos, detener_en_meta, reanudar) -> ResultadoEvolucion:
+        Evoluciona hasta agotar el presupuesto indicado.
+    """
+
+    def __init__(self, laberinto: Union[Laberinto, List[List[str]]],
+                 semilla: Optional[int] = None,
+                 archivo_stats: str = 'estadisticas_hormiga.npy', *, hijos: int = 1,
+                 trabajadores: Optional[int] = None, incremental: bool = True,
+                 capacidad_cache: int = 0, poblacion: int = 0, seleccion: str = 'torneo',
+                 cruce: str = 'un_punto', islas: int = 0, migracion_cada: int = 10,
+                 migrantes: int = 2, respaldo: Optional[str] = None, respaldo_cada: int = 1000,
+                 manhattan: bool = False, salon: int = 0):
+        """
+        Parámetros:
+        -----------
+        laberinto : Union[Laberinto, List[List[str]]]
+            Laberinto sobre el que evolucionan las hormigas. Debe contener una meta.
+        semilla : Optional[int]
+            Semilla para `random` y `numpy.random`, para ejecuciones reproducibles.
+        archivo_stats : str
+            Archivo donde el algoritmo genético guarda sus estadísticas. Los
+            parámetros que siguen solo se aceptan por nombre.
+        hijos : int
+            Hijos mutados de la mejor hormiga evaluados por generación; el mejor
+            de ellos pasa a ser la hormiga actual. Con 1 se usa el esquema (1+1) original.
+        trabajadores : Optional[int]
+            Si se indica, los hijos (o la población) de cada generación se
+            reparten en bloques entre ese número de procesos (EvaluadorParalelo).
+            Exige lotes de al menos MINIMO_BLOQUE genomas (`hijos` o `poblacion`):
+            los menores se evaluarían siempre en este proceso.
+        incremental : bool
+            En el esquema (1+1), reanuda cada hijo desde la trayectoria de la
+            mejor hormiga en lugar de simularlo desde el paso 0.
+        capacidad_cache : int
+            En el esquema (1+1), máximo de resultados guardados en la caché de
+            aptitud por prefijo ejecutado. Con 0 la caché se desactiva.
+        poblacion : int
+            Si es mayor que 0, usa AlgoritmoPoblacion con ese tamaño de población
+            en lugar del esquema (1+1); `hijos`, `incremental` y la caché no se usan.
+        seleccion, cruce : str
+            Operadores de AlgoritmoPoblacion ('torneo' o 'rango'; 'un_punto' o 'uniforme').
+        islas : int
+            Si es mayor que 0, evoluciona esa cantidad de poblaciones en procesos
+            separados (ModeloIslas), con `poblacion` hormigas cada una (100 si es 0).
+        migracion_cada, migrantes : int
+            Generaciones entre migraciones y genomas que migra cada isla.
+        respaldo : Optional[str]
+            Archivo donde se guarda el estado de la evolución cada `respaldo_cada`
+            generaciones y al terminar, para poder reanudarla (Respaldo.py).
+            No está disponible con islas.
+        manhattan : bool
+            Si es True, la aptitud usa la distancia Manhattan a la meta, como
+            antes, en lugar de los pasos del camino más corto (CampoDistancias).
+        salon : int
+            Si es mayor que 0, guarda en un SalonFama las `salon` mejores
+            hormigas distintas y sus recorridos. En el esquema (1+1) con
+            varios hijos solo se ofrece el mejor hijo de cada generación. No
+            está disponible con islas y no se incluye en los respaldos.
+        """
+        if not isinstance(laberinto, Laberinto):
+            laberinto = Laberinto.desde_lista(laberinto)
+        self.laberinto = laberinto
+        self.vista = laberinto.vista()
+        self.pos_meta = laberinto.buscar('M')
+        if self.pos_meta is None:
+            raise ValueError("Debes colocar una meta (M) en el laberinto")
+        lote = poblacion if poblacion > 0 else hijos
+        if trabajadores and islas <= 0 and lote < MINIMO_BLOQUE:
+            raise ValueError(f"Con trabajadores se necesitan lotes de al menos {MINIMO_BLOQUE} genomas "
+                             f"por generación (hijos o población); se indicaron {lote}")
+        self.semilla = semilla
+        self.hijos = hijos
+        self.trabajadores = trabajadores
+        self.incremental = incremental
+        self.cache = CacheAptitud(capacidad_cache) if capacidad_cache > 0 and hijos == 1 else None
+        self.poblacion = poblacion
+        self.respaldo = respaldo
+        self.respaldo_cada = respaldo_cada
+        self.detector = DetectorEstancamiento()
+        self.distancias = None if manhattan else CampoDistancias(laberinto).matriz()
+        if respaldo and islas > 0:
+            raise ValueError("Los respaldos no están disponibles con islas")
+        if salon > 0 and islas > 0:
+            raise ValueError("El salón de la fama no está disponible con islas")
+        self.salon = SalonFama(salon, laberinto, manhattan=manhattan) if salon > 0 else None
+        self.islas = None
+        if islas > 0:
+            self.islas = ModeloIslas(laberinto, islas, migracion_cada, migrantes, semilla,
+                                     archivo_stats, distancias=self.distancias,
+                                     tamaño_poblacion=poblacion or 100,
+                                     seleccion=seleccion, cruce=cruce)
+            self.algoritmo_genetico = None
+        elif poblacion > 0:
+            self.algoritmo_genetico = AlgoritmoPoblacion(poblacion, seleccion=seleccion, cruce=cruce,
+                                                         semilla=semilla, archivo_stats=archivo_stats)
+        else:
+            self.algoritmo_genetico = AlgoritmoGenetico(archivo_stats)
+
+    def ejecutar(self, generaciones: Optional[int] = None,
+                 evaluaciones: Optional[int] = None,
+                 segundos: Optional[float] = None,
+                 detener_en_meta: bool = False, reanudar: bool = False) -> ResultadoEvolucion:
+        """
+        Evoluciona hormigas hasta agotar el primer presupuesto que se cumpla.
+
+        Parámetros:
+        -----------
+        generaciones : Optional[int]
+            Máximo de generaciones.
+        evaluaciones : Optional[int]
+            Máximo de hormigas simuladas.
+        segundos : Optional[float]
+            Máximo de tiempo de reloj.
+        detener_en_meta : bool
+            Si es True, termina en cuanto una hormiga llega a la meta.
+        reanudar : bool
+            Si es True y el archivo de respaldo existe, continúa la evolución
+            guardada en lugar de empezar una nueva. `generaciones` y
+            `evaluaciones` cuentan desde el comienzo de la evolución original.
+
+        Retorna:
+        --------
+        ResultadoEvolucion:
+            Resumen de la ejecución.
+        """
+        if generaciones is None and evaluaciones is None and segundos is None:
+            raise ValueError("Indica al menos un presupuesto: generaciones, evaluaciones o segundos")
+
+        if self.islas is not None:
+            inicio = time.perf_counter()
+            islas = self.islas.ejecutar(generaciones, evaluaciones, segundos, detener_en_meta)
+            return ResultadoEvolucion(islas.generacion, islas.evaluaciones,
+                                      time.perf_counter() - inicio, islas.mejor_aptitud or 0.0,
+                                      islas.mejor_genes.copy() if islas.mejor_genes is not None
+                                      else np.empty(0, dtype=int), islas.generacion_meta)
+        if self.poblacion > 0:
+            return self._ejecutar_poblacion(generaciones, evaluaciones, segundos, detener_en_meta,
+                                            reanudar)
+
+        ag = self.algoritmo_genetico
+        n_evaluaciones, generacion_meta = self._comenzar(reanudar)
+        evaluador = None
+        if self.trabajadores:
+            evaluador = EvaluadorParalelo(self.laberinto, self.pos_meta, self.trabajadores,
+                                          distancias=self.distancias)
+        elif self.hijos > 1:
+            evaluador = SimuladorPoblacion(self.laberinto, distancias=self.distancias)
+        elif self.incremental:
+            evaluador = EvaluadorIncremental(self.laberinto, self.pos_meta,
+                                             distancias=self.distancias)
+            if ag.mejor_hormiga is not None:
+                # Al reanudar, la mejor hormiga restaurada vuelve a ser el padre de referencia
+                evaluador.evaluar(ag.mejor_hormiga)
+                evaluador.adoptar()
+        inicio = time.perf_counter()
+        limite = inicio + segundos if segundos is not None else None
+
+        while True:
+            if generaciones is not None and ag.generacion >= generaciones:
+                break
+            if evaluaciones is not None and n_evaluaciones >= evaluaciones:
+                break
+            if limite is not None and time.perf_counter() >= limite:
+                break
+
+            hormiga = ag.hormiga_actual
+            if self.cache is not None and self.cache.buscar(hormiga, self.laberinto.version):
+                # Un resultado ya visto nunca supera a la mejor hormiga, así que no se adopta
+                hormiga.calcular_aptitud(self.pos_meta, self.distancias)
+                n_evaluaciones += 1
+            elif evaluador is None:
+                evaluar_hormiga(hormiga, self.vista, self.pos_meta, self.detector, self.distancias)
+                n_evaluaciones += 1
+            elif isinstance(evaluador, EvaluadorIncremental):
+                evaluador.evaluar(hormiga)
+                # Si el hijo va a reemplazar a la mejor hormiga, pasa a ser el padre de referencia
+                if ag.mejor_hormiga is None or hormiga.aptitud > ag.mejor_hormiga.aptitud:
+                    evaluador.adoptar()
+                n_evaluaciones += 1
+            else:
+                n_evaluaciones += self._evaluar_hijos(evaluador)
+            if self.cache is not None:
+                self.cache.guardar(hormiga, self.laberinto.version)
+            if self.salon is not None:
+                self.salon.ofrecer(hormiga.genes, hormiga.aptitud, ag.generacion)
+            if hormiga.llego_meta and generacion_meta is None:
+                generacion_meta = ag.generacion
+            ag.evolucionar()
+            self._respaldar(n_evaluaciones, generacion_meta)
+
+            if detener_en_meta and generacion_meta is not None:
+                break
+
+        self._respaldar(n_evaluaciones, generacion_meta, forzar=True)
+        ag.sumidero.cerrar()
+        contadores = {}
+        if isinstance(evaluador, EvaluadorParalelo):
+            evaluador.cerrar()
+        elif isinstance(evaluador, EvaluadorIncremental):
+            contadores['pasos_simulados'] = evaluador.pasos_simulados
+            contadores['pasos_ahorrados'] = evaluador.pasos_ahorrados
+        if self.cache is not None:
+            contadores['aciertos_cache'] = self.cache.aciertos
+            contadores['fallos_cache'] = self.cache.fallos
+
+        return ResultadoEvolucion(
+            ag.generacion,
+            n_evaluaciones,
+            time.perf_counter() - inicio,
+            ag.mejor_hormiga.aptitud if ag.mejor_hormiga else 0.0,
+            ag.mejor_hormiga.genes.copy() if ag.mejor_hormiga else np.empty(0, dtype=int),
+            generacion_meta,
+            contadores,
+            self.salon
+        )
+
+    def _comenzar(self, reanudar: bool) -> Tuple[int, Optional[int]]:
+        """
+        Inicializa el algoritmo genético, o lo restaura desde el respaldo si se
+        pide reanudar y el archivo existe.
+
+        Retorna:
+        --------
+        Tuple[int, Optional[int]]:
+            Evaluaciones ya realizadas y generación en la que se llegó a la meta.
+        """
+        ag = self.algoritmo_genetico
+        if reanudar and self.respaldo and os.path.exists(self.respaldo):
+            extra = cargar_respaldo(self.respaldo, ag)
+            return extra['evaluaciones'], extra['generacion_meta']
+
+        if self.semilla is not None:
+            random.seed(self.semilla)
+            np.random.seed(self.semilla)
+        ag.inicializar()
+        return 0, None
+
+    def _respaldar(self, evaluaciones: int, generacion_meta: Optional[int], forzar: bool = False):
+        """
+        Guarda el respaldo si está activado y corresponde a esta generación.
+        """
+        ag = self.algoritmo_genetico
+        if self.respaldo and (forzar or ag.generacion % self.respaldo_cada == 0):
+            guardar_respaldo(self.respaldo, ag, evaluaciones=evaluaciones,
+                             generacion_meta=generacion_meta)
+
+    def _ejecutar_poblacion(self, generaciones: Optional[int], evaluaciones: Optional[int],
+                            segundos: Optional[float], detener_en_meta: bool,
+                            reanudar: bool = False) -> ResultadoEvolucion:
+        """
+        Igual que `ejecutar`, pero con AlgoritmoPoblacion: cada generación
+        evalúa la población completa en bloque.
+        """
+        ag = self.algoritmo_genetico
+        n_evaluaciones, generacion_meta = self._comenzar(reanudar)
+        if self.trabajadores:
+            evaluador = EvaluadorParalelo(self.laberinto, self.pos_meta, self.trabajadores,
+                                          distancias=self.distancias)
+        else:
+            evaluador = SimuladorPoblacion(self.laberinto, distancias=self.distancias)
+        inicio = time.perf_counter()
+        limite = inicio + segundos if segundos is not None else None
+
+        while True:
+            if generaciones is not None and ag.generacion >= generaciones:
+                break
+            if evaluaciones is not None and n_evaluaciones >= evaluaciones:
+                break
+            if limite is not None and time.perf_counter() >= limite:
+                break
+
+            if isinstance(evaluador, EvaluadorParalelo):
+                resultado = evaluador.evaluar_todo(ag.genes)
+            else:
+                resultado = evaluador.simular(ag.genes, self.pos_meta)
+            n_evaluaciones += len(resultado)
+            if self.salon is not None:
+                self.salon.ofrecer_poblacion(ag.genes, resultado.aptitud, ag.generacion)
+            if generacion_meta is None and resultado.llego_meta.any():
+                generacion_meta = ag.generacion
+            ag.evolucionar(resultado)
+            self._respaldar(n_evaluaciones, generacion_meta)
+
+            if detener_en_meta and generacion_meta is not None:
+                break
+
+        self._respaldar(n_evaluaciones, generacion_meta, forzar=True)
+        ag.sumidero.cerrar()
+        contadores = {}
+        if isinstance(evaluador, EvaluadorParalelo):
+            evaluador.cerrar()
+
+        return ResultadoEvolucion(
+            ag.generacion,
+            n_evaluaciones,
+            time.perf_counter() - inicio,
+            ag.mejor_hormiga.aptitud if ag.mejor_hormiga else 0.0,
+            ag.mejor_hormiga.genes.copy() if ag.mejor_hormiga else np.empty(0, dtype=int),
+            generacion_meta,
+            contadores,
+            self.salon
+        )
+
+    def _evaluar_hijos(self, evaluador) -> int:
+        """
+        Evalúa en bloque la hormiga actual junto con `hijos - 1` mutaciones
+        adicionales de la mejor hormiga, y deja en la hormiga actual al mejor hijo.
+
+        Retorna:
+        --------
+        int:
+            Número de hormigas evaluadas.
+        """
+        ag = self.algoritmo_genetico
+        hormiga = ag.hormiga_actual
+        candidatos = [hormiga.genes]
+        for _ in range(self.hijos - 1):
+            if ag.mejor_hormiga is None:
+                candidatos.append(HormigaGenetica(0, 0).genes)
+            else:
+                candidatos.append(ag.mutar(ag.mejor_hormiga.genes))
+        genes = np.stack(candidatos)
+
+        if isinstance(evaluador, EvaluadorParalelo):
+            resultado = evaluador.evaluar_todo(genes)
+        else:
+            resultado = evaluador.simular(genes, self.pos_meta)
+
+        mejor = int(np.argmax(resultado.aptitud))
+        hormiga.genes = genes[mejor]
+        resultado.aplicar(mejor, hormiga)
+        return len(genes)
+
+
+def ejecutar_evolucion(laberinto: Union[Laberinto, List[List[str]]],
+                       semilla: Optional[int] = None,
+                       generaciones: Optional[int] = None,
+                       evaluaciones: Optional[int] = None,
+                       segundos: Optional[float] = None,
+                       detener_en_meta: bool = False,
+                       archivo_stats: str = 'estadisticas_hormiga.npy', *, hijos: int = 1,
+                       trabajadores: Optional[int] = None,
+                       incremental: bool = True,
+                       capacidad_cache: int = 0, poblacion: int = 0,
+                       seleccion: str = 'torneo', cruce: str = 'un_punto', islas: int = 0,
+                       migracion_cada: int = 10, migrantes: int = 2,
+                       respaldo: Optional[str] = None, respaldo_cada: int = 1000,
+                       reanudar: bool = False, manhattan: bool = False, salon: int = 0) -> ResultadoEvolucion:
+    """
+    Atajo para crear un MotorEvolucion y ejecutarlo con el presupuesto dado.
+    Los parámetros después de `archivo_stats` solo se aceptan por nombre.
+    """
+    motor = MotorEvolucion(laberinto, semilla, archivo_stats, hijos=hijos,
+                           trabajadores=trabajadores, incremental=incremental,
+                           capacidad_cache=capacidad_cache, poblacion=poblacion,
+                           seleccion=seleccion, cruce=cruce, islas=islas,
+                           migracion_cada=migracion_cada, migrantes=migrantes,
+                           respaldo=respaldo, respaldo_cada=respaldo_cada,
+                           manhattan=manhattan, salon=salon)
+    return motor.ejecutar(generaciones, evaluaciones, segundos, detener_en_meta, reanudar)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Punto de entrada de línea de comandos del motor sin interfaz gráfica.
+    """
+    parser = argparse.ArgumentParser(
+        description="Evoluciona hormigas sobre un laberinto sin interfaz gráfica.")
+    parser.add_argument('laberinto', help="Archivo con el laberinto (texto o .lab)")
+    parser.add_argument('--semilla', type=int, default=None, help="Semilla aleatoria")
+    parser.add_argument('--generaciones', type=int, default=None, help="Máximo de generaciones")
+    parser.add_argument('--evaluaciones', type=int, default=None, help="Máximo de hormigas simuladas")
+    parser.add_argument('--segundos', type=float, default=None, help="Máximo de segundos")
+    parser.add_argument('--detener-en-meta', action='store_true',
+                        help="Termina cuando una hormiga llega a la meta")
+    parser.add_argument('--stats', default='estadisticas_hormiga.npy',
+                        help="Archivo de estadísticas (.npy para NumPy, .db para SQLite; "
+                             ".txt solo si se quiere el formato de texto original)")
+    parser.add_argument('--hijos', type=int, default=1,
+                        help="Hijos evaluados por generación (1 = esquema 1+1)")
+    parser.add_argument('--trabajadores', type=int, default=None,
+                        help="Procesos entre los que se reparten los hijos o la población de "
+                             f"cada generación; necesita --hijos o --poblacion de al menos {MINIMO_BLOQUE}")
+    parser.add_argument('--sin-incremental', action='store_true',
+                        help="Simula cada hijo desde el paso 0")
+    parser.add_argument('--cache', type=int, default=0,
+                        help="Capacidad de la caché de aptitud (0 la desactiva)")
+    parser.add_argument('--poblacion', type=int, default=0,
+                        help="Tamaño de población del algoritmo generacional (0 = esquema 1+1)")
+    parser.add_argument('--seleccion', choices=['torneo', 'rango'], default='torneo',
+                        help="Selección de padres con --poblacion")
+    parser.add_argument('--cruce', choices=['un_punto', 'uniforme'], default='un_punto',
+                        help="Cruce de padres con --poblacion")
+    parser.add_argument('--islas', type=int, default=0,
+                        help="Poblaciones que evolucionan en procesos separados (0 = una sola)")
+    parser.add_argument('--migrar-cada', type=int, default=10,
+                        help="Generaciones entre migraciones con --islas")
+    parser.add_argument('--migrantes', type=int, default=2,
+                        help="Genomas que envía cada isla en cada migración")
+    parser.add_argument('--manhattan', action='store_true',
+                        help="Usa la distancia Manhattan a la meta en la aptitud en lugar "
+                             "del camino más corto")
+    parser.add_argument('--respaldo', default=None, metavar='ARCHIVO',
+                        help="Guarda periódicamente el estado de la evolución en este archivo")
+    parser.add_argument('--respaldo-cada', type=int, default=1000,
+                        help="Generaciones entre respaldos")
+    parser.add_argument('--reanudar', action='store_true',
+                        help="Continúa la evolución guardada en --respaldo, si existe")
+    parser.add_argument('--salon', type=int, default=0,
+                        help="Guarda las N mejores hormigas distintas y sus recorridos")
+    parser.add_argument('--salon-archivo', default=None, metavar='ARCHIVO',
+                        help="Archivo .npz donde se guarda el salón de la fama de --salon")
+    parser.add_argument('--instrumentar', default=None, metavar='ARCHIVO',
+                        help="Mide el tiempo de cada fase y lo guarda en este archivo JSON")
+    args = parser.parse_args(argv)
+
+    if args.generaciones is None and args.evaluaciones is None and args.segundos is None:
+        parser.error("indica --generaciones, --evaluaciones o --segundos")
+    if args.reanudar and not args.respaldo:
+        parser.error("--reanudar necesita --respaldo")
+    if args.salon_archivo and args.salon <= 0:
+        parser.error("--salon-archivo necesita --salon")
+    lote = args.poblacion if args.poblacion > 0 else args.hijos
+    if args.trabajadores and args.islas <= 0 and lote < MINIMO_BLOQUE:
+        parser.error(f"--trabajadores necesita --hijos o --poblacion de al menos {MINIMO_BLOQUE}")
+
+    instrumentacion = Instrumentacion()
+    if args.instrumentar:
+        instrumentacion.activar()
+    resultado = ejecutar_evolucion(cargar_laberinto(args.laberinto), args.semilla,
+                                   args.generaciones, args.evaluaciones, args.segundos,
+                                   args.detener_en_meta, args.stats, hijos=args.hijos,
+                                   trabajadores=args.trabajadores,
+                                   incremental=not args.sin_incremental,
+                                   capacidad_cache=args.cache, poblacion=args.poblacion,
+                                   seleccion=args.seleccion, cruce=args.cruce,
+                                   islas=args.islas, migracion_cada=args.migrar_cada,
+                                   migrantes=args.migrantes, respaldo=args.respaldo,
+                                   respaldo_cada=args.respaldo_cada, reanudar=args.reanudar,
+                                   manhattan=args.manhattan, salon=args.salon)
+    print(resultado.to_string())
+    if resultado.salon is not None:
+        for i, entrada in enumerate(resultado.salon.entradas, 1):
+            print(f"{i}. {entrada.descripcion()}")
+        if args.salon_archivo:
+            resultado.salon.guardar(args.salon_archivo)
+    if args.instrumentar:
+        instrumentacion.exportar(args.instrumentar)
+        instrumentacion.desactivar()
+        for fase, datos in instrumentacion.resumen().items():
+            print(f"{fase}: {datos['llamadas']} llamadas | {datos['ms_por_llamada']:.4f} ms por llamada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Evaluación paralela de genomas en varios procesos.
+# El laberinto se envía una sola vez a cada proceso trabajador mediante el
+# inicializador del pool; cada tarea solo transporta su bloque de genes,
+# empaquetado a 2 bits por gen (Genoma.py). Cada lote se divide en un bloque
+# por trabajador; los lotes de menos de MINIMO_BLOQUE genomas se evalúan en el
+# propio proceso, porque dividirlos no compensa el costo de la comunicación.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from Genoma import desempaquetar, empaquetar
+from Laberinto import Laberinto
+from Poblacion import ResultadoPoblacion, SimuladorPoblacion
+
+# Estado propio de cada proceso trabajador, creado por _inicializar_trabajador
+_simulador: Optional[SimuladorPoblacion] = None
+_pos_meta: Optional[Tuple[int, int]] = None
+
+MINIMO_BLOQUE = 16  # Genomas por bloque como mínimo; con menos, el lote no sale del proceso
+
+
+def _inicializar_trabajador(laberinto: Laberinto, pos_meta: Tuple[int, int],
+                            pasos_maximos: int, distancias: Optional[np.ndarray] = None):
+    """
+    Prepara el simulador del proceso trabajador. Se ejecuta una vez por proceso.
+    """
+    global _simulador, _pos_meta
+    _simulador = SimuladorPoblacion(laberinto, pasos_maximos=pasos_maximos, distancias=distancias)
+    _pos_meta = pos_meta
+
+
+def _evaluar_bloque(indice_bloque: int, empaquetados: np.ndarray,
+                    largo: int) -> Tuple[int, ResultadoPoblacion]:
+    """
+    Evalúa un bloque de genomas empaquetados dentro de un proceso trabajador.
+
+    La simulación no usa números aleatorios: el resultado de cada genoma solo
+    depende de sus genes y del laberinto, así que no depende del proceso que
+    ejecute el bloque ni de cómo se reparta el lote.
+    """
+    return indice_bloque, _simulador.simular(desempaquetar(empaquetados, largo), _pos_meta)
+
+
+def concatenar_resultados(bloques: List[ResultadoPoblacion]) -> ResultadoPoblacion:
+    """
+    Une varios resultados parciales, en orden, en un único ResultadoPoblacion.
+    """
+    campos = ('x', 'y', 'pasos', 'puntos', 'alcohol', 'viva', 'llego_meta', 'aptitud')
+    return ResultadoPoblacion(*(np.concatenate([getattr(b, c) for b in bloques]) for c in campos))
+
+
+class EvaluadorParalelo:
+    """
+    Reparte la evaluación de genomas entre varios procesos.
+
+    Cada lote se reparte en bloques de ceil(N / trabajadores) genomas, pero
+    nunca de menos de `minimo_bloque`. Los lotes de menos de `minimo_bloque`
+    genomas se simulan en este proceso, con los mismos resultados; los
+    procesos se crean recién cuando llega el primer lote que se reparte.
+
+    Métodos:
+    --------
+    tamaño_bloque(cantidad: int) -> int:
+        Genomas por bloque para un lote de `cantidad` genomas.
+    evaluar(genes: np.ndarray) -> Iterator[Tuple[int, ResultadoPoblacion]]:
+        Entrega los resultados por bloques, a medida que terminan.
+    evaluar_todo(genes: np.ndarray) -> ResultadoPoblacion:
+        Evalúa todos los genomas y devuelve los resultados en orden.
+    cerrar():
+        Termina los procesos trabajadores.
+    """
+
+    def __init__(self, laberinto: Laberinto, pos_meta: Tuple[int, int],
+                 trabajadores: Optional[int] = None, minimo_bloque: int = MINIMO_BLOQUE,
+                 pasos_maximos: int = 200,
+                 distancias: Optional[np.ndarray] = None):
+        """
+        Parámetros:
+        -----------
+        laberinto : Laberinto
+            Laberinto compartido por todas las evaluaciones.
+        pos_meta : Tuple[int, int]
+            Posición de la meta.
+        trabajadores : Optional[int]
+            Número de procesos; por defecto, uno por núcleo.
+        minimo_bloque : int
+            Genomas mínimos por tarea enviada a un proceso.
+        pasos_maximos : int
+            Límite de pasos de cada hormiga.
+        distancias : Optional[np.ndarray]
+            Matriz de pasos hasta la meta para la aptitud (CampoDistancias).
+        """
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.minimo_bloque = minimo_bloque
+        self.pos_meta = pos_meta
+        self._argumentos = (laberinto, pos_meta, pasos_maximos, distancias)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._local: Optional[SimuladorPoblacion] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.trabajadores,
+                                             initializer=_inicializar_trabajador,
+                                             initargs=self._argumentos)
+        return self._pool
+
+    def tamaño_bloque(self, cantidad: int) -> int:
+        return max(self.minimo_bloque, math.ceil(cantidad / self.trabajadores))
+
+    def evaluar(self, genes: np.ndarray) -> Iterator[Tuple[int, ResultadoPoblacion]]:
+        """
+        Evalúa la matriz de genes (N, L) y entrega tuplas (inicio, resultado)
+        por cada bloque terminado, donde `inicio` es la fila del primer genoma
+        del bloque.
+        """
+        if len(genes) < self.minimo_bloque:
+            if self._local is None:
+                laberinto, _, pasos_maximos, distancias = self._argumentos
+                self._local = SimuladorPoblacion(laberinto, pasos_maximos=pasos_maximos,
+                                                 distancias=distancias)
+            yield 0, self._local.simular(genes, self.pos_meta)
+            return
+        largo = genes.shape[1]
+        tamaño = self.tamaño_bloque(len(genes))
+        futuros = [self.pool.submit(_evaluar_bloque, i, empaquetar(genes[inicio:inicio + tamaño]), largo)
+                   for i, inicio in enumerate(range(0, len(genes), tamaño))]
+        for futuro in as_completed(futuros):
+            indice_bloque, resultado = futuro.result()
+            yield indice_bloque * tamaño, resultado
+
+    def evaluar_todo(self, genes: np.ndarray) -> ResultadoPoblacion:
+        """
+        Evalúa la matriz de genes (N, L) y devuelve los resultados en el orden de las filas.
+        """
+        bloques = sorted(self.evaluar(genes), key=lambda b: b[0])
+        return concatenar_resultados([resultado for _, resultado in bloques])
+
+    def cerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
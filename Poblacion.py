@@ -0,0 +1,247 @@
+# Simulador vectorizado de poblaciones de hormigas.
+# Avanza N hormigas a la vez con operaciones de NumPy, con los mismos
+# resultados que HormigaGenetica.mover aplicado hormiga por hormiga.
+
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from Hormiga import HormigaGenetica
+from Laberinto import VACIO, AZUCAR, VINO, VENENO, META, Laberinto
+
+
+class ResultadoPoblacion:
+    """
+    Estado final de una población simulada. Cada atributo es un arreglo con
+    un valor por hormiga.
+
+    Atributos:
+    ----------
+    x, y : np.ndarray
+        Posición final de cada hormiga.
+    pasos, puntos, alcohol : np.ndarray
+        Contadores finales de cada hormiga.
+    viva, llego_meta : np.ndarray
+        Estado final de cada hormiga.
+    aptitud : np.ndarray
+        Aptitud calculada como en HormigaGenetica.calcular_aptitud.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, pasos: np.ndarray,
+                 puntos: np.ndarray, alcohol: np.ndarray, viva: np.ndarray,
+                 llego_meta: np.ndarray, aptitud: np.ndarray):
+        self.x = x
+        self.y = y
+        self.pasos = pasos
+        self.puntos = puntos
+        self.alcohol = alcohol
+        self.viva = viva
+        self.llego_meta = llego_meta
+        self.aptitud = aptitud
+
+    def __len__(self) -> int:
+        return len(self.aptitud)
+
+    def aplicar(self, i: int, hormiga: HormigaGenetica):
+        """
+        Copia el estado final de la hormiga i de la población en `hormiga`.
+        """
+        hormiga.x = int(self.x[i])
+        hormiga.y = int(self.y[i])
+        hormiga.pasos = int(self.pasos[i])
+        hormiga.gen_actual = hormiga.pasos % len(hormiga.genes)
+        hormiga.puntos = int(self.puntos[i])
+        hormiga.alcohol = int(self.alcohol[i])
+        hormiga.viva = bool(self.viva[i])
+        hormiga.llego_meta = bool(self.llego_meta[i])
+        hormiga.aptitud = int(self.aptitud[i])
+
+
+class SimuladorPoblacion:
+    """
+    Simula una población completa de hormigas sobre el mismo laberinto.
+
+    Todas las hormigas vivas están siempre en el mismo paso, así que en cada
+    tic se lee una sola columna de la matriz de genes y se actualizan todas las
+    posiciones con una operación vectorizada. Cada hormiga consume su propia
+    copia del azúcar ('A') y del vino ('V'), guardada como un conjunto de bits
+    por hormiga sobre las celdas consumibles.
+
+    Al comienzo de cada vuelta de los genes se detectan las hormigas que
+    repiten un estado anterior y se saltan sus ciclos, con las mismas reglas
+    que DetectorEstancamiento; el resultado es el de la simulación completa.
+
+    Atributos:
+    ----------
+    pasos_evitados : int
+        Pasos que no se simularon por ciclos saltados.
+
+    Métodos:
+    --------
+    simular(genes: np.ndarray, pos_meta: Tuple[int, int]) -> ResultadoPoblacion:
+        Simula todas las hormigas hasta que terminan y calcula su aptitud.
+    """
+
+    def __init__(self, laberinto: Union[Laberinto, List[List[str]]],
+                 pos_inicial: Tuple[int, int] = (0, 0), pasos_maximos: int = 200,
+                 distancias: Optional[np.ndarray] = None):
+        """
+        Parámetros:
+        -----------
+        laberinto : Union[Laberinto, List[List[str]]]
+            Laberinto a simular. No se modifica.
+        pos_inicial : Tuple[int, int]
+            Posición de salida de todas las hormigas.
+        pasos_maximos : int
+            Límite de pasos de cada hormiga, como HormigaGenetica.pasos_maximos.
+        distancias : Optional[np.ndarray]
+            Matriz de pasos hasta la meta (CampoDistancias) usada en la aptitud;
+            si no se indica, se usa la distancia Manhattan.
+        """
+        if not isinstance(laberinto, Laberinto):
+            laberinto = Laberinto.desde_lista(laberinto)
+        # Copia de las tablas compiladas del laberinto en el momento de crear el simulador
+        self.tipos = laberinto.tipos.copy()
+        self.siguiente = laberinto.siguiente.copy()
+        self.columnas = laberinto.columnas
+        self.pos_inicial = pos_inicial
+        self.pasos_maximos = pasos_maximos
+        self.distancias = distancias
+        self.pasos_evitados = 0
+
+        # Índice compacto de cada celda consumible (-1 si la celda no lo es)
+        consumible = (self.tipos == AZUCAR) | (self.tipos == VINO)
+        self.n_consumibles = int(consumible.sum())
+        self.id_consumible = np.full(len(self.tipos), -1, dtype=np.int32)
+        self.id_consumible[consumible] = np.arange(self.n_consumibles, dtype=np.int32)
+
+    def simular(self, genes: np.ndarray, pos_meta: Tuple[int, int]) -> ResultadoPoblacion:
+        """
+        Simula cada fila de `genes` como una hormiga independiente.
+
+        Parámetros:
+        -----------
+        genes : np.ndarray
+            Matriz (N, L) de genes con valores entre 0 y 3.
+        pos_meta : Tuple[int, int]
+            Posición de la meta, para calcular la aptitud.
+
+        Retorna:
+        --------
+        ResultadoPoblacion:
+            Estado final y aptitud de cada hormiga.
+        """
+        genes = np.asarray(genes)
+        n, largo = genes.shape
+
+        inicial = self.pos_inicial[0] * self.columnas + self.pos_inicial[1]
+        celda = np.full(n, inicial, dtype=np.int64)
+        pasos = np.zeros(n, dtype=np.int64)
+        puntos = np.zeros(n, dtype=np.int64)
+        alcohol = np.zeros(n, dtype=np.int64)
+        viva = np.ones(n, dtype=bool)
+        llego_meta = np.zeros(n, dtype=bool)
+        # Un bit por celda consumible y por hormiga
+        consumidos = np.zeros((n, (self.n_consumibles + 7) // 8), dtype=np.uint8)
+
+        # Ciclos: estados al comienzo de cada vuelta y límite de pasos propio de
+        # cada hormiga, que baja cuando se saltan sus ciclos
+        ciclos = self.pasos_maximos > largo
+        vueltas = []
+        limite = np.full(n, self.pasos_maximos, dtype=np.int64)
+
+        activas = np.arange(n)  # Hormigas que siguen moviéndose
+        for paso in range(self.pasos_maximos):
+            if ciclos:
+                activas = activas[limite[activas] > paso]
+                if paso % largo == 0:
+                    self._saltar_ciclos(paso, activas, celda, consumidos, vueltas, limite, pasos)
+                    activas = activas[limite[activas] > paso]
+            if len(activas) == 0:
+                break
+
+            # Todas las hormigas activas usan el mismo gen en este paso
+            origen = celda[activas]
+            destino = self.siguiente[origen, genes[activas, paso % largo]]
+
+            # Las que chocan con una pared o el borde se quedan en su celda
+            se_mueve = destino != origen
+            moviles = activas[se_mueve]
+            destino = destino[se_mueve]
+            celda[moviles] = destino
+            tipo = self.tipos[destino]
+
+            # El azúcar y el vino ya consumidos por cada hormiga cuentan como vacíos
+            cid = self.id_consumible[destino]
+            byte, bit = cid >> 3, (1 << (cid & 7)).astype(np.uint8)
+            es_consumible = cid >= 0
+            ya_consumido = np.zeros(len(moviles), dtype=bool)
+            ya_consumido[es_consumible] = (consumidos[moviles[es_consumible], byte[es_consumible]]
+                                           & bit[es_consumible]) != 0
+            tipo[ya_consumido] = VACIO
+
+            come = tipo == AZUCAR
+            puntos[moviles[come]] += 10
+
+            bebe = tipo == VINO
+            alcohol[moviles[bebe]] += 5
+
+            # Cada hormiga ocupa una sola celda, así que no hay índices repetidos
+            consume = come | bebe
+            consumidos[moviles[consume], byte[consume]] |= bit[consume]
+
+            muere = tipo == VENENO
+            viva[moviles[muere]] = False
+
+            llega = tipo == META
+            llego_meta[moviles[llega]] = True
+            puntos[moviles[llega]] += 100
+
+            # El veneno y la meta terminan la simulación sin contar el paso
+            termina = np.zeros(len(activas), dtype=bool)
+            termina[np.flatnonzero(se_mueve)[muere | llega]] = True
+            activas = activas[~termina]
+            pasos[activas] += 1
+
+        x, y = np.divmod(celda, self.columnas)
+        aptitud = self.calcular_aptitud(x, y, puntos, alcohol, viva, llego_meta, pos_meta,
+                                        self.distancias)
+        return ResultadoPoblacion(x, y, pasos, puntos, alcohol, viva, llego_meta, aptitud)
+
+    def _saltar_ciclos(self, paso: int, activas: np.ndarray, celda: np.ndarray,
+                       consumidos: np.ndarray, vueltas: list, limite: np.ndarray,
+                       pasos: np.ndarray):
+        """
+        Al comienzo de una vuelta de los genes, compara el estado de cada
+        hormiga activa con los de las vueltas anteriores. Las que lo repiten
+        avanzan todos los ciclos completos que caben antes de su límite.
+        """
+        pendientes = activas
+        for paso_anterior, celda_anterior, consumidos_anterior in reversed(vueltas):
+            if len(pendientes) == 0:
+                break
+            repite = ((celda_anterior[pendientes] == celda[pendientes]) &
+                      (consumidos_anterior[pendientes] == consumidos[pendientes]).all(axis=1))
+            ciclicas = pendientes[repite]
+            periodo = paso - paso_anterior
+            saltados = (limite[ciclicas] - paso) // periodo * periodo
+            limite[ciclicas] -= saltados
+            pasos[ciclicas] += saltados
+            self.pasos_evitados += int(saltados.sum())
+            pendientes = pendientes[~repite]
+        vueltas.append((paso, celda.copy(), consumidos.copy()))
+
+    @staticmethod
+    def calcular_aptitud(x: np.ndarray, y: np.ndarray, puntos: np.ndarray,
+                         alcohol: np.ndarray, viva: np.ndarray, llego_meta: np.ndarray,
+                         pos_meta: Tuple[int, int],
+                         distancias: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Versión vectorizada de HormigaGenetica.calcular_aptitud.
+        """
+        if distancias is not None:
+            distancia = distancias[x, y].astype(np.int64)
+        else:
+            distancia = np.abs(x - pos_meta[0]) + np.abs(y - pos_meta[1])
+        aptitud = 1000 - distancia * 10 + puntos * 2 - alcohol * 5
+        aptitud += np.where(llego_meta, 2000 + np.where(alcohol == 0, 1000, 0), 0)
+        aptitud -= np.where(~llego_meta & ~viva, 500, 0)
+        return aptitud
@@ -1,78 +1,241 @@
-class RegistroGeneracion:
-    """
-    Clase para representar y almacenar los datos de una generación en la simulación.
-
-    Atributos:
-    ----------
-    generacion : int
-        Número identificador de la generación.
-    pasos : int
-        Número de pasos realizados en esta generación.
-    puntos : int
-        Puntuación obtenida en esta generación.
-    alcohol : int
-        Nivel de alcohol registrado en esta generación.
-    llego_meta : bool
-        Indicador de si se llegó a la meta en esta generación (True si se llegó, False si no).
-    tiempo_total : float
-        Tiempo total en segundos que tomó esta generación.
-
-    Métodos:
-    --------
-    to_string() -> str:
-        Devuelve una representación en texto del registro de la generación,
-        formateada con todos los datos relevantes de la instancia.
-    """
-
-    def __init__(self, generacion: int, pasos: int, puntos: int, alcohol: int, 
-                 llego_meta: bool, tiempo_total: float):
-        """
-        Inicializa una instancia de RegistroGeneracion con los datos específicos de una generación.
-
-        Parámetros:
-        -----------
-        generacion : int
-            El número de la generación.
-        pasos : int
-            Número de pasos realizados en esta generación.
-        puntos : int
-            Puntuación obtenida en esta generación.
-        alcohol : int
-            Nivel de alcohol registrado.
-        llego_meta : bool
-            Indicador de si se alcanzó la meta en esta generación.
-        tiempo_total : float
-            Tiempo total en segundos para completar la generación.
-        """
-        self.generacion = generacion
-        self.pasos = pasos
-        self.puntos = puntos
-        self.alcohol = alcohol
-        self.llego_meta = llego_meta
-        self.tiempo_total = tiempo_total
-
-    def to_string(self) -> str:
-        """
-        Devuelve una representación en texto de la instancia, formateada y detallada.
-
-        Retorna:
-        --------
-        str:
-            Cadena de texto con toda la información del registro de la generación,
-            incluyendo los pasos, puntos, nivel de alcohol, si se llegó a la meta y el tiempo total.
-
-        Ejemplo de retorno:
-        -------------------
-        "Generación: 1
-        Pasos: 100
-        Puntos: 50
-        Alcohol: 10
-        Llegó a la meta: Sí
-        Tiempo total: 15.30 segundos"
-        """
-        return (f"Generación: {self.generacion}\n"
-                f"Pasos: {self.pasos}\n"
-                f"Puntos: {self.puntos}\n"
-                f"Alcohol: {self.alcohol}\n"
-                f"Llegó a la meta: {'Sí' if self.llego_meta else 'No'}\n"
-                f"Tiempo total: {self.tiempo_total:.2f} segundos\n")
+from typing import Iterator, Optional
+import numpy as np
+
+# Tipo estructurado de NumPy con los campos de un registro, en el orden del constructor
+DTYPE_REGISTRO = np.dtype([
+    ('generacion', '<i8'),
+    ('pasos', '<i4'),
+    ('puntos', '<i4'),
+    ('alcohol', '<i4'),
+    ('llego_meta', '?'),
+    ('tiempo_total', '<f8'),
+])
+
+# Resumen de un bloque de generaciones consecutivas del historial circular
+DTYPE_RESUMEN = np.dtype([
+    ('generacion_inicio', '<i8'),
+    ('generacion_fin', '<i8'),
+    ('pasos_media', '<f8'),
+    ('puntos_media', '<f8'),
+    ('puntos_max', '<i4'),
+    ('alcohol_media', '<f8'),
+    ('metas', '<i8'),
+    ('tiempo_total', '<f8'),
+])
+
+
+class RegistroGeneracion:
+    """
+    Clase para representar y almacenar los datos de una generación en la simulación.
+
+    Atributos:
+    ----------
+    generacion : int
+        Número identificador de la generación.
+    pasos : int
+        Número de pasos realizados en esta generación.
+    puntos : int
+        Puntuación obtenida en esta generación.
+    alcohol : int
+        Nivel de alcohol registrado en esta generación.
+    llego_meta : bool
+        Indicador de si se llegó a la meta en esta generación (True si se llegó, False si no).
+    tiempo_total : float
+        Tiempo total en segundos que tomó esta generación.
+
+    Métodos:
+    --------
+    to_string() -> str:
+        Devuelve una representación en texto del registro de la generación,
+        formateada con todos los datos relevantes de la instancia.
+    a_tupla() -> tuple:
+        Devuelve los campos del registro en el orden de DTYPE_REGISTRO.
+    desde_fila(fila) -> RegistroGeneracion:
+        Crea un registro a partir de una fila de un arreglo con DTYPE_REGISTRO.
+    """
+
+    __slots__ = ('generacion', 'pasos', 'puntos', 'alcohol', 'llego_meta', 'tiempo_total')
+
+    def __init__(self, generacion: int, pasos: int, puntos: int, alcohol: int, 
+                 llego_meta: bool, tiempo_total: float):
+        """
+        Inicializa una instancia de RegistroGeneracion con los datos específicos de una generación.
+
+        Parámetros:
+        -----------
+        generacion : int
+            El número de la generación.
+        pasos : int
+            Número de pasos realizados en esta generación.
+        puntos : int
+            Puntuación obtenida en esta generación.
+        alcohol : int
+            Nivel de alcohol registrado.
+        llego_meta : bool
+            Indicador de si se alcanzó la meta en esta generación.
+        tiempo_total : float
+            Tiempo total en segundos para completar la generación.
+        """
+        self.generacion = generacion
+        self.pasos = pasos
+        self.puntos = puntos
+        self.alcohol = alcohol
+        self.llego_meta = llego_meta
+        self.tiempo_total = tiempo_total
+
+    def to_string(self) -> str:
+        """
+        Devuelve una representación en texto de la instancia, formateada y detallada.
+
+        Retorna:
+        --------
+        str:
+            Cadena de texto con toda la información del registro de la generación,
+            incluyendo los pasos, puntos, nivel de alcohol, si se llegó a la meta y el tiempo total.
+
+        Ejemplo de retorno:
+        -------------------
+        "Generación: 1
+        Pasos: 100
+        Puntos: 50
+        Alcohol: 10
+        Llegó a la meta: Sí
+        Tiempo total: 15.30 segundos"
+        """
+        return (f"Generación: {self.generacion}\n"
+                f"Pasos: {self.pasos}\n"
+                f"Puntos: {self.puntos}\n"
+                f"Alcohol: {self.alcohol}\n"
+                f"Llegó a la meta: {'Sí' if self.llego_meta else 'No'}\n"
+                f"Tiempo total: {self.tiempo_total:.2f} segundos\n")
+
+    def a_tupla(self) -> tuple:
+        """
+        Devuelve los campos del registro en el orden de DTYPE_REGISTRO, listos
+        para guardarse en un arreglo estructurado o en una tabla.
+        """
+        return (self.generacion, self.pasos, self.puntos, self.alcohol,
+                bool(self.llego_meta), self.tiempo_total)
+
+    @classmethod
+    def desde_fila(cls, fila: np.void) -> 'RegistroGeneracion':
+        """
+        Crea un registro a partir de una fila de un arreglo con DTYPE_REGISTRO.
+        """
+        return cls(int(fila['generacion']), int(fila['pasos']), int(fila['puntos']),
+                   int(fila['alcohol']), bool(fila['llego_meta']), float(fila['tiempo_total']))
+
+
+class HistorialGeneraciones:
+    """
+    Historial de generaciones guardado en un arreglo estructurado de NumPy.
+
+    Por defecto conserva todas las generaciones y duplica su capacidad cuando
+    se llena. Con `ultimas` funciona como búfer circular: conserva solo las
+    últimas generaciones y, cada `intervalo_resumen` generaciones, guarda una
+    fila de resumen (DTYPE_RESUMEN), así que la memoria queda prácticamente fija.
+
+    Atributos:
+    ----------
+    total : int
+        Generaciones agregadas desde que se creó el historial.
+    resumenes : np.ndarray
+        Resúmenes de los bloques de generaciones ya completados (modo circular).
+
+    Métodos:
+    --------
+    append(registro: RegistroGeneracion):
+        Agrega un registro al final del historial.
+    arreglo() -> np.ndarray:
+        Devuelve las generaciones conservadas, en orden, como arreglo estructurado.
+    desde_arreglo(arreglo, total, ultimas, intervalo_resumen, resumenes) -> HistorialGeneraciones:
+        Reconstruye un historial a partir de lo que devolvió `arreglo()`.
+    """
+
+    def __init__(self, capacidad_inicial: int = 1024, ultimas: Optional[int] = None,
+                 intervalo_resumen: int = 1000):
+        """
+        Parámetros:
+        -----------
+        capacidad_inicial : int
+            Filas reservadas al principio (modo sin límite).
+        ultimas : Optional[int]
+            Si se indica, número de generaciones que se conservan.
+        intervalo_resumen : int
+            Generaciones por fila de resumen en el modo circular; no se guardan
+            resúmenes si es mayor que `ultimas`.
+        """
+        self.ultimas = ultimas
+        self.intervalo_resumen = intervalo_resumen
+        self._datos = np.empty(ultimas if ultimas else capacidad_inicial, dtype=DTYPE_REGISTRO)
+        self.total = 0
+        self.resumenes = np.empty(0, dtype=DTYPE_RESUMEN)
+
+    @classmethod
+    def desde_arreglo(cls, arreglo: np.ndarray, total: int, ultimas: Optional[int] = None,
+                      intervalo_resumen: int = 1000,
+                      resumenes: Optional[np.ndarray] = None) -> 'HistorialGeneraciones':
+        """
+        Reconstruye un historial guardado con `arreglo()`. `total` es la
+        cantidad de generaciones agregadas, que en el modo circular puede ser
+        mayor que las filas conservadas.
+        """
+        nuevo = cls(max(len(arreglo), 1024), ultimas, intervalo_resumen)
+        if ultimas:
+            # Cada generación vuelve a la posición que ocupaba en el búfer circular
+            nuevo._datos[np.arange(total - len(arreglo), total) % ultimas] = arreglo
+        else:
+            nuevo._datos[:len(arreglo)] = arreglo
+        nuevo.total = total
+        if resumenes is not None:
+            nuevo.resumenes = resumenes.astype(DTYPE_RESUMEN)
+        return nuevo
+
+    def __len__(self) -> int:
+        return min(self.total, len(self._datos)) if self.ultimas else self.total
+
+    def append(self, registro: RegistroGeneracion):
+        if self.ultimas:
+            self._datos[self.total % self.ultimas] = registro.a_tupla()
+            self.total += 1
+            if self.total % self.intervalo_resumen == 0 and self.intervalo_resumen <= self.ultimas:
+                self._resumir()
+            return
+
+        if self.total == len(self._datos):
+            datos = np.empty(2 * len(self._datos), dtype=DTYPE_REGISTRO)
+            datos[:self.total] = self._datos
+            self._datos = datos
+        self._datos[self.total] = registro.a_tupla()
+        self.total += 1
+
+    def arreglo(self) -> np.ndarray:
+        if not self.ultimas or self.total <= self.ultimas:
+            return self._datos[:len(self)]
+        inicio = self.total % self.ultimas
+        return np.concatenate((self._datos[inicio:], self._datos[:inicio]))
+
+    def __getitem__(self, indice: int) -> RegistroGeneracion:
+        largo = len(self)
+        if indice < 0:
+            indice += largo
+        if not 0 <= indice < largo:
+            raise IndexError("índice fuera del historial")
+        if self.ultimas and self.total > self.ultimas:
+            indice = (self.total + indice) % self.ultimas
+        return RegistroGeneracion.desde_fila(self._datos[indice])
+
+    def __iter__(self) -> Iterator[RegistroGeneracion]:
+        for fila in self.arreglo():
+            yield RegistroGeneracion.desde_fila(fila)
+
+    def _resumir(self):
+        # Las últimas `intervalo_resumen` filas del búfer forman el bloque recién completado
+        posiciones = np.arange(self.total - self.intervalo_resumen, self.total) % self.ultimas
+        bloque = self._datos[posiciones]
+        resumen = np.array([(
+            bloque['generacion'][0], bloque['generacion'][-1],
+            bloque['pasos'].mean(), bloque['puntos'].mean(), bloque['puntos'].max(),
+            bloque['alcohol'].mean(), bloque['llego_meta'].sum(), bloque['tiempo_total'][-1]
+        )], dtype=DTYPE_RESUMEN)
+        self.resumenes = np.concatenate((self.resumenes, resumen))
@@ -0,0 +1,273 @@
+# Pruebas de rendimiento de la simulación, sin interfaz gráfica.
+# Mide los caminos más usados (mover, calcular_aptitud, mutar, evolucionar,
+# guardar_estadisticas y el campo de distancias) y una evolución completa sobre
+# laberintos generados al azar, y guarda los resultados en JSON para
+# compararlos entre versiones.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from AlgoritmoGenetico import AlgoritmoGenetico
+from Distancias import CampoDistancias
+from Hormiga import HormigaGenetica
+from Laberinto import ROCA, Laberinto
+from Motor import MotorEvolucion, evaluar_hormiga
+from Registro import RegistroGeneracion
+
+
+def medir(operacion: Callable[[], int], segundos: float, repeticiones: int = 3) -> float:
+    """
+    Ejecuta `operacion` (que retorna cuántas unidades de trabajo hizo) durante
+    al menos `segundos`, `repeticiones` veces, y retorna el mejor ritmo en
+    unidades por segundo. Quedarse con el mejor reduce el ruido del sistema.
+    """
+    mejor = 0.0
+    for _ in range(repeticiones):
+        unidades = 0
+        inicio = time.perf_counter()
+        while True:
+            unidades += operacion()
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido >= segundos:
+                break
+        mejor = max(mejor, unidades / transcurrido)
+    return mejor
+
+
+def _hormiga(largo: int, rng: np.random.Generator) -> HormigaGenetica:
+    hormiga = HormigaGenetica(0, 0)
+    hormiga.genes = rng.integers(0, 4, size=largo)
+    return hormiga
+
+
+def medir_mover(laberinto: Laberinto, largo: int, segundos: float, semilla: int) -> Dict[str, float]:
+    """
+    Simula hormigas completas con `mover` y retorna pasos/s y evaluaciones/s.
+    """
+    rng = np.random.default_rng(semilla)
+    hormigas = [_hormiga(largo, rng) for _ in range(64)]
+    vista = laberinto.vista()
+    pos_meta = laberinto.buscar('M')
+    contador = {'pasos': 0, 'evaluaciones': 0}
+    indice = [0]
+
+    def operacion():
+        hormiga = hormigas[indice[0] % len(hormigas)]
+        indice[0] += 1
+        evaluar_hormiga(hormiga, vista, pos_meta)
+        contador['pasos'] += hormiga.pasos
+        contador['evaluaciones'] += 1
+        return 1
+
+    evaluaciones = medir(operacion, segundos)
+    pasos_por_evaluacion = contador['pasos'] / contador['evaluaciones']
+    return {'pasos/s': evaluaciones * pasos_por_evaluacion, 'evaluaciones/s': evaluaciones}
+
+
+def medir_calcular_aptitud(segundos: float, distancias: Optional[np.ndarray] = None) -> Dict[str, float]:
+    hormiga = HormigaGenetica(0, 0)
+    pos_meta = (9, 9)
+
+    def operacion():
+        for _ in range(1000):
+            hormiga.calcular_aptitud(pos_meta, distancias)
+        return 1000
+
+    return {'llamadas/s': medir(operacion, segundos)}
+
+
+def medir_distancias(laberinto: Laberinto, segundos: float) -> Dict[str, float]:
+    """
+    Mide el cálculo completo del campo de distancias y su actualización
+    incremental cuando se quitan paredes, una por vez.
+    """
+    def completo():
+        CampoDistancias(laberinto).matriz()
+        return 1
+
+    resultado = {'completos/s': medir(completo, segundos)}
+    copia = Laberinto.desde_lista(laberinto.a_lista())
+    campo = CampoDistancias(copia)
+    campo.matriz()
+    rocas = np.argwhere(copia.celdas == ROCA)[:100]
+    if len(rocas):
+        inicio = time.perf_counter()
+        for x, y in rocas:
+            copia.colocar(x, y, '.')
+            campo.matriz()
+        resultado['incrementales/s'] = len(rocas) / (time.perf_counter() - inicio)
+    return resultado
+
+
+def medir_mutar(largo: int, segundos: float, semilla: int) -> Dict[str, float]:
+    random.seed(semilla)
+    ag = AlgoritmoGenetico(os.devnull)  # mutar no escribe estadísticas
+    genes = np.random.default_rng(semilla).integers(0, 4, size=largo)
+
+    def operacion():
+        ag.mutar(genes)
+        return 1
+
+    mutaciones = medir(operacion, segundos)
+    return {'mutaciones/s': mutaciones, 'genes/s': mutaciones * largo}
+
+
+def medir_evolucionar(largo: int, segundos: float, semilla: int, directorio: str) -> Dict[str, float]:
+    """
+    Mide `evolucionar` solo (registro, selección, mutación y envío al sumidero),
+    sin simular a las hormigas.
+    """
+    random.seed(semilla)
+    ag = AlgoritmoGenetico(os.path.join(directorio, 'evolucionar.npy'))
+    ag.inicializar()
+    ag.hormiga_actual.genes = np.random.default_rng(semilla).integers(0, 4, size=largo)
+
+    def operacion():
+        for _ in range(100):
+            ag.evolucionar()
+        return 100
+
+    generaciones = medir(operacion, segundos)
+    ag.sumidero.cerrar()
+    return {'generaciones/s': generaciones}
+
+
+def medir_guardar_estadisticas(extension: str, segundos: float, directorio: str) -> Dict[str, float]:
+    ag = AlgoritmoGenetico(os.path.join(directorio, 'guardar' + extension))
+    ag.inicializar()
+    registro = RegistroGeneracion(1, 200, 30, 2, False, 1.5)
+
+    def operacion():
+        for _ in range(1000):
+            ag.guardar_estadisticas(registro)
+        return 1000
+
+    registros = medir(operacion, segundos)
+    ag.sumidero.cerrar()
+    return {'registros/s': registros}
+
+
+def medir_evolucion_completa(laberinto: Laberinto, segundos: float, semilla: int,
+                             directorio: str) -> Dict[str, float]:
+    """
+    Ejecuta el motor (1+1) durante `segundos` y retorna generaciones/s y pasos/s.
+    """
+    motor = MotorEvolucion(laberinto, semilla, os.path.join(directorio, 'motor.npy'))
+    resultado = motor.ejecutar(segundos=segundos)
+    pasos = (resultado.contadores or {}).get('pasos_simulados', 0)
+    return {'generaciones/s': resultado.generaciones / resultado.segundos,
+            'pasos/s': pasos / resultado.segundos}
+
+
+def ejecutar_pruebas(tamaños: List[int], densidades: List[float], largos: List[int],
+                     segundos: float = 0.2, semilla: int = 0) -> Dict:
+    """
+    Ejecuta todas las pruebas y retorna un diccionario listo para guardar en JSON.
+
+    Cada resultado se identifica con un nombre como
+    'mover/tamaño=50/densidad=0.2/largo=200' y contiene sus métricas.
+    """
+    resultados: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados['calcular_aptitud'] = medir_calcular_aptitud(segundos)
+        resultados['calcular_aptitud/distancias'] = medir_calcular_aptitud(
+            segundos, CampoDistancias(Laberinto.aleatorio(10, semilla=semilla)).matriz())
+        for largo in largos:
+            resultados[f'mutar/largo={largo}'] = medir_mutar(largo, segundos, semilla)
+            resultados[f'evolucionar/largo={largo}'] = medir_evolucionar(largo, segundos, semilla,
+                                                                         directorio)
+        for extension in ('.txt', '.db', '.npy'):
+            resultados[f'guardar_estadisticas/{extension[1:]}'] = medir_guardar_estadisticas(
+                extension, segundos, directorio)
+
+        for tamaño in tamaños:
+            for densidad in densidades:
+                laberinto = Laberinto.aleatorio(tamaño, densidad=densidad, semilla=semilla)
+                for largo in largos:
+                    resultados[f'mover/tamaño={tamaño}/densidad={densidad}/largo={largo}'] = \
+                        medir_mover(laberinto, largo, segundos, semilla)
+                resultados[f'distancias/tamaño={tamaño}/densidad={densidad}'] = \
+                    medir_distancias(laberinto, segundos)
+                resultados[f'evolucion/tamaño={tamaño}/densidad={densidad}'] = \
+                    medir_evolucion_completa(laberinto, segundos, semilla, directorio)
+
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'entorno': {'python': platform.python_version(), 'numpy': np.__version__,
+                    'plataforma': platform.platform(), 'procesador': platform.processor()},
+        'parametros': {'tamaños': tamaños, 'densidades': densidades, 'largos': largos,
+                       'segundos': segundos, 'semilla': semilla},
+        'resultados': resultados,
+    }
+
+
+def comparar(base: Dict, actual: Dict, tolerancia: float = 0.1) -> List[str]:
+    """
+    Compara dos ejecuciones y retorna las líneas de un informe. Las métricas
+    que bajaron más de `tolerancia` (fracción) se marcan como REGRESIÓN.
+    """
+    lineas = []
+    for nombre, metricas in actual['resultados'].items():
+        anteriores = base['resultados'].get(nombre)
+        if anteriores is None:
+            continue
+        for metrica, valor in metricas.items():
+            anterior = anteriores.get(metrica)
+            if not anterior:
+                continue
+            razon = valor / anterior
+            marca = ' REGRESIÓN' if razon < 1 - tolerancia else ''
+            lineas.append(f"{nombre} [{metrica}]: {anterior:,.0f} -> {valor:,.0f} ({razon:.2f}x){marca}")
+    return lineas
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Punto de entrada de línea de comandos. Con `--comparar` termina con código 1
+    si alguna métrica empeoró más que la tolerancia.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mide el rendimiento de la simulación sin interfaz gráfica.")
+    parser.add_argument('--tamaños', type=int, nargs='+', default=[10, 50, 200],
+                        help="Lados de los laberintos generados")
+    parser.add_argument('--densidades', type=float, nargs='+', default=[0.1, 0.3],
+                        help="Fracciones de rocas de los laberintos")
+    parser.add_argument('--largos', type=int, nargs='+', default=[50, 200, 1000],
+                        help="Largos de genoma")
+    parser.add_argument('--segundos', type=float, default=0.2,
+                        help="Duración mínima de cada medición")
+    parser.add_argument('--semilla', type=int, default=0, help="Semilla aleatoria")
+    parser.add_argument('--salida', default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', default=None, help="JSON de una ejecución anterior")
+    parser.add_argument('--tolerancia', type=float, default=0.1,
+                        help="Caída relativa aceptada antes de marcar una regresión")
+    args = parser.parse_args(argv)
+
+    informe = ejecutar_pruebas(args.tamaños, args.densidades, args.largos, args.segundos, args.semilla)
+    for nombre, metricas in informe['resultados'].items():
+        print(f"{nombre}: " + " | ".join(f"{valor:,.0f} {metrica}" for metrica, valor in metricas.items()))
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(informe, f, indent=2, ensure_ascii=False)
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            base = json.load(f)
+        lineas = comparar(base, informe, args.tolerancia)
+        print("\nComparación con", args.comparar)
+        print("\n".join(lineas))
+        if any(linea.endswith('REGRESIÓN') for linea in lineas):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
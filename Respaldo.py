@@ -0,0 +1,137 @@
+# Respaldos del estado de una evolución.
+# Guardan en un único archivo .npz todo lo necesario para continuar una
+# evolución exactamente donde quedó: genes, historial, contadores y el estado
+# de los generadores aleatorios. La escritura es atómica (archivo temporal y
+# os.replace), así que si el proceso muere a mitad de un respaldo el anterior
+# sigue intacto.
+
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Union
+import numpy as np
+from AlgoritmoGenetico import AlgoritmoGenetico
+from AlgoritmoPoblacion import AlgoritmoPoblacion
+from Genoma import desempaquetar, empaquetar
+from Hormiga import HormigaGenetica
+from Registro import HistorialGeneraciones
+
+FORMATO = 2  # Versión del formato del respaldo (1: genes sin empaquetar)
+
+Algoritmo = Union[AlgoritmoGenetico, AlgoritmoPoblacion]
+
+
+def guardar_respaldo(ruta: str, ag: Algoritmo, **extra):
+    """
+    Guarda el estado de `ag` y de los generadores aleatorios globales.
+
+    También vacía el sumidero de estadísticas y anota hasta dónde llegó, para
+    que al reanudar el archivo de estadísticas quede exactamente al día con
+    el respaldo.
+
+    Parámetros:
+    -----------
+    ruta : str
+        Archivo del respaldo; se reemplaza el anterior.
+    ag : AlgoritmoGenetico o AlgoritmoPoblacion
+        Algoritmo a respaldar, entre dos generaciones.
+    **extra :
+        Valores del llamador que se devuelven al reanudar (números, textos o
+        None), por ejemplo las evaluaciones realizadas.
+    """
+    version_random, claves_random, gauss_random = random.getstate()
+    _, claves_np, posicion_np, tiene_gauss_np, gauss_np = np.random.get_state()
+    historial = ag.registros
+    if isinstance(ag, AlgoritmoPoblacion):
+        genes = ag.genes
+    else:
+        genes = ag.hormiga_actual.genes
+    metadatos = {
+        'formato': FORMATO,
+        'largo_genes': genes.shape[-1],
+        'algoritmo': type(ag).__name__,
+        'generacion': ag.generacion,
+        'tasa_mutacion': ag.tasa_mutacion,
+        'mejor_aptitud': np.asarray(ag.mejor_hormiga.aptitud).item() if ag.mejor_hormiga else None,
+        'segundos': (datetime.now() - ag.tiempo_inicio).total_seconds(),
+        'marca_sumidero': ag.sumidero.marca(),
+        'historial': [historial.total, historial.ultimas, historial.intervalo_resumen],
+        'random': [version_random, gauss_random],
+        'np_random': [int(posicion_np), int(tiene_gauss_np), float(gauss_np)],
+        'rng': ag.rng.bit_generator.state if isinstance(ag, AlgoritmoPoblacion) else None,
+        'extra': extra,
+    }
+    arreglos = {
+        'metadatos': np.frombuffer(json.dumps(metadatos).encode('utf-8'), dtype=np.uint8),
+        'claves_random': np.array(claves_random, dtype=np.uint32),
+        'claves_np': claves_np,
+        'registros': historial.arreglo(),
+        'resumenes': historial.resumenes,
+        'genes': empaquetar(genes),  # Cuatro genes por byte (Genoma.py)
+    }
+    if ag.mejor_hormiga is not None:
+        arreglos['mejor_genes'] = empaquetar(ag.mejor_hormiga.genes)
+
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as f:
+        np.savez_compressed(f, **arreglos)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def cargar_respaldo(ruta: str, ag: Algoritmo) -> dict:
+    """
+    Restaura en `ag` el estado guardado por `guardar_respaldo`, incluidos los
+    generadores aleatorios, y prepara su sumidero para seguir agregando
+    estadísticas sin borrar las anteriores. Reemplaza a `ag.inicializar()`.
+
+    Retorna:
+    --------
+    dict:
+        Los valores `extra` que se pasaron al guardar el respaldo.
+    """
+    with np.load(ruta, allow_pickle=False) as datos:
+        arreglos = {nombre: datos[nombre] for nombre in datos.files}
+    metadatos = json.loads(arreglos['metadatos'].tobytes().decode('utf-8'))
+    if metadatos['formato'] not in (1, FORMATO):
+        raise ValueError(f"El respaldo '{ruta}' tiene un formato desconocido ({metadatos['formato']})")
+    if metadatos['formato'] > 1:
+        for nombre in ('genes', 'mejor_genes'):
+            if nombre in arreglos:
+                arreglos[nombre] = desempaquetar(arreglos[nombre], metadatos['largo_genes'])
+    if metadatos['algoritmo'] != type(ag).__name__:
+        raise ValueError(f"El respaldo '{ruta}' es de {metadatos['algoritmo']}, no de {type(ag).__name__}")
+
+    # Las hormigas se crean antes de restaurar los generadores, porque el
+    # constructor de HormigaGenetica consume números de np.random
+    if isinstance(ag, AlgoritmoPoblacion):
+        if arreglos['genes'].shape != (ag.tamaño_poblacion, ag.largo_genes):
+            raise ValueError(f"El respaldo '{ruta}' es de una población de otro tamaño")
+        ag.genes = arreglos['genes'].astype(np.uint8)
+    else:
+        ag.hormiga_actual = HormigaGenetica(0, 0)
+        ag.hormiga_actual.genes = arreglos['genes'].astype(np.uint8)
+    ag.mejor_hormiga = None
+    if 'mejor_genes' in arreglos:
+        ag.mejor_hormiga = HormigaGenetica(0, 0)
+        ag.mejor_hormiga.genes = arreglos['mejor_genes'].astype(np.uint8)
+        ag.mejor_hormiga.aptitud = metadatos['mejor_aptitud']
+
+    total, ultimas, intervalo_resumen = metadatos['historial']
+    ag.registros = HistorialGeneraciones.desde_arreglo(arreglos['registros'], total, ultimas,
+                                                       intervalo_resumen, arreglos['resumenes'])
+    ag.generacion = metadatos['generacion']
+    ag.tasa_mutacion = metadatos['tasa_mutacion']
+    # El tiempo total de las estadísticas sigue contando desde donde quedó
+    ag.tiempo_inicio = datetime.now() - timedelta(seconds=metadatos['segundos'])
+    ag.sumidero.reanudar(metadatos['marca_sumidero'])
+
+    version_random, gauss_random = metadatos['random']
+    random.setstate((version_random, tuple(arreglos['claves_random'].tolist()), gauss_random))
+    posicion_np, tiene_gauss_np, gauss_np = metadatos['np_random']
+    np.random.set_state(('MT19937', arreglos['claves_np'], posicion_np, tiene_gauss_np, gauss_np))
+    if metadatos['rng'] is not None:
+        ag.rng.bit_generator.state = metadatos['rng']
+    return metadatos['extra']
@@ -0,0 +1,311 @@
+# Salón de la fama: las K mejores hormigas distintas de una evolución.
+# Cada entrada guarda el genoma empaquetado (Genoma.py) y el recorrido de la
+# hormiga codificado por diferencias, de modo que la interfaz puede volver a
+# mostrarlo paso a paso sin simular otra vez. El recorrido se registra una
+# sola vez, cuando la hormiga entra al salón, y la aptitud de la entrada se
+# calcula con ese mismo recorrido, para que la repetición siempre coincida.
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from Distancias import CampoDistancias
+from Genoma import GenomaEmpaquetado, desempaquetar, empaquetar
+from Hormiga import HormigaGenetica
+from Laberinto import DX, DY, Laberinto
+
+# Cómo terminó el recorrido
+AGOTADA = 0  # Agotó sus pasos
+MUERTA = 1   # Pisó veneno
+LLEGO = 2    # Llegó a la meta
+MOTIVOS = ('agotó sus pasos', 'murió', 'llegó a la meta')
+
+
+class Trayectoria:
+    """
+    Recorrido de una hormiga codificado por diferencias.
+
+    Por cada intento de movimiento se guarda la dirección (2 bits, la del gen
+    leído) y si la hormiga cambió de celda (1 bit; no cambia si choca con una
+    pared o el borde). Las posiciones se reconstruyen con una suma acumulada.
+
+    Atributos:
+    ----------
+    inicio : Tuple[int, int]
+        Celda de partida.
+    movimientos : int
+        Intentos de movimiento registrados.
+    direcciones : np.ndarray
+        Direcciones empaquetadas a 2 bits.
+    movio : np.ndarray
+        Bits (np.packbits) que indican si cada intento cambió de celda.
+    final : Tuple[int, int]
+        Celda donde terminó el recorrido.
+    motivo : int
+        AGOTADA, MUERTA o LLEGO.
+
+    Métodos:
+    --------
+    registrar(genes, laberinto, x, y, pasos_maximos) -> Tuple[Trayectoria, HormigaGenetica]:
+        Simula a la hormiga una vez y registra su recorrido.
+    posiciones() -> np.ndarray:
+        Celdas (movimientos + 1, 2) ocupadas después de cada intento.
+    """
+
+    __slots__ = ('inicio', 'movimientos', 'direcciones', 'movio', 'final', 'motivo')
+
+    def __init__(self, inicio: Tuple[int, int], movimientos: int, direcciones: np.ndarray,
+                 movio: np.ndarray, final: Tuple[int, int], motivo: int):
+        self.inicio = inicio
+        self.movimientos = movimientos
+        self.direcciones = direcciones
+        self.movio = movio
+        self.final = final
+        self.motivo = motivo
+
+    @classmethod
+    def registrar(cls, genes: np.ndarray, laberinto: Laberinto, x: int = 0, y: int = 0,
+                  pasos_maximos: int = 200) -> Tuple['Trayectoria', HormigaGenetica]:
+        """
+        Simula a la hormiga con `genes` desde (x, y) sobre una vista nueva del
+        laberinto y registra cada intento de movimiento. Retorna también la
+        hormiga en su estado final.
+        """
+        # Sin el constructor, que consume números de np.random y alteraría la evolución
+        hormiga = HormigaGenetica.__new__(HormigaGenetica)
+        hormiga.x_inicial, hormiga.y_inicial = x, y
+        hormiga.pasos_maximos = pasos_maximos
+        hormiga.genes = genes
+        hormiga.reiniciar()
+        vista = laberinto.vista()
+
+        direcciones = []
+        movio = []
+        while hormiga.pasos < hormiga.pasos_maximos:
+            direcciones.append(genes[hormiga.gen_actual])
+            antes = (hormiga.x, hormiga.y)
+            sigue = hormiga.mover(vista)
+            movio.append(antes != (hormiga.x, hormiga.y))
+            if not sigue or hormiga.llego_meta:
+                break
+
+        motivo = LLEGO if hormiga.llego_meta else (MUERTA if not hormiga.viva else AGOTADA)
+        trayectoria = cls((x, y), len(direcciones),
+                          empaquetar(np.array(direcciones, dtype=np.uint8)),
+                          np.packbits(np.array(movio, dtype=bool)),
+                          (hormiga.x, hormiga.y), motivo)
+        return trayectoria, hormiga
+
+    def posiciones(self) -> np.ndarray:
+        direcciones = desempaquetar(self.direcciones, self.movimientos)
+        movio = np.unpackbits(self.movio, count=self.movimientos).astype(np.int64)
+        posiciones = np.empty((self.movimientos + 1, 2), dtype=np.int64)
+        posiciones[0] = self.inicio
+        posiciones[1:, 0] = self.inicio[0] + np.cumsum(DX[direcciones] * movio)
+        posiciones[1:, 1] = self.inicio[1] + np.cumsum(DY[direcciones] * movio)
+        return posiciones
+
+    @property
+    def nbytes(self) -> int:
+        return self.direcciones.nbytes + self.movio.nbytes
+
+
+def mapa_calor(trayectorias: Sequence[Trayectoria], forma: Tuple[int, int]) -> np.ndarray:
+    """
+    Cuenta, para cada celda, cuántas veces la ocuparon los recorridos,
+    incluida la celda de partida, acumulando todas las posiciones a la vez
+    con np.add.at.
+
+    Parámetros:
+    -----------
+    trayectorias : Sequence[Trayectoria]
+        Recorridos a acumular.
+    forma : Tuple[int, int]
+        Filas y columnas del laberinto.
+    """
+    mapa = np.zeros(forma, dtype=np.int64)
+    if trayectorias:
+        posiciones = np.concatenate([t.posiciones() for t in trayectorias])
+        np.add.at(mapa, (posiciones[:, 0], posiciones[:, 1]), 1)
+    return mapa
+
+
+class EntradaSalon:
+    """
+    Una hormiga del salón de la fama.
+
+    Atributos:
+    ----------
+    genoma : GenomaEmpaquetado
+        Genes de la hormiga.
+    aptitud : float
+        Aptitud del recorrido registrado.
+    generacion : int
+        Generación en que se evaluó.
+    puntos, alcohol : int
+        Contadores al final del recorrido.
+    trayectoria : Trayectoria
+        Recorrido registrado al entrar al salón.
+    """
+
+    __slots__ = ('genoma', 'aptitud', 'generacion', 'puntos', 'alcohol', 'trayectoria')
+
+    def __init__(self, genoma: GenomaEmpaquetado, aptitud: float, generacion: int,
+                 puntos: int, alcohol: int, trayectoria: Trayectoria):
+        self.genoma = genoma
+        self.aptitud = aptitud
+        self.generacion = generacion
+        self.puntos = puntos
+        self.alcohol = alcohol
+        self.trayectoria = trayectoria
+
+    def descripcion(self) -> str:
+        return (f"Aptitud {self.aptitud:.0f} | Generación {self.generacion} | "
+                f"{MOTIVOS[self.trayectoria.motivo]} en {self.trayectoria.movimientos} movimientos")
+
+
+class SalonFama:
+    """
+    Las `capacidad` hormigas de mayor aptitud con genomas distintos.
+
+    Los genomas repetidos se descartan por su hash (GenomaEmpaquetado). Una
+    hormiga que no supera a la peor del salón lleno se rechaza sin calcular
+    el hash ni registrar su recorrido, así que ofrecer cada hormiga evaluada
+    cuesta casi nada. Las que pasan ese filtro se simulan completas para
+    registrar el recorrido, y la entrada guarda la aptitud de esa simulación,
+    no la ofrecida: así la repetición siempre termina como dice la entrada.
+
+    Las entradas se reemplazan por una lista nueva en cada cambio, de modo que
+    otro hilo puede leer `entradas` mientras la evolución ofrece hormigas.
+
+    Atributos:
+    ----------
+    capacidad : int
+        Máximo de hormigas guardadas.
+    entradas : List[EntradaSalon]
+        Hormigas del salón, de mayor a menor aptitud.
+
+    Métodos:
+    --------
+    ofrecer(genes, aptitud, generacion) -> bool:
+        Agrega la hormiga si es de las mejores y su genoma es nuevo.
+    ofrecer_poblacion(genes, aptitud, generacion) -> int:
+        Ofrece una población completa (N, L); retorna cuántas entraron.
+    mapa_calor(indices) -> np.ndarray:
+        Visitas por celda de los recorridos guardados.
+    guardar(ruta), cargar(ruta):
+        Guardan y leen el salón en un archivo .npz.
+    """
+
+    def __init__(self, capacidad: int, laberinto: Laberinto, pasos_maximos: int = 200,
+                 inicio: Tuple[int, int] = (0, 0), manhattan: bool = False):
+        if capacidad < 1:
+            raise ValueError("La capacidad del salón de la fama debe ser al menos 1")
+        self.capacidad = capacidad
+        self.laberinto = laberinto
+        self.pasos_maximos = pasos_maximos
+        self.inicio = inicio
+        # Misma medida de distancia que la evolución (camino más corto o Manhattan)
+        self.campo = None if manhattan else CampoDistancias(laberinto)
+        self.entradas: List[EntradaSalon] = []
+        self._genomas: Dict[GenomaEmpaquetado, EntradaSalon] = {}
+
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+    def umbral(self) -> Optional[float]:
+        """
+        Aptitud que hay que superar para entrar, o None si hay lugar.
+        """
+        if len(self.entradas) < self.capacidad:
+            return None
+        return self.entradas[-1].aptitud
+
+    def ofrecer(self, genes: np.ndarray, aptitud: float, generacion: int) -> bool:
+        umbral = self.umbral()
+        if umbral is not None and aptitud <= umbral:
+            return False
+        genoma = GenomaEmpaquetado.desde_genes(genes)
+        if genoma in self._genomas:
+            return False
+
+        trayectoria, hormiga = Trayectoria.registrar(genoma.genes(), self.laberinto, *self.inicio,
+                                                     self.pasos_maximos)
+        aptitud = hormiga.calcular_aptitud(self.laberinto.buscar('M'),
+                                           self.campo.matriz() if self.campo is not None else None)
+        if umbral is not None and aptitud <= umbral:
+            return False
+        entrada = EntradaSalon(genoma, float(aptitud), generacion, hormiga.puntos, hormiga.alcohol,
+                               trayectoria)
+        entradas = sorted(self.entradas + [entrada], key=lambda e: e.aptitud, reverse=True)
+        for descartada in entradas[self.capacidad:]:
+            del self._genomas[descartada.genoma]
+        self._genomas[genoma] = entrada
+        self.entradas = entradas[:self.capacidad]
+        return True
+
+    def ofrecer_poblacion(self, genes: np.ndarray, aptitud: np.ndarray, generacion: int) -> int:
+        aptitud = np.asarray(aptitud)
+        umbral = self.umbral()
+        candidatas = np.flatnonzero(aptitud > umbral) if umbral is not None else np.arange(len(aptitud))
+        # Solo las `capacidad` mejores candidatas pueden quedar en el salón
+        candidatas = candidatas[np.argsort(aptitud[candidatas], kind='stable')[::-1][:self.capacidad]]
+        return sum(self.ofrecer(genes[i], aptitud[i], generacion) for i in candidatas)
+
+    def mapa_calor(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Mapa de visitas de los recorridos de las entradas indicadas (todas si
+        no se indican).
+        """
+        entradas = self.entradas if indices is None else [self.entradas[i] for i in indices]
+        return mapa_calor([e.trayectoria for e in entradas], self.laberinto.celdas.shape)
+
+    def guardar(self, ruta: str):
+        """
+        Guarda las entradas en un archivo .npz: los genomas en una matriz
+        empaquetada y los recorridos concatenados con sus desplazamientos.
+        """
+        entradas = self.entradas
+        trayectorias = [e.trayectoria for e in entradas]
+        largos = [e.genoma.largo for e in entradas]
+        np.savez_compressed(
+            ruta,
+            largos=np.array(largos, dtype=np.int64),
+            genomas=np.concatenate([e.genoma.datos for e in entradas]) if entradas else np.empty(0, np.uint8),
+            aptitudes=np.array([e.aptitud for e in entradas], dtype=np.float64),
+            contadores=np.array([(e.generacion, e.puntos, e.alcohol) for e in entradas],
+                                dtype=np.int64).reshape(-1, 3),
+            recorridos=np.array([(*t.inicio, t.movimientos, *t.final, t.motivo) for t in trayectorias],
+                                dtype=np.int64).reshape(-1, 6),
+            direcciones=np.concatenate([t.direcciones for t in trayectorias]) if entradas else np.empty(0, np.uint8),
+            movio=np.concatenate([t.movio for t in trayectorias]) if entradas else np.empty(0, np.uint8),
+        )
+
+    def cargar(self, ruta: str):
+        """
+        Reemplaza las entradas por las guardadas con `guardar`; si hay más que
+        la capacidad, se conservan las mejores.
+        """
+        with np.load(ruta, allow_pickle=False) as datos:
+            arreglos = {nombre: datos[nombre] for nombre in datos.files}
+        entradas = []
+        desde_genoma = desde_direcciones = desde_movio = 0
+        for i, largo in enumerate(arreglos['largos'].tolist()):
+            x, y, movimientos, final_x, final_y, motivo = arreglos['recorridos'][i].tolist()
+            bytes_genoma = -(-largo // 4)
+            bytes_direcciones = -(-movimientos // 4)
+            bytes_movio = -(-movimientos // 8)
+            trayectoria = Trayectoria(
+                (x, y), movimientos,
+                arreglos['direcciones'][desde_direcciones:desde_direcciones + bytes_direcciones],
+                arreglos['movio'][desde_movio:desde_movio + bytes_movio],
+                (final_x, final_y), motivo)
+            genoma = GenomaEmpaquetado(arreglos['genomas'][desde_genoma:desde_genoma + bytes_genoma], largo)
+            generacion, puntos, alcohol = arreglos['contadores'][i].tolist()
+            entradas.append(EntradaSalon(genoma, float(arreglos['aptitudes'][i]), generacion,
+                                         puntos, alcohol, trayectoria))
+            desde_genoma += bytes_genoma
+            desde_direcciones += bytes_direcciones
+            desde_movio += bytes_movio
+
+        entradas = sorted(entradas, key=lambda e: e.aptitud, reverse=True)[:self.capacidad]
+        self._genomas = {e.genoma: e for e in entradas}
+        self.entradas = entradas
@@ -1,271 +1,712 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-from AlgoritmoGenetico import AlgoritmoGenetico
-from Hormiga import HormigaGenetica
-from datetime import datetime
-from estadisticas import mostrar_estadisticas
-
-class SimulacionHormiga:
-    """
-    Clase que maneja la interfaz gráfica y la lógica de la simulación de la hormiga .
-    """
-
-    def __init__(self, master):
-        """
-        Inicializa la simulación configurando la ventana principal y variables iniciales.
-        La ventana principal de la aplicación.
-        """
-        self.master = master
-        self.master.title("Simulación de Hormiga Genética")
-        
-        self.tamaño = tk.IntVar(value=10)  # Tamaño inicial del laberinto
-        self.herramienta_actual = 'A'  # Herramienta seleccionada (por defecto, Azúcar)
-        self.tamaño_celda = 40  # Tamaño de cada celda en el laberinto
-        self.laberinto = None  # Inicializa el laberinto
-        self.algoritmo_genetico = AlgoritmoGenetico()  # Instancia del algoritmo genético
-        self.pos_meta = None  # Posición de la meta en el laberinto
-        self.tiempo_limite = 300  # Tiempo límite para la simulación (en segundos)
-        
-        self.crear_interfaz()  # Crea la interfaz gráfica
-
-    def crear_interfaz(self):
-        """
-        Crea los componentes visuales de la interfaz de usuario.
-        """
-        self.frame_principal = ttk.Frame(self.master)
-        self.frame_principal.pack(padx=10, pady=10)
-        
-        self.frame_config = ttk.LabelFrame(self.frame_principal, text="Configuración")
-        self.frame_config.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        ttk.Label(self.frame_config, text="Tamaño del laberinto:").pack()
-        self.label_tamaño = ttk.Label(self.frame_config, text=f"Tamaño actual: {self.tamaño.get()}x{self.tamaño.get()}")
-        self.label_tamaño.pack()
-        
-        # Control deslizante para ajustar el tamaño del laberinto
-        self.tamaño_scale = ttk.Scale(self.frame_config, from_=3, to=10, 
-                                       variable=self.tamaño, orient=tk.HORIZONTAL,
-                                       command=self.actualizar_tamaño)
-        self.tamaño_scale.pack(padx=5, pady=5)
-        
-        # Herramientas para colocar elementos en el laberinto
-        self.frame_herramientas = ttk.LabelFrame(self.frame_config, text="Herramientas")
-        self.frame_herramientas.pack(padx=5, pady=5)
-        
-        herramientas = [
-            ('A', 'Azúcar', 'azucar.png'),
-            ('V', 'Vino', 'vino.png'),
-            ('X', 'Veneno', 'veneno.png'),
-            ('R', 'Roca', 'piedra.png'),
-            ('M', 'Meta', 'diamante.png'),
-            ('.', 'Borrar', None)
-        ]
-        
-        self.imagenes = {}  # Diccionario para almacenar las imágenes de los elementos
-        for tipo, nombre, ruta_imagen in herramientas:
-            if ruta_imagen:
-                img = Image.open(ruta_imagen).resize((self.tamaño_celda, self.tamaño_celda), Image.LANCZOS)
-                self.imagenes[tipo] = ImageTk.PhotoImage(img)  # Carga la imagen
-            btn = ttk.Button(self.frame_herramientas, text=nombre,
-                             command=lambda t=tipo: self.seleccionar_herramienta(t))
-            btn.pack(pady=2)  # Botón para seleccionar la herramienta
-
-        # Carga la imagen de la hormiga
-        self.imagen_hormiga = ImageTk.PhotoImage(
-            Image.open("hormiga.png").resize((self.tamaño_celda-10, self.tamaño_celda-10), Image.LANCZOS)
-        )
-        
-        # Botones para crear el laberinto y comenzar la evolución
-        ttk.Button(self.frame_config, text="Crear Laberinto",
-                   command=self.crear_laberinto).pack(pady=5)
-        ttk.Button(self.frame_config, text="Comenzar Evolución",
-                   command=self.comenzar_evolucion).pack(pady=5)
-        
-        self.frame_laberinto = ttk.Frame(self.frame_principal)
-        self.frame_laberinto.pack(side=tk.LEFT, padx=5, pady=5)
-        
-        self.canvas = None  # Canvas donde se dibuja el laberinto
-        
-        self.etiqueta_generacion = ttk.Label(self.master, text="")
-        self.etiqueta_generacion.pack(pady=5)
-        self.etiqueta_estado = ttk.Label(self.master, text="")
-        self.etiqueta_estado.pack(pady=5)
-        
-        # Instrucciones para el usuario
-        self.frame_instrucciones = ttk.LabelFrame(self.frame_config, text="Instrucciones")
-        self.frame_instrucciones.pack(padx=5, pady=5, fill='x')
-        
-        instrucciones_text = """
-1. Selecciona el tamaño del laberinto
-2. Haz clic en "Crear Laberinto"
-3. Coloca los elementos:
-   - Al menos una Meta (M)
-   - Azúcar, Vino, Veneno y Rocas
-4. Haz clic en "Comenzar Simulación"
-"""
-        ttk.Label(self.frame_instrucciones, text=instrucciones_text, justify='left').pack(padx=5, pady=5)
-        
-        self.label_estado = ttk.Label(self.master, text="¡Primero crea un laberinto!")
-        self.label_estado.pack(pady=5)
-
-    def actualizar_tamaño(self, valor):
-        """
-        Actualiza el tamaño del laberinto y redibuja.
-        valor: Nuevo valor del tamaño del laberinto.
-        """
-        nuevo_tamaño = int(float(valor))
-        self.label_tamaño.config(text=f"Tamaño actual: {nuevo_tamaño}x{nuevo_tamaño}")
-        self.tamaño.set(nuevo_tamaño)
-        self.laberinto = None  # Reinicia el laberinto
-        self.pos_meta = None  # Reinicia la posición de la meta
-        self.crear_laberinto()  # Crea un nuevo laberinto
-
-    def seleccionar_herramienta(self, tipo):
-        """
-        Selecciona la herramienta actual para colocar en el laberinto.
-        Tipo de herramienta seleccionada.
-        """
-        self.herramienta_actual = tipo
-
-    def crear_laberinto(self):
-        """
-        Crea un nuevo laberinto basado en el tamaño seleccionado.
-        """
-        if self.canvas:
-            self.canvas.destroy()  # Elimina el canvas anterior si existe
-            
-        tamaño = self.tamaño.get()
-        tamaño_canvas = self.tamaño_celda * tamaño
-        
-        self.canvas = tk.Canvas(self.frame_laberinto, 
-                                width=tamaño_canvas, height=tamaño_canvas)
-        self.canvas.pack()
-        
-        # Inicializa el laberinto como una matriz de caracteres
-        self.laberinto = [['.'] * tamaño for _ in range(tamaño)]
-        self.pos_meta = None  # Reinicia la posición de la meta
-        self.dibujar_laberinto()  # Dibuja el laberinto inicial
-        
-        self.canvas.bind('<Button-1>', self.colocar_item)  # Evento para colocar elementos
-        
-        # Actualizar el estado
-        self.label_estado.config(text="Coloca una meta y otros elementos en el laberinto")
-
-    def colocar_item(self, event):
-        """
-        Coloca un elemento en el laberinto en la posición donde se hace clic.
-        Evento que contiene la posición del clic.
-        """
-        if not self.laberinto:
-            return
-            
-        x = event.x // self.tamaño_celda  # Calcula la posición en la cuadrícula
-        y = event.y // self.tamaño_celda
-        
-        # Si es una meta, actualizar pos_meta
-        if self.herramienta_actual == 'M':
-            if self.pos_meta:  # Elimina la meta anterior si existe
-                self.laberinto[self.pos_meta[0]][self.pos_meta[1]] = '.'
-            self.pos_meta = (y, x)  # Actualiza la posición de la meta
-            self.label_estado.config(text="Meta colocada - Añade otros elementos al laberinto")
-        
-        self.laberinto[y][x] = self.herramienta_actual  # Coloca el elemento en el laberinto
-        self.dibujar_laberinto()  # Redibuja el laberinto
-
-    def dibujar_laberinto(self):
-        """
-        Dibuja el laberinto en el canvas.
-        """
-        if not self.canvas:
-            return
-            
-        self.canvas.delete("all")  # Limpia el canvas antes de redibujar
-        for i in range(len(self.laberinto)):
-            for j in range(len(self.laberinto)):
-                x = j * self.tamaño_celda
-                y = i * self.tamaño_celda
-                tipo = self.laberinto[i][j]
-                
-                # Dibuja el fondo del laberinto
-                self.canvas.create_rectangle(x, y, x+self.tamaño_celda, y+self.tamaño_celda,
-                                              fill='beige', outline='black')
-                
-                # Dibuja los elementos del laberinto
-                if tipo in self.imagenes:
-                    self.canvas.create_image(x, y, anchor='nw', image=self.imagenes[tipo])
-        
-        # Dibuja la hormiga si está viva
-        if (hasattr(self, 'algoritmo_genetico') and 
-            self.algoritmo_genetico.hormiga_actual and 
-            self.algoritmo_genetico.hormiga_actual.viva):
-            hormiga = self.algoritmo_genetico.hormiga_actual
-            x = hormiga.y * self.tamaño_celda
-            y = hormiga.x * self.tamaño_celda
-            self.canvas.create_image(x+5, y+5, anchor='nw', image=self.imagen_hormiga)
-
-    def comenzar_evolucion(self):
-        """
-        Inicia el proceso de evolución de la hormiga.
-        """
-        # Validar que existe el laberinto
-        if not self.laberinto:
-            messagebox.showwarning("Error", "Primero crea el laberinto")
-            return
-        
-        # Validar que existe una meta
-        tiene_meta = False
-        for fila in self.laberinto:
-            if 'M' in fila:
-                tiene_meta = True
-                break
-        
-        if not tiene_meta:
-            messagebox.showwarning("Error", "Debes colocar una meta (M) en el laberinto")
-            return
-        
-        self.algoritmo_genetico.inicializar()  # Inicializa el algoritmo genético
-        self.evolucionar()  # Comienza el proceso de evolución
-
-    def evolucionar(self):
-        """
-        Realiza una iteración de evolución para la hormiga.
-        """
-        hormiga = self.algoritmo_genetico.hormiga_actual
-        tiempo_actual = (datetime.now() - self.algoritmo_genetico.tiempo_inicio).total_seconds()
-        
-        if tiempo_actual > self.tiempo_limite:
-            messagebox.showinfo("Fin", "Tiempo límite alcanzado")
-            mostrar_estadisticas(self.algoritmo_genetico.archivo_stats)  # Muestra estadísticas al finalizar
-            return
-        
-        if hormiga.viva and hormiga.pasos < hormiga.pasos_maximos:
-            if hormiga.mover(self.laberinto):  # Mueve la hormiga en el laberinto
-                if hormiga.llego_meta:
-                    hormiga.calcular_aptitud(self.pos_meta)  # Calcula la aptitud si llegó a la meta
-                    self.algoritmo_genetico.evolucionar()  # Evoluciona a la siguiente hormiga
-                    messagebox.showinfo("¡Éxito!", 
-                                    f"¡Hormiga llegó a la meta!\nGeneración: {self.algoritmo_genetico.generacion}\n"
-                                    f"Puntos: {hormiga.puntos}\nAlcohol: {hormiga.alcohol}")
-                    mostrar_estadisticas(self.algoritmo_genetico.archivo_stats)  # Muestra estadísticas al llegar a la meta
-                    return
-                hormiga.calcular_aptitud(self.pos_meta)  # Calcula la aptitud aunque no haya llegado a la meta
-            else:
-                self.algoritmo_genetico.evolucionar()  # Evoluciona si no pudo moverse
-                
-        self.dibujar_laberinto()  # Redibuja el laberinto
-        
-        # Actualiza las etiquetas con información actual de la generación y estado
-        self.etiqueta_generacion.config(
-            text=f"Generación: {self.algoritmo_genetico.generacion}")
-        self.etiqueta_estado.config(
-            text=f"Puntos: {hormiga.puntos} | Alcohol: {hormiga.alcohol} | "
-                f"Aptitud: {hormiga.aptitud:.2f}")
-        
-        self.master.after(50, self.evolucionar)  # Repite el proceso cada 50 ms
-
-
-if __name__ == "__main__":
-    root = tk.Tk()  # Crea la ventana principal
-    app = SimulacionHormiga(root)  # Inicia la simulación de la hormiga
-    root.mainloop()  # Mantiene la aplicación corriendo
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from PIL import ImageTk
+from AlgoritmoGenetico import AlgoritmoGenetico
+from Hormiga import HormigaGenetica
+from Laberinto import Laberinto
+from Escenarios import guardar_escenario, leer_escenario
+from Trabajador import TrabajadorEvolucion, PASO, META, LIMITE
+from Sprites import cargar_sprites
+from SalonFama import SalonFama
+from repeticion import mostrar_salon
+from Instrumentacion import Instrumentacion, OBJETIVOS
+import queue
+import threading
+import time
+from estadisticas import mostrar_estadisticas
+
+class SimulacionHormiga:
+    """
+    Clase que maneja la interfaz gráfica y la lógica de la simulación de la hormiga .
+    """
+
+    def __init__(self, master):
+        """
+        Inicializa la simulación configurando la ventana principal y variables iniciales.
+        La ventana principal de la aplicación.
+        """
+        self.master = master
+        self.master.title("Simulación de Hormiga Genética")
+        
+        self.tamaño = tk.IntVar(value=10)  # Tamaño inicial del laberinto
+        self.herramienta_actual = 'A'  # Herramienta seleccionada (por defecto, Azúcar)
+        self.tamaño_celda = 40  # Tamaño de cada celda en el laberinto (cambia con el zoom)
+        self.niveles_zoom = (8, 12, 16, 24, 32, 40, 56, 80)  # Tamaños de celda posibles
+        self.lado_maximo_canvas = 600  # Lado máximo de la ventana visible del laberinto
+        self.laberinto = None  # Inicializa el laberinto
+        self.vista = None  # Vista del laberinto de la hormiga actual (consumibles propios)
+        self.items_celdas = {}  # Items de las celdas visibles: (fila, columna) -> [fondo, imagen]
+        self.items_libres = []  # Items de celdas que salieron de la vista, para reutilizar
+        self.rango_visible = None  # (fila0, fila1, col0, col1) de las celdas con items
+        self.celdas_sucias = set()  # Celdas cuyo contenido cambió desde el último dibujo
+        self.item_hormiga = None  # Item del canvas que representa a la hormiga
+        self.algoritmo_genetico = AlgoritmoGenetico()  # Instancia del algoritmo genético
+        self.pos_meta = None  # Posición de la meta en el laberinto
+        self.tiempo_limite = 300  # Tiempo límite para la simulación (en segundos)
+        self.trabajador = None  # Hilo que ejecuta la evolución
+        self.salon = None  # Salón de la fama de la última evolución
+        self.capacidad_salon = 10  # Hormigas distintas que guarda el salón
+        self.cerrojo = threading.Lock()  # Protege el laberinto entre la interfaz y el hilo
+        self.ultima_instantanea = None  # Último estado recibido del hilo
+        self.intervalo_consulta = 20  # Milisegundos entre consultas a la cola del hilo
+        self.cantidad_por_tic = tk.IntVar(value=1)  # Pasos o generaciones simulados por tic
+        self.unidad_tic = tk.StringVar(value='pasos')  # 'pasos' o 'generaciones'
+        self.solo_mejores = tk.BooleanVar(value=False)  # Dibujar solo las nuevas mejores hormigas
+        self.instrumentacion = Instrumentacion()  # Cronómetros por fase, desactivados por defecto
+        self.medir_fases = tk.BooleanVar(value=False)
+        self.muestra_rendimiento = None  # (tiempo, llamadas, segundos) de la última actualización
+        
+        self.crear_interfaz()  # Crea la interfaz gráfica
+
+    def crear_interfaz(self):
+        """
+        Crea los componentes visuales de la interfaz de usuario.
+        """
+        self.frame_principal = ttk.Frame(self.master)
+        self.frame_principal.pack(padx=10, pady=10)
+        
+        self.frame_config = ttk.LabelFrame(self.frame_principal, text="Configuración")
+        self.frame_config.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        ttk.Label(self.frame_config, text="Tamaño del laberinto:").pack()
+        self.label_tamaño = ttk.Label(self.frame_config, text=f"Tamaño actual: {self.tamaño.get()}x{self.tamaño.get()}")
+        self.label_tamaño.pack()
+        
+        # Control deslizante para ajustar el tamaño del laberinto
+        self.tamaño_scale = ttk.Scale(self.frame_config, from_=3, to=1000, 
+                                       variable=self.tamaño, orient=tk.HORIZONTAL,
+                                       command=self.actualizar_tamaño)
+        self.tamaño_scale.pack(padx=5, pady=5)
+        
+        # Herramientas para colocar elementos en el laberinto
+        self.frame_herramientas = ttk.LabelFrame(self.frame_config, text="Herramientas")
+        self.frame_herramientas.pack(padx=5, pady=5)
+        
+        herramientas = [
+            ('A', 'Azúcar', 'azucar.png'),
+            ('V', 'Vino', 'vino.png'),
+            ('X', 'Veneno', 'veneno.png'),
+            ('R', 'Roca', 'piedra.png'),
+            ('M', 'Meta', 'diamante.png'),
+            ('.', 'Borrar', None)
+        ]
+        
+        self.rutas_imagenes = {'hormiga': 'hormiga.png'}  # Imágenes originales de cada elemento
+        for tipo, nombre, ruta_imagen in herramientas:
+            if ruta_imagen:
+                self.rutas_imagenes[tipo] = ruta_imagen
+            btn = ttk.Button(self.frame_herramientas, text=nombre,
+                             command=lambda t=tipo: self.seleccionar_herramienta(t))
+            btn.pack(pady=2)  # Botón para seleccionar la herramienta
+
+        self.sprites = {}  # Imágenes redimensionadas por tamaño de celda: tamaño -> {tipo: imagen}
+        self.seleccionar_sprites()
+        
+        # Zoom del laberinto (también con Ctrl + rueda del ratón)
+        self.frame_zoom = ttk.Frame(self.frame_config)
+        self.frame_zoom.pack(pady=2)
+        ttk.Button(self.frame_zoom, text="Alejar", command=lambda: self.cambiar_zoom(-1)).pack(side=tk.LEFT)
+        ttk.Button(self.frame_zoom, text="Acercar", command=lambda: self.cambiar_zoom(1)).pack(side=tk.LEFT)
+        
+        # Control de velocidad: cuánto se simula entre dos dibujos del laberinto
+        self.frame_velocidad = ttk.LabelFrame(self.frame_config, text="Velocidad")
+        self.frame_velocidad.pack(padx=5, pady=5, fill='x')
+        ttk.Label(self.frame_velocidad, text="Por tic:").pack()
+        ttk.Spinbox(self.frame_velocidad, from_=1, to=100000, width=8,
+                    textvariable=self.cantidad_por_tic).pack(pady=2)
+        ttk.Radiobutton(self.frame_velocidad, text="Pasos", value='pasos',
+                        variable=self.unidad_tic).pack()
+        ttk.Radiobutton(self.frame_velocidad, text="Generaciones", value='generaciones',
+                        variable=self.unidad_tic).pack()
+        ttk.Checkbutton(self.frame_velocidad, text="Mostrar solo nuevas mejores",
+                        variable=self.solo_mejores).pack(pady=2)
+        
+        # Medición del tiempo de cada fase (mover, aptitud, evolución, estadísticas y dibujo)
+        self.frame_rendimiento = ttk.LabelFrame(self.frame_config, text="Rendimiento")
+        self.frame_rendimiento.pack(padx=5, pady=5, fill='x')
+        ttk.Checkbutton(self.frame_rendimiento, text="Medir fases", variable=self.medir_fases,
+                        command=self.alternar_instrumentacion).pack(pady=2)
+        ttk.Button(self.frame_rendimiento, text="Exportar métricas",
+                   command=self.exportar_metricas).pack(pady=2)
+        
+        # Botones para crear el laberinto y comenzar la evolución
+        ttk.Button(self.frame_config, text="Crear Laberinto",
+                   command=self.crear_laberinto).pack(pady=5)
+        ttk.Button(self.frame_config, text="Abrir Laberinto",
+                   command=self.abrir_laberinto).pack(pady=2)
+        ttk.Button(self.frame_config, text="Guardar Laberinto",
+                   command=self.guardar_laberinto).pack(pady=2)
+        ttk.Button(self.frame_config, text="Comenzar Evolución",
+                   command=self.comenzar_evolucion).pack(pady=5)
+        self.boton_pausa = ttk.Button(self.frame_config, text="Pausar",
+                                      command=self.alternar_pausa, state='disabled')
+        self.boton_pausa.pack(pady=2)
+        self.boton_cancelar = ttk.Button(self.frame_config, text="Cancelar",
+                                         command=self.cancelar_evolucion, state='disabled')
+        self.boton_cancelar.pack(pady=2)
+        ttk.Button(self.frame_config, text="Salón de la fama",
+                   command=self.abrir_salon).pack(pady=2)
+        
+        self.frame_laberinto = ttk.Frame(self.frame_principal)
+        self.frame_laberinto.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        self.canvas = None  # Canvas donde se dibuja el laberinto
+        
+        self.etiqueta_generacion = ttk.Label(self.master, text="")
+        self.etiqueta_generacion.pack(pady=5)
+        self.etiqueta_estado = ttk.Label(self.master, text="")
+        self.etiqueta_estado.pack(pady=5)
+        self.etiqueta_rendimiento = ttk.Label(self.master, text="")
+        self.etiqueta_rendimiento.pack(pady=5)
+        
+        # Instrucciones para el usuario
+        self.frame_instrucciones = ttk.LabelFrame(self.frame_config, text="Instrucciones")
+        self.frame_instrucciones.pack(padx=5, pady=5, fill='x')
+        
+        instrucciones_text = """
+1. Selecciona el tamaño del laberinto
+2. Haz clic en "Crear Laberinto"
+3. Coloca los elementos:
+   - Al menos una Meta (M)
+   - Azúcar, Vino, Veneno y Rocas
+4. Haz clic en "Comenzar Simulación"
+5. Rueda del ratón: desplazar (Shift: horizontal)
+   Ctrl + rueda o Acercar/Alejar: zoom
+"""
+        ttk.Label(self.frame_instrucciones, text=instrucciones_text, justify='left').pack(padx=5, pady=5)
+        
+        self.label_estado = ttk.Label(self.master, text="¡Primero crea un laberinto!")
+        self.label_estado.pack(pady=5)
+
+    def actualizar_tamaño(self, valor):
+        """
+        Actualiza el tamaño del laberinto y redibuja.
+        valor: Nuevo valor del tamaño del laberinto.
+        """
+        nuevo_tamaño = int(float(valor))
+        self.label_tamaño.config(text=f"Tamaño actual: {nuevo_tamaño}x{nuevo_tamaño}")
+        self.tamaño.set(nuevo_tamaño)
+        self.laberinto = None  # Reinicia el laberinto
+        self.pos_meta = None  # Reinicia la posición de la meta
+        self.crear_laberinto()  # Crea un nuevo laberinto
+
+    def seleccionar_herramienta(self, tipo):
+        """
+        Selecciona la herramienta actual para colocar en el laberinto.
+        Tipo de herramienta seleccionada.
+        """
+        self.herramienta_actual = tipo
+
+    def crear_laberinto(self, laberinto=None):
+        """
+        Crea un nuevo laberinto basado en el tamaño seleccionado.
+        laberinto: Laberinto ya armado (por ejemplo, leído de un archivo); si
+        no se indica, se crea uno vacío.
+        """
+        self.detener_trabajador()  # La evolución en curso pertenece al laberinto anterior
+        if self.canvas:
+            self.frame_canvas.destroy()  # Elimina el canvas anterior y sus barras si existen
+            
+        # Inicializa el laberinto compacto y la vista de la hormiga
+        self.laberinto = laberinto or Laberinto(self.tamaño.get())
+        self.vista = self.laberinto.vista()
+        self.pos_meta = self.laberinto.buscar('M')  # Un laberinto vacío no tiene meta
+        self.ultima_instantanea = None
+        
+        # Canvas con barras de desplazamiento; solo se dibujan las celdas visibles
+        self.frame_canvas = ttk.Frame(self.frame_laberinto)
+        self.frame_canvas.pack()
+        self.canvas = tk.Canvas(self.frame_canvas, highlightthickness=0)
+        barra_x = ttk.Scrollbar(self.frame_canvas, orient=tk.HORIZONTAL, command=self.desplazar_x)
+        barra_y = ttk.Scrollbar(self.frame_canvas, orient=tk.VERTICAL, command=self.desplazar_y)
+        self.canvas.configure(xscrollcommand=barra_x.set, yscrollcommand=barra_y.set)
+        self.canvas.grid(row=0, column=0)
+        barra_y.grid(row=0, column=1, sticky='ns')
+        barra_x.grid(row=1, column=0, sticky='ew')
+        self.ajustar_canvas()
+        self.dibujar_laberinto()  # Dibuja el laberinto inicial
+        
+        self.canvas.bind('<Button-1>', self.colocar_item)  # Evento para colocar elementos
+        self.canvas.bind('<Configure>', lambda event: self.dibujar_laberinto())
+        self.canvas.bind('<MouseWheel>', self.rueda_raton)  # Windows y macOS
+        self.canvas.bind('<Shift-MouseWheel>', self.rueda_raton)
+        self.canvas.bind('<Control-MouseWheel>', self.rueda_raton)
+        for boton in ('<Button-4>', '<Button-5>', '<Shift-Button-4>', '<Shift-Button-5>',
+                      '<Control-Button-4>', '<Control-Button-5>'):  # Linux
+            self.canvas.bind(boton, self.rueda_raton)
+        
+        # Actualizar el estado
+        self.label_estado.config(text="Coloca una meta y otros elementos en el laberinto")
+
+    def abrir_laberinto(self):
+        """
+        Carga un laberinto desde un archivo de escenario (texto o .lab).
+        """
+        ruta = filedialog.askopenfilename(filetypes=[("Laberintos", "*.lab *.txt"),
+                                                     ("Todos los archivos", "*.*")])
+        if not ruta:
+            return
+        try:
+            laberinto, _ = leer_escenario(ruta)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo abrir el laberinto:\n{error}")
+            return
+        if laberinto.filas == laberinto.columnas:
+            self.tamaño.set(laberinto.filas)
+        self.label_tamaño.config(text=f"Tamaño actual: {laberinto.filas}x{laberinto.columnas}")
+        self.crear_laberinto(laberinto)
+        if self.pos_meta is None:
+            self.label_estado.config(text="Laberinto cargado - Coloca una meta")
+        else:
+            self.label_estado.config(text="Laberinto cargado")
+
+    def guardar_laberinto(self):
+        """
+        Guarda el laberinto actual en un archivo de escenario; el formato
+        depende de la extensión elegida (.lab binario, cualquier otra texto).
+        """
+        if self.laberinto is None:
+            messagebox.showwarning("Error", "Primero crea un laberinto")
+            return
+        ruta = filedialog.asksaveasfilename(defaultextension='.lab',
+                                            filetypes=[("Laberinto compacto", "*.lab"),
+                                                       ("Texto", "*.txt")])
+        if not ruta:
+            return
+        with self.cerrojo:  # Copia consistente aunque el hilo esté leyendo el laberinto
+            copia = Laberinto(self.laberinto.filas, self.laberinto.columnas)
+            copia.celdas[:] = self.laberinto.celdas
+        try:
+            guardar_escenario(ruta, copia)
+        except OSError as error:
+            messagebox.showerror("Error", f"No se pudo guardar el laberinto:\n{error}")
+
+    def ajustar_canvas(self):
+        """
+        Ajusta el tamaño visible y la región desplazable del canvas al laberinto
+        y al zoom actual, y descarta los items existentes.
+        """
+        ancho = self.laberinto.columnas * self.tamaño_celda
+        alto = self.laberinto.filas * self.tamaño_celda
+        self.canvas.configure(width=min(ancho, self.lado_maximo_canvas),
+                              height=min(alto, self.lado_maximo_canvas),
+                              scrollregion=(0, 0, ancho, alto))
+        self.canvas.delete("all")
+        self.items_celdas = {}
+        self.items_libres = []
+        self.rango_visible = None
+        self.item_hormiga = None
+
+    def seleccionar_sprites(self):
+        """
+        Toma las imágenes del tamaño de celda actual. La primera vez que se usa
+        ese zoom se cargan del atlas en disco (que se genera si no existe).
+        """
+        tamaño = self.tamaño_celda
+        if tamaño not in self.sprites:
+            lado_hormiga = tamaño - 2 * (tamaño // 8)
+            pedidos = {tipo: (ruta, lado_hormiga if tipo == 'hormiga' else tamaño)
+                       for tipo, ruta in self.rutas_imagenes.items()}
+            self.sprites[tamaño] = {tipo: ImageTk.PhotoImage(img)
+                                    for tipo, img in cargar_sprites(pedidos).items()}
+        self.imagenes = self.sprites[tamaño]
+        self.imagen_hormiga = self.imagenes['hormiga']
+
+    def cambiar_zoom(self, direccion):
+        """
+        Pasa al nivel de zoom siguiente (1) o anterior (-1), manteniendo el
+        centro de la vista.
+        """
+        nivel = self.niveles_zoom.index(self.tamaño_celda) + direccion
+        if not 0 <= nivel < len(self.niveles_zoom):
+            return
+        self.tamaño_celda = self.niveles_zoom[nivel]
+        self.seleccionar_sprites()
+        if not self.canvas:
+            return
+        
+        # Centro de la vista como fracción del laberinto, antes del cambio
+        x0, x1 = self.canvas.xview()
+        y0, y1 = self.canvas.yview()
+        self.ajustar_canvas()
+        ancho, alto = self.tamaño_vista()
+        self.canvas.xview_moveto((x0 + x1) / 2 - ancho / (2 * self.laberinto.columnas * self.tamaño_celda))
+        self.canvas.yview_moveto((y0 + y1) / 2 - alto / (2 * self.laberinto.filas * self.tamaño_celda))
+        self.dibujar_laberinto()
+
+    def desplazar_x(self, *args):
+        self.canvas.xview(*args)
+        self.dibujar_laberinto()
+
+    def desplazar_y(self, *args):
+        self.canvas.yview(*args)
+        self.dibujar_laberinto()
+
+    def rueda_raton(self, event):
+        """
+        Desplaza el laberinto con la rueda del ratón (horizontalmente con Shift)
+        o cambia el zoom con Ctrl.
+        """
+        if getattr(event, 'num', None) in (4, 5):
+            direccion = 1 if event.num == 4 else -1
+        else:
+            direccion = 1 if event.delta > 0 else -1
+        if event.state & 0x4:  # Ctrl
+            self.cambiar_zoom(direccion)
+            return
+        if event.state & 0x1:  # Shift
+            self.canvas.xview_scroll(-direccion, 'units')
+        else:
+            self.canvas.yview_scroll(-direccion, 'units')
+        self.dibujar_laberinto()
+
+    def colocar_item(self, event):
+        """
+        Coloca un elemento en el laberinto en la posición donde se hace clic.
+        Evento que contiene la posición del clic.
+        """
+        if self.laberinto is None:
+            return
+            
+        # Calcula la posición en la cuadrícula, teniendo en cuenta el desplazamiento
+        x = int(self.canvas.canvasx(event.x)) // self.tamaño_celda
+        y = int(self.canvas.canvasy(event.y)) // self.tamaño_celda
+        if not (0 <= y < self.laberinto.filas and 0 <= x < self.laberinto.columnas):
+            return
+        
+        with self.cerrojo:  # El hilo de evolución no simula mientras cambia el laberinto
+            # Si es una meta, actualizar pos_meta
+            if self.herramienta_actual == 'M':
+                if self.pos_meta:  # Elimina la meta anterior si existe
+                    self.laberinto.colocar(self.pos_meta[0], self.pos_meta[1], '.')
+                    self.celdas_sucias.add(self.pos_meta)
+                self.pos_meta = (y, x)  # Actualiza la posición de la meta
+                self.label_estado.config(text="Meta colocada - Añade otros elementos al laberinto")
+            
+            self.laberinto.colocar(y, x, self.herramienta_actual)  # Coloca el elemento en el laberinto
+        self.celdas_sucias.add((y, x))
+        self.dibujar_laberinto()  # Redibuja solo las celdas modificadas
+
+    def tamaño_vista(self):
+        """
+        Devuelve el ancho y el alto en píxeles de la parte visible del canvas.
+        """
+        ancho = self.canvas.winfo_width()
+        alto = self.canvas.winfo_height()
+        if ancho <= 1 or alto <= 1:  # Todavía no se mostró: usa el tamaño pedido
+            ancho = int(self.canvas.cget('width'))
+            alto = int(self.canvas.cget('height'))
+        return ancho, alto
+
+    def actualizar_vista_visible(self):
+        """
+        Asegura que cada celda visible tenga sus items. Los items de las celdas
+        que salieron de la vista se reutilizan para las que entraron, así que
+        la cantidad de items depende del tamaño de la vista y no del laberinto.
+        """
+        tamaño = self.tamaño_celda
+        ancho, alto = self.tamaño_vista()
+        x0 = max(0, int(self.canvas.canvasx(0)))
+        y0 = max(0, int(self.canvas.canvasy(0)))
+        rango = (y0 // tamaño, min(self.laberinto.filas, (y0 + alto) // tamaño + 1),
+                 x0 // tamaño, min(self.laberinto.columnas, (x0 + ancho) // tamaño + 1))
+        if rango == self.rango_visible:
+            return
+        fila0, fila1, col0, col1 = rango
+        nuevos_fondos = False
+        
+        for celda in [c for c in self.items_celdas
+                      if not (fila0 <= c[0] < fila1 and col0 <= c[1] < col1)]:
+            self.items_libres.append(self.items_celdas.pop(celda))
+        
+        for i in range(fila0, fila1):
+            for j in range(col0, col1):
+                if (i, j) in self.items_celdas:
+                    continue
+                x = j * tamaño
+                y = i * tamaño
+                if self.items_libres:
+                    items = self.items_libres.pop()
+                    self.canvas.coords(items[0], x, y, x+tamaño, y+tamaño)
+                    self.canvas.itemconfigure(items[0], state='normal')
+                else:
+                    # Dibuja el fondo del laberinto
+                    items = [self.canvas.create_rectangle(x, y, x+tamaño, y+tamaño, fill='beige',
+                                                          outline='black', tags='fondo'), None]
+                    nuevos_fondos = True
+                self.items_celdas[(i, j)] = items
+                self.dibujar_celda(i, j)
+        
+        for items in self.items_libres:  # Sobrantes: se ocultan hasta que vuelvan a hacer falta
+            self.canvas.itemconfigure(items[0], state='hidden')
+            if items[1] is not None:
+                self.canvas.itemconfigure(items[1], state='hidden')
+        if nuevos_fondos:
+            self.canvas.tag_lower('fondo')  # Los fondos nuevos no deben tapar imágenes reutilizadas
+        self.rango_visible = rango
+
+    def dibujar_laberinto(self, hormiga=None):
+        """
+        Dibuja el laberinto en el canvas, con `hormiga` o, si no se indica, con
+        la última hormiga recibida del hilo de evolución.
+
+        Solo las celdas visibles tienen items. Entre dibujos se actualizan las
+        celdas visibles marcadas en `celdas_sucias` y el único item de la
+        hormiga se mueve con `canvas.coords`.
+        """
+        if not self.canvas:
+            return
+            
+        self.actualizar_vista_visible()
+        for celda in self.celdas_sucias:
+            if celda in self.items_celdas:  # Las ocultas se dibujan al entrar en la vista
+                self.dibujar_celda(*celda)
+        self.celdas_sucias.clear()
+        
+        if self.item_hormiga is None:
+            self.item_hormiga = self.canvas.create_image(0, 0, anchor='nw', image=self.imagen_hormiga,
+                                                         state='hidden')
+        
+        # Mueve la hormiga si está viva, o la oculta
+        hormiga = hormiga or self.ultima_instantanea
+        if hormiga and hormiga.viva:
+            margen = self.tamaño_celda // 8
+            x = hormiga.y * self.tamaño_celda
+            y = hormiga.x * self.tamaño_celda
+            self.canvas.coords(self.item_hormiga, x+margen, y+margen)
+            self.canvas.itemconfigure(self.item_hormiga, state='normal')
+            self.canvas.tag_raise(self.item_hormiga)
+        else:
+            self.canvas.itemconfigure(self.item_hormiga, state='hidden')
+
+    def dibujar_celda(self, i, j):
+        """
+        Actualiza la imagen de la celda visible (i, j) según lo que ve la
+        hormiga actual.
+        """
+        items = self.items_celdas[(i, j)]
+        tipo = self.vista.tipo(i, j)  # Oculta lo que ya consumió la hormiga actual
+        if tipo in self.imagenes:
+            x = j * self.tamaño_celda
+            y = i * self.tamaño_celda
+            if items[1] is None:
+                items[1] = self.canvas.create_image(x, y, anchor='nw', image=self.imagenes[tipo])
+            else:
+                self.canvas.coords(items[1], x, y)  # Puede venir de otra celda
+                self.canvas.itemconfigure(items[1], image=self.imagenes[tipo], state='normal')
+        elif items[1] is not None:
+            self.canvas.itemconfigure(items[1], state='hidden')
+
+    def mostrar_consumidos(self, consumidos):
+        """
+        Hace que la vista dibujada oculte exactamente las celdas de `consumidos`
+        y marca para redibujar las que cambiaron.
+        """
+        columnas = self.laberinto.columnas
+        cambiadas = self.vista.consumidos.symmetric_difference(consumidos)
+        self.celdas_sucias.update(divmod(celda, columnas) for celda in cambiadas)
+        self.vista.consumidos = set(consumidos)
+
+    def comenzar_evolucion(self):
+        """
+        Inicia el proceso de evolución de la hormiga en un hilo aparte.
+        """
+        # Validar que existe el laberinto
+        if self.laberinto is None:
+            messagebox.showwarning("Error", "Primero crea el laberinto")
+            return
+        
+        # Validar que existe una meta
+        if self.laberinto.buscar('M') is None:
+            messagebox.showwarning("Error", "Debes colocar una meta (M) en el laberinto")
+            return
+        
+        self.detener_trabajador()  # Solo una evolución a la vez
+        self.algoritmo_genetico.inicializar()  # Inicializa el algoritmo genético
+        self.mostrar_consumidos(())  # La primera hormiga ve el laberinto completo
+        self.salon = SalonFama(self.capacidad_salon, self.laberinto)
+        self.trabajador = TrabajadorEvolucion(self.algoritmo_genetico, self.laberinto,
+                                              self.pos_meta, self.tiempo_limite, self.cerrojo,
+                                              salon=self.salon)
+        self.aplicar_velocidad()
+        self.trabajador.start()
+        self.boton_pausa.config(text="Pausar", state='normal')
+        self.boton_cancelar.config(state='normal')
+        self.label_estado.config(text="Evolucionando...")
+        self.master.after(self.intervalo_consulta, self.procesar_cola)
+
+    def abrir_salon(self):
+        """
+        Abre la ventana con las mejores hormigas de la evolución y la
+        repetición de sus recorridos.
+        """
+        if self.salon is None or len(self.salon) == 0:
+            messagebox.showwarning("Error", "Todavía no hay hormigas en el salón de la fama")
+            return
+        mostrar_salon(self.salon, self.salon.laberinto)  # El laberinto de esa evolución
+
+    def alternar_pausa(self):
+        """
+        Pausa o reanuda la evolución en curso.
+        """
+        if self.trabajador is None:
+            return
+        if self.trabajador.pausado:
+            self.trabajador.reanudar()
+            self.boton_pausa.config(text="Pausar")
+            self.label_estado.config(text="Evolucionando...")
+        else:
+            self.trabajador.pausar()
+            self.boton_pausa.config(text="Reanudar")
+            self.label_estado.config(text="En pausa")
+
+    def cancelar_evolucion(self):
+        """
+        Cancela la evolución en curso; el hilo avisa por la cola cuando termina.
+        """
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self.boton_pausa.config(state='disabled')
+            self.boton_cancelar.config(state='disabled')
+
+    def detener_trabajador(self):
+        """
+        Cancela el hilo de evolución, si existe, y espera a que termine.
+        """
+        trabajador, self.trabajador = self.trabajador, None
+        if trabajador is None:
+            return
+        trabajador.cancelar()
+        while trabajador.is_alive():
+            try:
+                trabajador.cola.get(timeout=0.05)  # Libera al hilo si espera lugar en la cola
+            except queue.Empty:
+                pass
+        self.boton_pausa.config(text="Pausar", state='disabled')
+        self.boton_cancelar.config(state='disabled')
+
+    def leer_cantidad_por_tic(self):
+        """
+        Devuelve cuántos pasos o generaciones se simulan por tic (al menos 1).
+        """
+        try:
+            return max(1, int(self.cantidad_por_tic.get()))
+        except (tk.TclError, ValueError):
+            return 1  # El campo está vacío o no es un número mientras se edita
+
+    def aplicar_velocidad(self):
+        """
+        Copia los controles de velocidad al hilo de evolución.
+        """
+        self.trabajador.cantidad_por_tic = self.leer_cantidad_por_tic()
+        self.trabajador.por_generaciones = self.unidad_tic.get() == 'generaciones'
+        self.trabajador.solo_mejores = self.solo_mejores.get()
+
+    def procesar_cola(self):
+        """
+        Recoge las instantáneas que publicó el hilo de evolución y dibuja solo
+        la más reciente. Si el hilo terminó, lo informa sin bloquear la ventana
+        y abre las estadísticas; si no, vuelve a consultar en el próximo tic.
+        """
+        trabajador = self.trabajador
+        if trabajador is None:
+            return  # La evolución se reemplazó o se detuvo
+        self.aplicar_velocidad()
+        
+        ultima = None
+        dibujable = None
+        while True:
+            try:
+                instantanea = trabajador.cola.get_nowait()
+            except queue.Empty:
+                break
+            ultima = instantanea
+            if instantanea.dibujar:
+                dibujable = instantanea
+        
+        if dibujable is not None:
+            self.mostrar_consumidos(dibujable.consumidos)
+            self.ultima_instantanea = dibujable
+            self.dibujar_laberinto(dibujable)  # Dibuja solo el último estado recibido
+        
+        if ultima is not None:
+            # Actualiza las etiquetas con información actual de la generación y estado
+            self.etiqueta_generacion.config(
+                text=f"Generación: {ultima.generacion}")
+            self.etiqueta_estado.config(
+                text=f"Puntos: {ultima.puntos} | Alcohol: {ultima.alcohol} | "
+                    f"Aptitud: {ultima.aptitud:.2f}")
+            
+            if ultima.evento != PASO:
+                self.trabajador = None
+                self.boton_pausa.config(text="Pausar", state='disabled')
+                self.boton_cancelar.config(state='disabled')
+                if ultima.evento == META:
+                    self.label_estado.config(
+                        text=f"¡Hormiga llegó a la meta! Generación: {ultima.generacion} | "
+                            f"Puntos: {ultima.puntos} | Alcohol: {ultima.alcohol}")
+                elif ultima.evento == LIMITE:
+                    self.label_estado.config(text="Fin: tiempo límite alcanzado")
+                else:
+                    self.label_estado.config(text="Evolución cancelada")
+                mostrar_estadisticas(self.algoritmo_genetico.archivo_stats)  # Muestra estadísticas al finalizar
+                return
+        
+        self.actualizar_rendimiento()
+        self.master.after(self.intervalo_consulta, self.procesar_cola)
+
+    def alternar_instrumentacion(self):
+        """
+        Activa o desactiva la medición de fases según la casilla "Medir fases".
+        """
+        if self.medir_fases.get():
+            self.instrumentacion.activar(OBJETIVOS + [(SimulacionHormiga, 'dibujar_laberinto')])
+        else:
+            self.instrumentacion.desactivar()
+            self.etiqueta_rendimiento.config(text="")
+        self.muestra_rendimiento = None
+
+    def actualizar_rendimiento(self):
+        """
+        Muestra, cada medio segundo, los pasos y generaciones por segundo y el
+        tiempo de dibujo por cuadro desde la actualización anterior.
+        """
+        if not self.instrumentacion.activa:
+            return
+        ahora = time.perf_counter()
+        anterior = self.muestra_rendimiento
+        if anterior is not None and ahora - anterior[0] < 0.5:
+            return
+        llamadas = dict(self.instrumentacion.llamadas)
+        segundos = dict(self.instrumentacion.segundos)
+        self.muestra_rendimiento = (ahora, llamadas, segundos)
+        if anterior is None:
+            return
+        
+        tiempo, llamadas_antes, segundos_antes = anterior
+        transcurrido = ahora - tiempo
+        pasos = (llamadas['mover'] - llamadas_antes['mover']) / transcurrido
+        generaciones = (llamadas['evolucionar'] - llamadas_antes['evolucionar']) / transcurrido
+        cuadros = llamadas['dibujar_laberinto'] - llamadas_antes['dibujar_laberinto']
+        ms_cuadro = (1000 * (segundos['dibujar_laberinto'] - segundos_antes['dibujar_laberinto']) / cuadros
+                     if cuadros else 0.0)
+        self.etiqueta_rendimiento.config(
+            text=f"Pasos/s: {pasos:,.0f} | Generaciones/s: {generaciones:,.1f} | "
+                f"ms por cuadro: {ms_cuadro:.2f}")
+
+    def exportar_metricas(self):
+        """
+        Guarda en un archivo JSON los tiempos y contadores de cada fase.
+        """
+        if not self.instrumentacion.activa:
+            messagebox.showwarning("Error", "Activa \"Medir fases\" antes de exportar")
+            return
+        ruta = filedialog.asksaveasfilename(defaultextension='.json',
+                                            filetypes=[("JSON", "*.json")])
+        if ruta:
+            self.instrumentacion.exportar(ruta)
+
+if __name__ == "__main__":
+    root = tk.Tk()  # Crea la ventana principal
+    app = SimulacionHormiga(root)  # Inicia la simulación de la hormiga
+    root.mainloop()  # Mantiene la aplicación corriendo
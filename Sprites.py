@@ -0,0 +1,84 @@
+# Atlas de sprites redimensionados, guardado en disco.
+# Redimensionar los PNG con LANCZOS en cada arranque es lento; el atlas guarda
+# todas las imágenes de un tamaño de celda en un único PNG y solo se vuelve a
+# generar cuando cambia alguna imagen original (fecha de modificación o tamaño).
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Tuple
+from PIL import Image
+
+DIRECTORIO_CACHE = '.cache_sprites'
+
+
+def _firma_fuente(ruta: str) -> List[int]:
+    """
+    Identifica la versión de una imagen original por su fecha de modificación
+    (en nanosegundos) y su tamaño en bytes.
+    """
+    estado = os.stat(ruta)
+    return [estado.st_mtime_ns, estado.st_size]
+
+
+def cargar_sprites(sprites: Dict[str, Tuple[str, int]],
+                   directorio: str = DIRECTORIO_CACHE) -> Dict[str, Image.Image]:
+    """
+    Devuelve las imágenes pedidas ya redimensionadas, leyéndolas del atlas en
+    disco si sigue vigente o generándolo si no.
+
+    Parámetros:
+    -----------
+    sprites : Dict[str, Tuple[str, int]]
+        nombre -> (ruta de la imagen original, lado en píxeles).
+    directorio : str
+        Carpeta donde se guardan los atlas.
+
+    Retorna:
+    --------
+    Dict[str, Image.Image]
+        nombre -> imagen cuadrada del lado pedido.
+    """
+    # Cada combinación de imágenes y tamaños tiene su propio atlas
+    clave = hashlib.sha1(repr(sorted(sprites.items())).encode('utf-8')).hexdigest()[:16]
+    ruta_atlas = os.path.join(directorio, f'atlas_{clave}.png')
+    ruta_indice = os.path.join(directorio, f'atlas_{clave}.json')
+    fuentes = {ruta: _firma_fuente(ruta) for ruta, _ in sprites.values()}
+
+    try:
+        with open(ruta_indice, encoding='utf-8') as f:
+            indice = json.load(f)
+        if indice['fuentes'] == fuentes:
+            with Image.open(ruta_atlas) as atlas:
+                atlas.load()
+                return {nombre: atlas.crop(tuple(caja)) for nombre, caja in indice['sprites'].items()}
+    except (OSError, ValueError, KeyError):
+        pass  # No hay atlas, está incompleto o corresponde a otras imágenes
+
+    imagenes = {}
+    for nombre, (ruta, lado) in sprites.items():
+        with Image.open(ruta) as original:
+            imagenes[nombre] = original.convert('RGBA').resize((lado, lado), Image.LANCZOS)
+
+    # Coloca las imágenes una al lado de la otra
+    ancho = sum(img.width for img in imagenes.values())
+    alto = max((img.height for img in imagenes.values()), default=0)
+    atlas = Image.new('RGBA', (max(ancho, 1), max(alto, 1)))
+    cajas = {}
+    x = 0
+    for nombre, img in imagenes.items():
+        atlas.paste(img, (x, 0))
+        cajas[nombre] = [x, 0, x + img.width, img.height]
+        x += img.width
+
+    try:
+        os.makedirs(directorio, exist_ok=True)
+        # Escritura atómica: otro proceso nunca ve un atlas a medio escribir
+        atlas.save(ruta_atlas + '.tmp', format='PNG')
+        os.replace(ruta_atlas + '.tmp', ruta_atlas)
+        with open(ruta_indice + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'fuentes': fuentes, 'sprites': cajas}, f)
+        os.replace(ruta_indice + '.tmp', ruta_indice)
+    except OSError:
+        pass  # Sin permiso de escritura: se usan las imágenes sin guardarlas
+    return imagenes
@@ -0,0 +1,254 @@
+# Sumideros de estadísticas del algoritmo genético.
+# Acumulan los registros de cada generación en memoria y los escriben en bloque,
+# para que la escritura en disco no domine cuando se evolucionan miles de
+# generaciones por segundo.
+
+import os
+import sqlite3
+import struct
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+from Registro import DTYPE_REGISTRO, RegistroGeneracion
+
+# Veces que un sumidero de este proceso volvió a crear o recortó cada archivo.
+# Los lectores incrementales lo comparan para saber que tienen que leer de nuevo
+# desde el principio, aunque el archivo nuevo sea más largo que el anterior.
+_reinicios: Dict[str, int] = {}
+
+
+def reinicios(ruta: str) -> int:
+    """
+    Devuelve cuántas veces se volvió a crear o se recortó `ruta` en este proceso.
+    """
+    return _reinicios.get(os.path.abspath(ruta), 0)
+
+
+def _registrar_reinicio(ruta: str):
+    clave = os.path.abspath(ruta)
+    _reinicios[clave] = _reinicios.get(clave, 0) + 1
+
+
+class SumideroEstadisticas:
+    """
+    Clase base de los sumideros de estadísticas.
+
+    Los registros se acumulan en un búfer y se escriben cuando el búfer llega a
+    `intervalo_vaciado` registros o cuando pasaron `segundos_vaciado` segundos
+    desde la última escritura.
+
+    Métodos:
+    --------
+    iniciar():
+        Crea (o vacía) el destino para una nueva simulación.
+    escribir(registro: RegistroGeneracion):
+        Agrega un registro al búfer y lo vacía si corresponde.
+    vaciar():
+        Escribe en disco todos los registros pendientes.
+    cerrar():
+        Vacía el búfer y libera los recursos del sumidero.
+    marca() -> int:
+        Vacía el búfer y devuelve la posición actual del destino.
+    reanudar(marca: int):
+        Continúa un destino existente descartando lo escrito después de `marca`.
+    """
+
+    def __init__(self, ruta: str, intervalo_vaciado: int = 1000, segundos_vaciado: float = 1.0):
+        """
+        Parámetros:
+        -----------
+        ruta : str
+            Archivo de destino.
+        intervalo_vaciado : int
+            Registros acumulados que provocan una escritura.
+        segundos_vaciado : float
+            Tiempo máximo que un registro puede esperar en el búfer.
+        """
+        self.ruta = ruta
+        self.intervalo_vaciado = intervalo_vaciado
+        self.segundos_vaciado = segundos_vaciado
+        self.bufer: List[RegistroGeneracion] = []
+        self.ultimo_vaciado = time.monotonic()
+
+    def iniciar(self):
+        self.bufer = []
+        self.ultimo_vaciado = time.monotonic()
+        self._iniciar_destino()
+        _registrar_reinicio(self.ruta)
+
+    def escribir(self, registro: RegistroGeneracion):
+        self.bufer.append(registro)
+        if (len(self.bufer) >= self.intervalo_vaciado or
+                time.monotonic() - self.ultimo_vaciado >= self.segundos_vaciado):
+            self.vaciar()
+
+    def vaciar(self):
+        if self.bufer:
+            self._escribir_bloque(self.bufer)
+            self.bufer = []
+        self.ultimo_vaciado = time.monotonic()
+
+    def cerrar(self):
+        self.vaciar()
+
+    def marca(self) -> int:
+        self.vaciar()
+        return self._marca_destino()
+
+    def reanudar(self, marca: int):
+        """
+        Prepara el destino para seguir agregando registros después de `marca`,
+        sin borrar los anteriores. Lo escrito después de la marca (generaciones
+        que se van a repetir) se descarta. Si el destino no existe, se crea.
+        """
+        self.bufer = []
+        self.ultimo_vaciado = time.monotonic()
+        if os.path.exists(self.ruta):
+            self._reanudar_destino(marca)
+        else:
+            self._iniciar_destino()
+        _registrar_reinicio(self.ruta)
+
+    def _iniciar_destino(self):
+        raise NotImplementedError
+
+    def _marca_destino(self) -> int:
+        raise NotImplementedError
+
+    def _reanudar_destino(self, marca: int):
+        raise NotImplementedError
+
+    def _escribir_bloque(self, registros: List[RegistroGeneracion]):
+        raise NotImplementedError
+
+
+class SumideroTexto(SumideroEstadisticas):
+    """
+    Exportador opcional con el formato de texto original de
+    estadisticas_hormiga.txt. Solo se usa si el archivo termina en '.txt';
+    la ventana de estadísticas también lo lee.
+    """
+
+    def _iniciar_destino(self):
+        # Abre el archivo de estadísticas para escritura y agrega un encabezado
+        with open(self.ruta, 'w', encoding='utf-8') as f:
+            f.write(f"=== Estadísticas de Simulación - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n\n")
+
+    def _escribir_bloque(self, registros: List[RegistroGeneracion]):
+        separador = "\n" + "="*50 + "\n\n"
+        with open(self.ruta, 'a', encoding='utf-8') as f:
+            f.write(''.join(separador + registro.to_string() for registro in registros))
+
+    def _marca_destino(self) -> int:
+        return os.path.getsize(self.ruta)  # Bytes escritos
+
+    def _reanudar_destino(self, marca: int):
+        with open(self.ruta, 'r+b') as f:
+            f.truncate(marca)
+
+
+class SumideroSQLite(SumideroEstadisticas):
+    """
+    Guarda los registros en una tabla `registros` de SQLite, una columna por
+    campo, con inserciones por lotes.
+    """
+
+    def __init__(self, ruta: str, intervalo_vaciado: int = 1000, segundos_vaciado: float = 1.0):
+        super().__init__(ruta, intervalo_vaciado, segundos_vaciado)
+        self.conexion: Optional[sqlite3.Connection] = None
+
+    def _iniciar_destino(self):
+        if self.conexion is None:
+            self.conexion = sqlite3.connect(self.ruta)
+        self.conexion.execute("DROP TABLE IF EXISTS registros")
+        self.conexion.execute(
+            "CREATE TABLE registros (generacion INTEGER, pasos INTEGER, puntos INTEGER, "
+            "alcohol INTEGER, llego_meta INTEGER, tiempo_total REAL)")
+        self.conexion.commit()
+
+    def _escribir_bloque(self, registros: List[RegistroGeneracion]):
+        self.conexion.executemany("INSERT INTO registros VALUES (?, ?, ?, ?, ?, ?)",
+                                  [registro.a_tupla() for registro in registros])
+        self.conexion.commit()
+
+    def _marca_destino(self) -> int:
+        return self.conexion.execute("SELECT COALESCE(MAX(rowid), 0) FROM registros").fetchone()[0]
+
+    def _reanudar_destino(self, marca: int):
+        if self.conexion is None:
+            self.conexion = sqlite3.connect(self.ruta)
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS registros (generacion INTEGER, pasos INTEGER, "
+            "puntos INTEGER, alcohol INTEGER, llego_meta INTEGER, tiempo_total REAL)")
+        self.conexion.execute("DELETE FROM registros WHERE rowid > ?", (marca,))
+        self.conexion.commit()
+
+    def cerrar(self):
+        super().cerrar()
+        if self.conexion is not None:
+            self.conexion.close()
+            self.conexion = None
+
+
+class SumideroNumpy(SumideroEstadisticas):
+    """
+    Guarda los registros como un arreglo estructurado en un archivo .npy, que
+    se puede abrir con `np.load` (también con `mmap_mode`).
+
+    Cada bloque se agrega al final del archivo y luego se reescribe el
+    encabezado con la nueva cantidad de registros. El encabezado tiene un
+    tamaño fijo, así que reescribirlo nunca desplaza los datos.
+    """
+
+    _TAMAÑO_ENCABEZADO = 256  # Bytes, múltiplo de 64 como exige el formato .npy
+
+    def __init__(self, ruta: str, intervalo_vaciado: int = 1000, segundos_vaciado: float = 1.0):
+        super().__init__(ruta, intervalo_vaciado, segundos_vaciado)
+        self.total = 0
+
+    def _encabezado(self) -> bytes:
+        dic = {'descr': np.lib.format.dtype_to_descr(DTYPE_REGISTRO),
+               'fortran_order': False, 'shape': (self.total,)}
+        texto = repr(dic).encode('latin1')
+        largo = self._TAMAÑO_ENCABEZADO - 10  # Menos la firma, la versión y el largo
+        return (b'\x93NUMPY\x01\x00' + struct.pack('<H', largo) +
+                texto.ljust(largo - 1) + b'\n')
+
+    def _iniciar_destino(self):
+        self.total = 0
+        with open(self.ruta, 'wb') as f:
+            f.write(self._encabezado())
+
+    def _escribir_bloque(self, registros: List[RegistroGeneracion]):
+        bloque = np.array([registro.a_tupla() for registro in registros], dtype=DTYPE_REGISTRO)
+        with open(self.ruta, 'r+b') as f:
+            f.seek(0, 2)
+            f.write(bloque.tobytes())
+            self.total += len(bloque)
+            f.seek(0)
+            f.write(self._encabezado())
+
+    def _marca_destino(self) -> int:
+        return self.total  # Registros escritos
+
+    def _reanudar_destino(self, marca: int):
+        self.total = marca
+        with open(self.ruta, 'r+b') as f:
+            f.truncate(self._TAMAÑO_ENCABEZADO + marca * DTYPE_REGISTRO.itemsize)
+            f.seek(0)
+            f.write(self._encabezado())
+
+
+def crear_sumidero(ruta: str, intervalo_vaciado: int = 1000,
+                   segundos_vaciado: float = 1.0) -> SumideroEstadisticas:
+    """
+    Elige el sumidero según la extensión del archivo: '.txt' para el formato
+    de texto original, '.db' o '.sqlite' para SQLite y NumPy (.npy) para
+    cualquier otra, que es el formato principal.
+    """
+    if ruta.endswith('.txt'):
+        return SumideroTexto(ruta, intervalo_vaciado, segundos_vaciado)
+    if ruta.endswith(('.db', '.sqlite')):
+        return SumideroSQLite(ruta, intervalo_vaciado, segundos_vaciado)
+    return SumideroNumpy(ruta, intervalo_vaciado, segundos_vaciado)
@@ -0,0 +1,241 @@
+# Hilo de evolución para la interfaz gráfica.
+# Ejecuta el algoritmo genético fuera del hilo de tkinter y envía instantáneas
+# del estado por una cola acotada; la ventana las consulta periódicamente.
+
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import FrozenSet, Optional, Tuple
+from AlgoritmoGenetico import AlgoritmoGenetico
+from Distancias import CampoDistancias
+from Hormiga import HormigaGenetica
+from Laberinto import Laberinto
+from SalonFama import SalonFama
+
+# Eventos que acompañan a una instantánea
+PASO = 'paso'          # Estado intermedio de la simulación
+META = 'meta'          # Una hormiga llegó a la meta; la evolución terminó
+LIMITE = 'limite'      # Se alcanzó el tiempo límite; la evolución terminó
+CANCELADO = 'cancelado'  # Se canceló la evolución
+
+
+class Instantanea:
+    """
+    Copia inmutable del estado que la interfaz necesita para dibujar.
+
+    Atributos:
+    ----------
+    evento : str
+        PASO, META, LIMITE o CANCELADO.
+    generacion : int
+        Generación del algoritmo genético.
+    x, y : int
+        Posición de la hormiga mostrada.
+    viva : bool
+        Si la hormiga mostrada está viva.
+    puntos, alcohol : int
+        Contadores de la hormiga mostrada.
+    aptitud : float
+        Aptitud de la hormiga mostrada.
+    consumidos : FrozenSet[int]
+        Celdas (índice plano) que la hormiga mostrada ya consumió.
+    dibujar : bool
+        False si solo deben actualizarse las etiquetas (modo "solo mejores"
+        sin una nueva mejor).
+    """
+
+    __slots__ = ('evento', 'generacion', 'x', 'y', 'viva', 'puntos', 'alcohol',
+                 'aptitud', 'consumidos', 'dibujar')
+
+    def __init__(self, evento: str, generacion: int, hormiga: HormigaGenetica,
+                 consumidos: FrozenSet[int], dibujar: bool = True):
+        self.evento = evento
+        self.generacion = generacion
+        self.x = hormiga.x
+        self.y = hormiga.y
+        self.viva = hormiga.viva
+        self.puntos = hormiga.puntos
+        self.alcohol = hormiga.alcohol
+        self.aptitud = hormiga.aptitud
+        self.consumidos = consumidos
+        self.dibujar = dibujar
+
+
+class TrabajadorEvolucion(threading.Thread):
+    """
+    Hilo que hace evolucionar a las hormigas y publica instantáneas.
+
+    La velocidad se ajusta desde la interfaz con los atributos
+    `cantidad_por_tic`, `por_generaciones` y `solo_mejores`, con el mismo
+    significado que los controles de velocidad de la ventana.
+
+    Métodos:
+    --------
+    pausar(), reanudar(), cancelar():
+        Controlan la ejecución del hilo.
+    """
+
+    def __init__(self, algoritmo_genetico: AlgoritmoGenetico, laberinto: Laberinto,
+                 pos_meta: Tuple[int, int], tiempo_limite: float,
+                 cerrojo: threading.Lock, tamaño_cola: int = 8,
+                 salon: Optional[SalonFama] = None):
+        """
+        Parámetros:
+        -----------
+        algoritmo_genetico : AlgoritmoGenetico
+            Algoritmo ya inicializado; a partir de aquí solo lo usa este hilo.
+        laberinto : Laberinto
+            Laberinto compartido con la interfaz.
+        pos_meta : Tuple[int, int]
+            Posición de la meta.
+        tiempo_limite : float
+            Segundos de evolución (sin contar pausas) antes de terminar.
+        cerrojo : threading.Lock
+            Protege el laberinto mientras la interfaz lo edita.
+        tamaño_cola : int
+            Instantáneas que pueden esperar en la cola.
+        salon : Optional[SalonFama]
+            Si se indica, cada hormiga evaluada se ofrece a este salón de la fama.
+        """
+        super().__init__(daemon=True)
+        self.algoritmo_genetico = algoritmo_genetico
+        self.laberinto = laberinto
+        self.vista = laberinto.vista()
+        self.pos_meta = pos_meta
+        self.campo = CampoDistancias(laberinto)  # Se actualiza solo si la interfaz edita el laberinto
+        self.tiempo_limite = tiempo_limite
+        self.cerrojo = cerrojo
+        self.cola = queue.Queue(maxsize=tamaño_cola)
+        self.salon = salon
+
+        self.cantidad_por_tic = 1
+        self.por_generaciones = False
+        self.solo_mejores = False
+        self.presupuesto_tic = 0.016  # Segundos máximos de simulación por bloque
+        self.demora_tiempo_real = 0.05  # Pausa entre pasos cuando se simula un paso por tic
+
+        self._activo = threading.Event()
+        self._activo.set()
+        self._cancelado = threading.Event()
+        self._inicio_pausa: Optional[float] = None
+
+    @property
+    def pausado(self) -> bool:
+        return not self._activo.is_set()
+
+    def pausar(self):
+        if not self.pausado:
+            self._inicio_pausa = time.monotonic()
+            self._activo.clear()
+
+    def reanudar(self):
+        if self.pausado:
+            # El tiempo en pausa no cuenta para el tiempo límite ni para las estadísticas
+            pausa = time.monotonic() - self._inicio_pausa
+            self.algoritmo_genetico.tiempo_inicio += timedelta(seconds=pausa)
+            self._activo.set()
+
+    def cancelar(self):
+        self._cancelado.set()
+        self._activo.set()  # Despierta al hilo si estaba en pausa
+
+    def run(self):
+        self.vista.reiniciar()
+        while not self._cancelado.is_set():
+            self._activo.wait()
+            if self._cancelado.is_set():
+                break
+
+            with self.cerrojo:
+                instantanea = self._simular_bloque()
+            self._publicar(instantanea)
+            if instantanea.evento != PASO:
+                return
+
+            if self.cantidad_por_tic == 1 and not self.por_generaciones:
+                time.sleep(self.demora_tiempo_real)  # Conserva la animación paso a paso
+
+        ag = self.algoritmo_genetico
+        ag.sumidero.vaciar()
+        self._publicar(Instantanea(CANCELADO, ag.generacion, ag.hormiga_actual,
+                                   frozenset(self.vista.consumidos)), bloquear=True)
+
+    def _simular_bloque(self) -> Instantanea:
+        """
+        Simula la cantidad de pasos o generaciones configurada, sin pasar del
+        presupuesto de tiempo, y devuelve la instantánea que debe mostrarse.
+        """
+        ag = self.algoritmo_genetico
+        cantidad = max(1, self.cantidad_por_tic)
+        por_generaciones = self.por_generaciones
+        solo_mejores = self.solo_mejores
+        distancias = self.campo.matriz()  # El laberinto no cambia durante el bloque
+        inicio = time.perf_counter()
+        mostrada = None
+        hechos = 0
+
+        while hechos < cantidad:
+            hormiga = ag.hormiga_actual
+            if (datetime.now() - ag.tiempo_inicio).total_seconds() > self.tiempo_limite:
+                ag.sumidero.vaciar()  # Escribe los registros pendientes
+                return self._instantanea(LIMITE, hormiga)
+
+            if hormiga.mover(self.vista):  # Mueve la hormiga en el laberinto
+                if hormiga.llego_meta:
+                    hormiga.calcular_aptitud(self.pos_meta, distancias)  # Calcula la aptitud si llegó a la meta
+                    self._ofrecer(hormiga)
+                    ag.evolucionar()  # Evoluciona a la siguiente hormiga
+                    ag.sumidero.vaciar()  # Escribe los registros pendientes
+                    return self._instantanea(META, hormiga)
+                hormiga.calcular_aptitud(self.pos_meta, distancias)  # Calcula la aptitud aunque no haya llegado a la meta
+            else:
+                # Murió o agotó sus pasos: también evoluciona al terminar los pasos,
+                # en lugar de quedarse detenida en la última celda
+                mejor_anterior = ag.mejor_hormiga.aptitud if ag.mejor_hormiga else None
+                self._ofrecer(hormiga)
+                ag.evolucionar()
+                if solo_mejores and (mejor_anterior is None or
+                                     ag.mejor_hormiga.aptitud > mejor_anterior):
+                    mostrada = self._instantanea(PASO, hormiga)  # Estado final de la nueva mejor
+                self.vista.reiniciar()  # La nueva hormiga encuentra el laberinto intacto
+                if por_generaciones:
+                    hechos += 1
+
+            if not por_generaciones:
+                hechos += 1
+            if time.perf_counter() - inicio > self.presupuesto_tic:
+                break
+
+        if mostrada is not None:
+            return mostrada
+        return self._instantanea(PASO, ag.hormiga_actual, dibujar=not solo_mejores)
+
+    def _ofrecer(self, hormiga: HormigaGenetica):
+        if self.salon is not None:
+            # Se llama con el cerrojo tomado: el recorrido se registra sobre el laberinto actual
+            self.salon.ofrecer(hormiga.genes, hormiga.aptitud, self.algoritmo_genetico.generacion)
+
+    def _instantanea(self, evento: str, hormiga: HormigaGenetica,
+                     dibujar: bool = True) -> Instantanea:
+        return Instantanea(evento, self.algoritmo_genetico.generacion, hormiga,
+                           frozenset(self.vista.consumidos), dibujar)
+
+    def _publicar(self, instantanea: Instantanea, bloquear: bool = False):
+        """
+        Envía una instantánea a la interfaz. Las intermedias nunca detienen al
+        hilo: si la cola está llena se descarta la más antigua, porque la
+        interfaz solo dibuja la última. Las finales se entregan siempre.
+        """
+        if bloquear or instantanea.evento != PASO:
+            self.cola.put(instantanea)
+            return
+        while True:
+            try:
+                self.cola.put_nowait(instantanea)
+                return
+            except queue.Full:
+                try:
+                    self.cola.get_nowait()
+                except queue.Empty:
+                    pass
@@ -0,0 +1,174 @@
+# Ventana del salón de la fama.
+"""Muestra las hormigas guardadas en un SalonFama y repite el recorrido de la
+elegida, animado o paso a paso con la barra, a partir de la trayectoria
+guardada: no se vuelve a simular nada. Opcionalmente pinta debajo el mapa de
+calor de todas las trayectorias guardadas."""
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+from PIL import Image, ImageTk
+from Laberinto import Laberinto
+from SalonFama import SalonFama, mapa_calor
+
+# Color RGB de cada código de celda (VACIO, AZUCAR, VINO, VENENO, META, ROCA)
+COLORES = np.array([(250, 250, 245), (240, 200, 40), (140, 60, 150),
+                    (60, 160, 60), (220, 40, 40), (90, 90, 90)], dtype=np.float64)
+COLOR_CALOR = np.array([255, 80, 0], dtype=np.float64)
+LADO_MAXIMO = 480  # Lado máximo en píxeles de la imagen del laberinto
+
+
+class VentanaSalon:
+    """
+    Ventana con la lista de hormigas del salón y la repetición de sus recorridos.
+
+    La lista es una copia del salón al abrir la ventana (o al pulsar
+    "Actualizar"), así que la evolución puede seguir mientras tanto.
+    """
+
+    def __init__(self, salon: SalonFama, laberinto: Laberinto):
+        self.salon = salon
+        self.laberinto = laberinto
+        self.entradas = list(salon.entradas)
+        self.posiciones = None  # Posiciones de la trayectoria elegida
+        self.paso = 0
+        self.reproduciendo = False
+        self.intervalo = 60  # Milisegundos entre pasos de la animación
+        self.lado = max(1, LADO_MAXIMO // max(laberinto.filas, laberinto.columnas))
+
+        self.ventana = tk.Toplevel()
+        self.ventana.title("Salón de la fama")
+
+        frame_lista = ttk.Frame(self.ventana)
+        frame_lista.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
+        self.lista = tk.Listbox(frame_lista, width=60, height=20, exportselection=False)
+        self.lista.pack(fill=tk.Y, expand=True)
+        self.lista.bind('<<ListboxSelect>>', self.seleccionar)
+        ttk.Button(frame_lista, text="Actualizar", command=self.actualizar).pack(pady=2)
+
+        frame_vista = ttk.Frame(self.ventana)
+        frame_vista.pack(side=tk.LEFT, padx=5, pady=5)
+        self.canvas = tk.Canvas(frame_vista, width=laberinto.columnas * self.lado,
+                                height=laberinto.filas * self.lado, highlightthickness=0)
+        self.canvas.pack()
+        self.item_fondo = self.canvas.create_image(0, 0, anchor='nw')
+        self.item_camino = self.canvas.create_line(0, 0, 0, 0, fill='#1f5fd0',
+                                                   width=max(1, self.lado // 4), state='hidden')
+        self.item_hormiga = self.canvas.create_oval(0, 0, 0, 0, fill='black', state='hidden')
+
+        frame_controles = ttk.Frame(frame_vista)
+        frame_controles.pack(fill=tk.X, pady=5)
+        self.boton_reproducir = ttk.Button(frame_controles, text="Reproducir",
+                                           command=self.alternar_reproduccion)
+        self.boton_reproducir.pack(side=tk.LEFT)
+        self.mostrar_calor = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame_controles, text="Mapa de calor", variable=self.mostrar_calor,
+                        command=self.dibujar_fondo).pack(side=tk.LEFT, padx=5)
+        self.barra = tk.Scale(frame_vista, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False,
+                              command=self.ir_a)
+        self.barra.pack(fill=tk.X)
+        self.etiqueta = ttk.Label(frame_vista, text="Elige una hormiga de la lista")
+        self.etiqueta.pack(pady=2)
+
+        self.actualizar()
+
+    def actualizar(self):
+        """
+        Vuelve a copiar las entradas del salón y redibuja la lista y el fondo.
+        """
+        self.entradas = list(self.salon.entradas)
+        self.lista.delete(0, tk.END)
+        for i, entrada in enumerate(self.entradas, 1):
+            self.lista.insert(tk.END, f"{i}. {entrada.descripcion()}")
+        self.detener()
+        self.posiciones = None
+        self.canvas.itemconfigure(self.item_camino, state='hidden')
+        self.canvas.itemconfigure(self.item_hormiga, state='hidden')
+        self.dibujar_fondo()
+
+    def dibujar_fondo(self):
+        """
+        Dibuja el laberinto como una imagen, con el mapa de calor de todas las
+        trayectorias encima si está activado.
+        """
+        colores = COLORES[self.laberinto.celdas]
+        if self.mostrar_calor.get() and self.entradas:
+            visitas = mapa_calor([e.trayectoria for e in self.entradas], self.laberinto.celdas.shape)
+            # Escala logarítmica: las pocas celdas muy visitadas no opacan al resto
+            intensidad = np.log1p(visitas) / np.log1p(visitas.max())
+            colores = colores * (1 - 0.75 * intensidad[..., None]) + COLOR_CALOR * 0.75 * intensidad[..., None]
+        imagen = Image.fromarray(colores.astype(np.uint8), 'RGB')
+        imagen = imagen.resize((self.laberinto.columnas * self.lado, self.laberinto.filas * self.lado),
+                               Image.NEAREST)
+        self.imagen_fondo = ImageTk.PhotoImage(imagen)  # Referencia para que no se libere
+        self.canvas.itemconfigure(self.item_fondo, image=self.imagen_fondo)
+
+    def seleccionar(self, event=None):
+        seleccion = self.lista.curselection()
+        if not seleccion:
+            return
+        entrada = self.entradas[seleccion[0]]
+        self.posiciones = entrada.trayectoria.posiciones()
+        self.detener()
+        self.barra.config(to=len(self.posiciones) - 1)
+        self.barra.set(0)
+        self.ir_a(0)
+
+    def ir_a(self, valor):
+        """
+        Muestra el recorrido hasta el movimiento `valor` (barra o animación).
+        """
+        if self.posiciones is None:
+            return
+        self.paso = min(int(float(valor)), len(self.posiciones) - 1)
+        # Centro de cada celda en píxeles; el canvas usa (columna, fila)
+        centros = (self.posiciones[:self.paso + 1, ::-1] * self.lado + self.lado / 2).ravel().tolist()
+        if len(centros) < 4:
+            centros = centros * 2  # Una línea necesita al menos dos puntos
+        self.canvas.coords(self.item_camino, *centros)
+        x, y = centros[-2], centros[-1]
+        radio = max(2, self.lado * 0.35)
+        self.canvas.coords(self.item_hormiga, x - radio, y - radio, x + radio, y + radio)
+        self.canvas.itemconfigure(self.item_camino, state='normal')
+        self.canvas.itemconfigure(self.item_hormiga, state='normal')
+        self.canvas.tag_raise(self.item_hormiga)
+        fila, columna = self.posiciones[self.paso].tolist()
+        self.etiqueta.config(text=f"Movimiento {self.paso} de {len(self.posiciones) - 1} | "
+                                  f"Celda ({fila}, {columna})")
+
+    def alternar_reproduccion(self):
+        if self.reproduciendo:
+            self.detener()
+            return
+        if self.posiciones is None:
+            return
+        if self.paso >= len(self.posiciones) - 1:
+            self.barra.set(0)  # Al terminar, "Reproducir" vuelve a empezar
+            self.ir_a(0)
+        self.reproduciendo = True
+        self.boton_reproducir.config(text="Pausar")
+        self.ventana.after(self.intervalo, self.avanzar)
+
+    def detener(self):
+        self.reproduciendo = False
+        self.boton_reproducir.config(text="Reproducir")
+
+    def avanzar(self):
+        if not self.reproduciendo or self.posiciones is None:
+            return
+        if self.paso >= len(self.posiciones) - 1:
+            self.detener()
+            return
+        self.barra.set(self.paso + 1)
+        self.ir_a(self.paso + 1)
+        self.ventana.after(self.intervalo, self.avanzar)
+
+
+def mostrar_salon(salon: SalonFama, laberinto: Laberinto):
+    """
+    Abre la ventana del salón de la fama.
+
+    :param salon: Salón con las hormigas guardadas.
+    :param laberinto: Laberinto sobre el que se registraron los recorridos.
+    :return: Instancia de VentanaSalon.
+    """
+    return VentanaSalon(salon, laberinto)
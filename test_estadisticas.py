@@ -0,0 +1,52 @@
+# Pruebas del lector incremental de estadísticas.
+
+import pytest
+from Registro import RegistroGeneracion
+from Sumideros import crear_sumidero
+from estadisticas import obtener_lector
+
+
+def simular(ruta: str, generaciones: int, puntos: int):
+    """
+    Escribe con un sumidero nuevo una simulación de `generaciones` registros,
+    todos con los mismos `puntos`.
+    """
+    sumidero = crear_sumidero(ruta)
+    sumidero.iniciar()
+    for generacion in range(1, generaciones + 1):
+        sumidero.escribir(RegistroGeneracion(generacion, 10, puntos, 0, False, 0.5))
+    sumidero.cerrar()
+
+
+@pytest.mark.parametrize('extension', ['.txt', '.npy', '.db'])
+def test_segunda_simulacion_mas_larga_se_lee_desde_el_principio(tmp_path, extension):
+    ruta = str(tmp_path / f"estadisticas{extension}")
+    simular(ruta, 5, 111)
+    lector = obtener_lector(ruta)
+    lector.actualizar()
+    assert lector.columna('puntos').tolist() == [111] * 5
+
+    simular(ruta, 20, 222)
+    lector = obtener_lector(ruta)
+    lector.actualizar()
+    assert lector.columna('puntos').tolist() == [222] * 20
+    assert lector.columna('generacion').tolist() == list(range(1, 21))
+
+
+@pytest.mark.parametrize('extension', ['.txt', '.npy', '.db'])
+def test_lectura_incremental_agrega_solo_lo_nuevo(tmp_path, extension):
+    ruta = str(tmp_path / f"estadisticas{extension}")
+    sumidero = crear_sumidero(ruta)
+    sumidero.iniciar()
+    for generacion in range(1, 4):
+        sumidero.escribir(RegistroGeneracion(generacion, 10, generacion, 0, False, 0.5))
+    sumidero.vaciar()
+    lector = obtener_lector(ruta)
+    assert lector.actualizar() == 3
+
+    for generacion in range(4, 6):
+        sumidero.escribir(RegistroGeneracion(generacion, 10, generacion, 0, generacion == 5, 0.5))
+    sumidero.cerrar()
+    assert lector.actualizar() == 2
+    assert lector.columna('puntos').tolist() == [1, 2, 3, 4, 5]
+    assert lector.columna('llego_meta').tolist() == [False] * 4 + [True]
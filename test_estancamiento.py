@@ -0,0 +1,64 @@
+# Pruebas de la detección de ciclos: terminar antes no debe cambiar la aptitud.
+
+import numpy as np
+import pytest
+from Distancias import CampoDistancias
+from Estancamiento import DetectorEstancamiento
+from Hormiga import HormigaGenetica
+from Incremental import EvaluadorIncremental
+from Laberinto import Laberinto
+from Motor import evaluar_hormiga
+from Poblacion import SimuladorPoblacion
+
+LARGO_GENES = 20
+PASOS_MAXIMOS = 1000  # Varias vueltas de los genes, para que haya ciclos
+
+
+def crear_hormiga(genes: np.ndarray) -> HormigaGenetica:
+    hormiga = HormigaGenetica(0, 0)
+    hormiga.genes = genes
+    hormiga.pasos_maximos = PASOS_MAXIMOS
+    return hormiga
+
+
+def evaluar_completa(genes: np.ndarray, laberinto: Laberinto, distancias: np.ndarray) -> HormigaGenetica:
+    """
+    Simula paso a paso hasta el límite, sin ningún detector.
+    """
+    hormiga = crear_hormiga(genes)
+    evaluar_hormiga(hormiga, laberinto.vista(), laberinto.buscar('M'), None, distancias)
+    return hormiga
+
+
+@pytest.mark.parametrize('semilla', range(5))
+def test_terminar_antes_no_cambia_la_aptitud(semilla):
+    laberinto = Laberinto.aleatorio(12, densidad=0.25, semilla=semilla)
+    pos_meta = laberinto.buscar('M')
+    distancias = CampoDistancias(laberinto).matriz()
+    genes = np.random.default_rng(semilla).integers(0, 4, size=(200, LARGO_GENES), dtype=np.uint8)
+    completas = [evaluar_completa(g, laberinto, distancias) for g in genes]
+    esperadas = [h.aptitud for h in completas]
+
+    detector = DetectorEstancamiento()
+    vista = laberinto.vista()
+    con_detector = []
+    for g in genes:
+        hormiga = crear_hormiga(g)
+        con_detector.append(evaluar_hormiga(hormiga, vista, pos_meta, detector, distancias))
+        assert hormiga.pasos == completas[len(con_detector) - 1].pasos
+    assert con_detector == esperadas
+    assert detector.pasos_evitados > 0
+
+    simulador = SimuladorPoblacion(laberinto, pasos_maximos=PASOS_MAXIMOS, distancias=distancias)
+    resultado = simulador.simular(genes, pos_meta)
+    assert resultado.aptitud.tolist() == esperadas
+    assert resultado.pasos.tolist() == [h.pasos for h in completas]
+    assert simulador.pasos_evitados > 0
+
+    evaluador = EvaluadorIncremental(laberinto, pos_meta, distancias=distancias)
+    incrementales = []
+    for g in genes:
+        hormiga = crear_hormiga(g)
+        incrementales.append(evaluador.evaluar(hormiga))
+        evaluador.adoptar()
+    assert incrementales == esperadas